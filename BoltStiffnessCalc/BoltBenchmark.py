@@ -0,0 +1,230 @@
+import argparse
+import io
+import json
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from BoltEngine import compute_stiffness_batch, clamped_stiffness, preload_force, joint_diagram, load_bolt_catalog
+from Instrumentation import profile_call, save_profile
+from ParametricSweep import run_sweep, load_run
+from ResultStore import ParametricResults, input_columns
+
+# Hesap çekirdeği ve parametrik hat için başsız (arayüzsüz) performans ölçümleri.
+#   python BoltBenchmark.py             -> ölçer ve kayıtlı taban değerlerle karşılaştırır
+#   python BoltBenchmark.py --save      -> ölçümleri taban değer olarak kaydeder
+#   python BoltBenchmark.py --full      -> 10^7 kombinasyonluk taramayı da çalıştırır
+#   python BoltBenchmark.py -k sweep    -> yalnızca adında "sweep" geçen ölçümler
+#   python BoltBenchmark.py -k sweep_1e6 --profile profiles
+#                                       -> ek bir çalıştırmayı cProfile ile profiller (profiles/sweep_1e6.prof)
+# Bir ölçüm taban değerin --threshold katından yavaşsa çıkış kodu 1 olur.
+
+baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+default_threshold = 1.5
+default_repeat = 3
+profile_top = 10
+
+bench_material = {'E': 200000, 'yield_strength': 800, 'ultimate_strength': 1000, 'endurance_limit': None,
+                  'thermal_expansion': 11.5, 'modulus_temp_coeff': 4.0}
+bench_parts = [
+    {'type': 'Plate', 'thickness': 10.0, 'material': 'Steel', 'E': 200000, 'area': 100.0,
+     'thermal_expansion': 11.5, 'modulus_temp_coeff': 4.0},
+    {'type': 'Washer', 'thickness': 5.0, 'material': 'Aluminum', 'E': 70000, 'area': 80.0,
+     'thermal_expansion': 23.4, 'modulus_temp_coeff': 6.0},
+]
+bench_sizes = ["M6", "M8", "M10", "M12", "M14", "M16", "M20", "M24", "M30", "M36"]
+
+catalog = load_bolt_catalog()
+
+def sweep_axes(combinations):
+    # Cıvata boyutu, ön yük ve çekme eksenleri sabit; kalan çarpan gövde/diş eksenlerine bölünür
+    rest = max(1, math.ceil(combinations / (len(bench_sizes) * 5 * 4)))
+    shank = max(1, math.ceil(math.sqrt(rest)))
+    thread = max(1, math.ceil(rest / shank))
+    return {
+        "bolt_size": np.array(bench_sizes),
+        "shank_length": np.linspace(10, 200, shank),
+        "thread_length": np.linspace(0, 50, thread),
+        "preload_percent": np.linspace(50, 90, 5),
+        "tensile_force": np.linspace(1000, 20000, 4),
+    }
+
+def sweep(conn, combinations, results_root=None):
+    store, _ = run_sweep(conn, catalog, sweep_axes(combinations), bench_parts, "Steel", bench_material,
+                         5000.0, "Yield", "Thread", results_root)
+    return store
+
+# Her ölçüm (hazırlık) -> (ölçülecek fonksiyon, işlenen öğe sayısı) döndürür; hazırlık süresi sayılmaz
+def bench_single_call(workdir):
+    (A_shank,), (A_thread,) = catalog.areas(["M10"])
+    calls = 2000
+
+    def run():
+        for _ in range(calls):
+            compute_stiffness_batch(200000, 800, 1000, A_shank, A_thread, 30.0, 10.0, 70.0, 10000.0, 5000.0,
+                                    clamped_stiffness(bench_parts, 10.0, "Prismatic"))
+    return run, calls
+
+def make_sweep_bench(combinations, sqlite_rows=False):
+    def bench(workdir):
+        n = int(np.prod([len(v) for v in sweep_axes(combinations).values()]))
+
+        def run():
+            conn = sqlite3.connect(os.path.join(workdir, "sweep.db"))
+            try:
+                sweep(conn, combinations, None if sqlite_rows else os.path.join(workdir, "runs"))
+            finally:
+                conn.close()
+        return run, n
+    return bench
+
+def make_load_bench(combinations, to_disk):
+    def bench(workdir):
+        conn = sqlite3.connect(os.path.join(workdir, "load.db"))
+        try:
+            store = sweep(conn, combinations, os.path.join(workdir, "load_runs") if to_disk else None)
+        finally:
+            conn.close()
+
+        def run():
+            conn = sqlite3.connect(os.path.join(workdir, "load.db"))
+            try:
+                loaded = load_run(conn, categorical_order=catalog.names)
+                # Disk üzerindeki depolar eşlenir; veriye gerçekten dokunmak için bir sütun taranır
+                float(np.sum(loaded.column("safety_factor")))
+            finally:
+                conn.close()
+        return run, len(store)
+    return bench
+
+def sweep_columns(combinations):
+    conn = sqlite3.connect(":memory:")
+    try:
+        store = sweep(conn, combinations)
+    finally:
+        conn.close()
+    inputs = {name: store.column(name) for name in input_columns}
+    return inputs, {name: store.column(name).copy() for name in store.columns}
+
+def bench_export_csv(workdir):
+    store = ParametricResults.from_columns(*sweep_columns(100_000), categorical_order=catalog.names)
+    path = os.path.join(workdir, "export.csv")
+    return lambda: store.to_csv(path), len(store)
+
+def bench_plot_surface(workdir):
+    conn = sqlite3.connect(":memory:")
+    try:
+        store = sweep(conn, 1_000_000)
+    finally:
+        conn.close()
+
+    def run():
+        grid, _ = store.aggregate(["shank_length", "thread_length"], "safety_factor", "mean")
+        fig, ax = plt.subplots(figsize=(6, 4))
+        x, y = store.axes["shank_length"], store.axes["thread_length"]
+        ax.contourf(x, y, grid.T, levels=20)
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+    return run, len(store)
+
+def bench_plot_joint_diagrams(workdir):
+    (A_shank,), (A_thread,) = catalog.areas(["M10"])
+    designs = 20
+    k_bolt = np.linspace(2e5, 5e5, designs)
+    F_preload = preload_force(np.linspace(50, 90, designs), 800, A_thread)
+
+    def run():
+        diagram = joint_diagram(k_bolt, 7e5, F_preload, 800 * A_thread, 10000.0, steps=60)
+        fig, ax = plt.subplots(figsize=(6, 4))
+        for i in range(designs):
+            ax.plot(diagram["bolt_elongation"][i], diagram["bolt_force"][i], lw=0.8)
+            ax.plot(diagram["clamped_position"][i], diagram["clamped_force"][i], lw=0.8)
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+    return run, designs
+
+benchmarks = {
+    "single_call": bench_single_call,
+    "sweep_1e3": make_sweep_bench(1_000),
+    "sweep_1e5": make_sweep_bench(100_000),
+    "sweep_1e6": make_sweep_bench(1_000_000),
+    "sweep_1e7": make_sweep_bench(10_000_000),
+    "sqlite_write_1e5": make_sweep_bench(100_000, sqlite_rows=True),
+    "load_sqlite_1e5": make_load_bench(100_000, to_disk=False),
+    "load_disk_1e6": make_load_bench(1_000_000, to_disk=True),
+    "export_csv_1e5": bench_export_csv,
+    "plot_surface_1e6": bench_plot_surface,
+    "plot_joint_diagrams": bench_plot_joint_diagrams,
+}
+full_only = {"sweep_1e7"}
+
+def measure(name, repeat, profile_dir=None):
+    # Ölçüm başına bir geçici klasör kullanılır; en iyi süre raporlanır (gürültüye en az duyarlı).
+    # Profil istenirse ölçülen tekrarlardan sonra ayrı bir çalıştırma profillenir, süreler etkilenmez.
+    times, items, profile = [], 0, None
+    with tempfile.TemporaryDirectory() as workdir:
+        run, items = benchmarks[name](workdir)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        if profile_dir:
+            _, profiler = profile_call(run)
+            profile = save_profile(profiler, os.path.join(profile_dir, f"{name}.prof"), limit=profile_top)
+    return {"seconds": min(times), "median": float(np.median(times)), "items": items}, profile
+
+def load_baseline(path=baseline_path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cıvata sertliği hesaplayıcısı performans ölçümleri")
+    parser.add_argument("-k", dest="pattern", default="", help="yalnızca adında bu metin geçen ölçümler")
+    parser.add_argument("--full", action="store_true", help="10^7 kombinasyonluk taramayı da çalıştır")
+    parser.add_argument("--save", action="store_true", help="sonuçları taban değer olarak kaydet")
+    parser.add_argument("--repeat", type=int, default=default_repeat)
+    parser.add_argument("--threshold", type=float, default=default_threshold, help="izin verilen yavaşlama katı")
+    parser.add_argument("--baseline", default=baseline_path)
+    parser.add_argument("--profile", metavar="KLASÖR", help="her ölçüm için .prof dosyası yaz ve en pahalı fonksiyonları göster")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    names = [name for name in benchmarks if args.pattern in name and (args.full or name not in full_only)]
+    results, regressions = {}, []
+    print(f"{'ölçüm':<22}{'süre (s)':>12}{'öğe/s':>14}{'taban (s)':>12}{'oran':>8}")
+    for name in names:
+        result, profile = measure(name, args.repeat, args.profile)
+        results[name] = result
+        reference = baseline.get(name, {}).get("seconds")
+        ratio = result["seconds"] / reference if reference else None
+        status = ""
+        if ratio is not None and ratio > args.threshold:
+            regressions.append(name)
+            status = "  YAVAŞLAMA"
+        print(f"{name:<22}{result['seconds']:>12.4f}{result['items'] / result['seconds']:>14.3g}"
+              f"{reference if reference else float('nan'):>12.4f}{ratio if ratio else float('nan'):>8.2f}{status}")
+        for row in profile or []:
+            print(f"    {row['cumtime']:>9.4f} s  {row['calls']:>8}  {row['function']}")
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Taban değerler kaydedildi: {args.baseline}")
+    if regressions:
+        print(f"Taban değerin {args.threshold}x üzerinde: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
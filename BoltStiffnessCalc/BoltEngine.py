@@ -0,0 +1,608 @@
+import csv
+import functools
+import os
+import re
+
+import numpy as np
+
+# Cıvata bağlantısı hesap çekirdeği.
+# Tüm fonksiyonlar NumPy yayınlama (broadcast) kurallarıyla çalışır: tekil hesaplama
+# skaler değerlerle, parametrik tarama ise aynı fonksiyonlara dizi vererek tek geçişte
+# yapılır. Bu modül Tkinter'a bağımlı değildir.
+
+# Parametrik sonuç sütunları (sonuç veritabanındaki sütun adlarıyla aynı)
+output_columns = [
+    "stiffness", "clamped_stiffness", "bolt_force", "bolt_deflection",
+    "clamped_deflection", "shear_stress", "safety_factor",
+    "alternating_stress", "mean_stress", "fatigue_safety_factor",
+    "min_preload", "max_preload",
+]
+
+# Cıvata kataloğu (ISO metrik kaba/ince, UNC/UNF). Alanlar dosyada önceden hesaplıdır:
+# A_shank = π·d²/4, A_thread = gerilme kesiti (ISO: π/4·(d - 0.9382·P)², UN: π/4·(d - 0.9743·P)²)
+catalog_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bolt_catalog.csv")
+metric_size_pattern = re.compile(r"^M(\d+(?:\.\d+)?)(?:x(\d+(?:\.\d+)?))?$")
+
+class BoltCatalog:
+    def __init__(self, names, standards, d, pitch, A_shank, A_thread):
+        self.names = list(names)
+        self.standards = np.asarray(standards)
+        self.d = np.asarray(d, dtype=float)
+        self.pitch = np.asarray(pitch, dtype=float)
+        self.A_shank = np.asarray(A_shank, dtype=float)
+        self.A_thread = np.asarray(A_thread, dtype=float)
+        self.code_of = {name: code for code, name in enumerate(self.names)}
+        coarse = np.flatnonzero(self.standards == "ISO-C")
+        self._coarse_d = self.d[coarse][np.argsort(self.d[coarse])]
+        self._coarse_pitch = self.pitch[coarse][np.argsort(self.d[coarse])]
+
+    def __contains__(self, name):
+        return name in self.code_of or self.parse_metric(name) is not None
+
+    def parse_metric(self, name):
+        # Katalogda olmayan "M10.5" veya "M10.5x1.25" gibi sürekli çaplar
+        match = metric_size_pattern.match(name or "")
+        if not match:
+            return None
+        d = float(match.group(1))
+        pitch = float(match.group(2)) if match.group(2) else float(np.interp(d, self._coarse_d, self._coarse_pitch))
+        if d <= 0 or pitch <= 0 or d - 0.938194 * pitch <= 0:
+            return None
+        return d, pitch
+
+    def codes(self, names):
+        # Katalog dışı (sürekli çap) boyutlar için -1
+        return np.array([self.code_of.get(name, -1) for name in names], dtype=np.int32)
+
+    def nominal_diameter(self, name):
+        code = self.code_of.get(name)
+        return float(self.d[code]) if code is not None else self.parse_metric(name)[0]
+
+    def areas(self, names):
+        # Katalog boyutları kodla dizilerden indekslenir; diğerleri çap/adımdan hesaplanır
+        codes = self.codes(names)
+        A_shank = self.A_shank[np.maximum(codes, 0)]
+        A_thread = self.A_thread[np.maximum(codes, 0)]
+        for i in np.flatnonzero(codes < 0):
+            d, pitch = self.parse_metric(names[i])
+            A_shank[i], A_thread[i] = metric_areas(d, pitch)
+        return A_shank, A_thread
+
+    def sort_key(self, name):
+        code = self.code_of.get(name)
+        return (0, code, 0.0) if code is not None else (1, 0, self.nominal_diameter(name))
+
+def metric_areas(d, pitch):
+    d, pitch = np.asarray(d, dtype=float), np.asarray(pitch, dtype=float)
+    return np.pi * d**2 / 4, np.pi / 4 * (d - 0.938194 * pitch)**2
+
+@functools.lru_cache(maxsize=None)
+def load_bolt_catalog(path=catalog_path):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return BoltCatalog([r["name"] for r in rows], [r["standard"] for r in rows],
+                       [r["d"] for r in rows], [r["pitch"] for r in rows],
+                       [r["A_shank"] for r in rows], [r["A_thread"] for r in rows])
+
+def bolt_stiffness(E_bolt, A_shank, A_thread, L_shank, L_thread):
+    # Gövde ve dişli kısım seri yay; dişli uzunluğu 0 ise yalnızca gövde sertliği
+    L_thread = np.asarray(L_thread, dtype=float)
+    k_shank = (E_bolt * A_shank) / L_shank
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k_thread = (E_bolt * A_thread) / L_thread
+        k_series = 1 / (1/k_shank + 1/k_thread)
+    return np.where(L_thread > 0, k_series, k_shank)
+
+# Kavrama modelleri: "Prismatic" her parçayı E·A/t yayı olarak alır (kullanıcı alanı ile);
+# "Cone" VDI 2230 / Shigley basınç konisi modelidir. Koni başın (ve somunun) d_w = 1.5·d
+# oturma yüzeyinden α = 30° yarım açıyla açılır ve kavrama boyunun ortasında birleşir.
+# Pul ve silindir (burç) parçalarında gerilme düzgün kabul edilip prizmatik model kullanılır.
+clamped_models = ["Prismatic", "Cone"]
+prismatic_part_types = ("Washer", "Cylinder")
+cone_half_angle = 30.0
+washer_face_ratio = 1.5
+
+@functools.lru_cache(maxsize=4096)
+def frustum_geometry_factor(d, D, t, alpha=cone_half_angle):
+    # Kesik koni sertliği k = E·g; g yalnızca geometriye bağlıdır ve (d, D, t, α) başına bir kez hesaplanır
+    tan_alpha = np.tan(np.radians(alpha))
+    ratio = ((2 * t * tan_alpha + D - d) * (D + d)) / ((2 * t * tan_alpha + D + d) * (D - d))
+    return float(np.pi * d * tan_alpha / np.log(ratio))
+
+def cone_segments(parts):
+    # Parçaları kavrama ortasında bölerek (parça no, en yakın yüzeye uzaklık, kalınlık) listesi üretir
+    grip = sum(part['thickness'] for part in parts)
+    half = grip / 2
+    segments, z = [], 0.0
+    for i, part in enumerate(parts):
+        top, bottom = z, z + part['thickness']
+        if top < half:
+            segments.append((i, top, min(bottom, half) - top))
+        if bottom > half:
+            start = max(top, half)
+            segments.append((i, grip - bottom, bottom - start))
+        z = bottom
+    return segments
+
+def cone_part_compliances(parts, d, alpha=cone_half_angle):
+    # Tek bir cıvata çapı için parça başına esneklik (1/k); koni dilimleri ve prizmatik pul/burçlar
+    tan_alpha = np.tan(np.radians(alpha))
+    D_w = washer_face_ratio * d
+    compliance = np.zeros(len(parts))
+    for i, part in enumerate(parts):
+        if part.get('type') in prismatic_part_types:
+            compliance[i] = part['thickness'] / (part['E'] * part['area'])
+    for i, distance, thickness in cone_segments(parts):
+        if parts[i].get('type') in prismatic_part_types or thickness <= 0:
+            continue
+        compliance[i] += 1 / (parts[i]['E'] * frustum_geometry_factor(float(d), float(D_w + 2 * distance * tan_alpha), float(thickness), alpha))
+    return compliance
+
+def cone_clamped_stiffness(parts, d, alpha=cone_half_angle):
+    return 1 / cone_part_compliances(parts, d, alpha).sum()
+
+def part_compliances(parts, d=None, model="Prismatic"):
+    # (parça sayısı,) + d şeklinde esneklik dizisi; sıcaklıkla değişen E için parça parça ölçeklenir
+    if model == "Cone":
+        diameters, inverse = np.unique(np.asarray(d, dtype=float), return_inverse=True)
+        compliance = np.stack([cone_part_compliances(parts, diameter) for diameter in diameters], axis=-1)
+        return compliance[:, inverse].reshape((len(parts),) + np.shape(d))
+    compliance = np.array([part['thickness'] / (part['E'] * part['area']) for part in parts])
+    return compliance.reshape((len(parts),) + (1,) * np.ndim(d)) * np.ones(np.shape(d))
+
+def clamped_stiffness(parts, d=None, model="Prismatic"):
+    # parts: [{'type': ..., 'E': ..., 'area': ..., 'thickness': ...}, ...] sırası korunarak seri bağlanır.
+    # Koni modelinde d (skaler veya dizi) gereklidir; farklı çaplar bir kez hesaplanıp dizilere yayılır.
+    if model == "Cone":
+        diameters, inverse = np.unique(np.asarray(d, dtype=float), return_inverse=True)
+        k = np.array([cone_clamped_stiffness(parts, diameter) for diameter in diameters])
+        return k[inverse].reshape(np.shape(d)) if np.ndim(d) else float(k[0])
+    k_clamped_total = 0
+    for part in parts:
+        k_part = (part['E'] * part['area']) / part['thickness']
+        k_clamped_total = k_part if k_clamped_total == 0 else 1 / (1/k_clamped_total + 1/k_part)
+    return k_clamped_total
+
+def preload_force(preload_percent, yield_strength, A_thread):
+    return (preload_percent / 100) * yield_strength * A_thread
+
+# Yorulma: dış yük R·P_max ile P_max arasında değişir, ön yük sabittir (Shigley 8-11).
+# Yük doğrusu (σ_i, 0) noktasından (σ_m, σ_a) noktasına uzanır; kriter eğrisiyle kesişimindeki
+# S_a bulunur ve n_f = S_a / σ_a döner. Malzemede yorulma dayanımı yoksa haddelenmiş diş için
+# tam düzeltilmiş S_e ≈ 0.156·S_ut kullanılır (Tablo 8-17: 8.8, 10.9 ve 12.9 sınıfları).
+fatigue_criteria = ["Goodman", "Gerber", "ASME"]
+endurance_ratio = 0.156
+
+def endurance_limit(ultimate_strength, endurance=None):
+    return endurance if endurance else endurance_ratio * ultimate_strength
+
+def fatigue_stresses(F_preload, load_factor, F_max, F_min, A_thread):
+    # Ön yük gerilmesi σ_i, alternatif σ_a ve ortalama σ_m cıvata gerilmeleri
+    sigma_i = F_preload / A_thread
+    sigma_a = load_factor * (F_max - F_min) / (2 * A_thread)
+    sigma_m = sigma_i + load_factor * (F_max + F_min) / (2 * A_thread)
+    return sigma_i, sigma_a, sigma_m
+
+def fatigue_safety_factor(sigma_i, sigma_a, sigma_m, S_e, S_ut, S_p, criterion="Goodman"):
+    # q = (σ_m - σ_i) / σ_a yük doğrusunun eğiminin tersidir; S_m = σ_i + q·S_a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q = (sigma_m - sigma_i) / sigma_a
+        if criterion == "Goodman":
+            # S_a/S_e + S_m/S_ut = 1
+            S_a = (1 - sigma_i / S_ut) / (1 / S_e + q / S_ut)
+        else:
+            # a·S_a² + b·S_a + c = 0 pozitif kökü
+            if criterion == "Gerber":
+                # S_a/S_e + (S_m/S_ut)² = 1
+                a = (q / S_ut)**2
+                b = 1 / S_e + 2 * sigma_i * q / S_ut**2
+                c = (sigma_i / S_ut)**2 - 1
+            elif criterion == "ASME":
+                # (S_a/S_e)² + (S_m/S_p)² = 1
+                a = 1 / S_e**2 + (q / S_p)**2
+                b = 2 * sigma_i * q / S_p**2
+                c = (sigma_i / S_p)**2 - 1
+            else:
+                raise ValueError(f"Bilinmeyen yorulma kriteri: {criterion}")
+            a, b, c = np.broadcast_arrays(a, b, c)
+            linear = a == 0
+            S_a = np.where(linear, -c / b, (-b + np.sqrt(b**2 - 4 * a * c)) / (2 * np.where(linear, 1, a)))
+        return np.where(sigma_a > 0, np.maximum(S_a, 0) / sigma_a, np.inf)
+
+# Isıl ön yük değişimi (VDI 2230 R4): sıcaklık T'de esneklikler E(T) ile ölçeklenir ve
+# cıvata ile kavrama arasındaki ısıl uzama farkı ön yükü değiştirir:
+#   F_V(T) = [F_V·(δ_S + δ_P) - ΔT·(α_S·L_K - Σ α_i·t_i)] / (δ_S(T) + δ_P(T))
+# E(T) = E·(1 - c_E·(T - 20 °C)); α 10⁻⁶/K, c_E %/100 K birimindedir.
+reference_temperature = 20.0
+thermal_properties = {"thermal_expansion": "ısıl genleşme katsayısı (α)", "modulus_temp_coeff": "E sıcaklık katsayısı"}
+
+def check_thermal_properties(parts, bolt_props):
+    # Eksik α veya c_E sıfır sayılmaz (uydurma bir ön yük değişimi verirdi); eksik malzeme adıyla ValueError.
+    # Cıvata malzemesinin adı bolt_props['name'] ile verilebilir, parçalarınki part['material']'dır
+    named = [(bolt_props.get('name') or "Cıvata malzemesi", bolt_props)]
+    named += [(part.get('material') or f"{i}. parça", part) for i, part in enumerate(parts, 1)]
+    for name, props in named:
+        missing = [label for key, label in thermal_properties.items() if props.get(key) is None or np.isnan(props[key])]
+        if missing:
+            raise ValueError(f"'{name}' malzemesinin {' ve '.join(missing)} {'değerleri' if len(missing) > 1 else 'değeri'} "
+                             "eksik; sıcaklık analizi için gereklidir.")
+
+def modulus_ratio(modulus_temp_coeff, temperature):
+    return 1 - modulus_temp_coeff / 1e4 * (np.asarray(temperature, dtype=float) - reference_temperature)
+
+def thermal_preload(F_preload, k_bolt, compliances, parts, bolt_props, temperatures):
+    # Tasarım ekseni (F_preload, k_bolt, compliances[i] ile yayınlanır) × sıcaklık ekseni (son eksen).
+    # compliances: part_compliances çıktısı (parça, tasarım...). Tüm sıcaklıklar tek geçişte hesaplanır.
+    temperatures = np.asarray(temperatures, dtype=float)
+    check_thermal_properties(parts, bolt_props)
+    delta_T = temperatures - reference_temperature
+    F_preload = np.asarray(F_preload, dtype=float)[..., None]
+    delta_bolt = 1 / np.asarray(k_bolt, dtype=float)[..., None]
+    delta_parts = [np.asarray(c, dtype=float)[..., None] for c in compliances]
+    grip = sum(part['thickness'] for part in parts)
+
+    delta_bolt_T = delta_bolt / modulus_ratio(bolt_props['modulus_temp_coeff'], temperatures)
+    delta_clamped = sum(delta_parts)
+    delta_clamped_T = sum(c / modulus_ratio(part['modulus_temp_coeff'], temperatures) for c, part in zip(delta_parts, parts))
+    mismatch = delta_T * 1e-6 * (bolt_props['thermal_expansion'] * grip
+                                  - sum(part['thermal_expansion'] * part['thickness'] for part in parts))
+    preload = (F_preload * (delta_bolt + delta_clamped) - mismatch) / (delta_bolt_T + delta_clamped_T)
+    return {
+        "temperature": temperatures,
+        "preload": preload,
+        "preload_change": preload - F_preload,
+        "bolt_stiffness": 1 / delta_bolt_T,
+        "clamped_stiffness": 1 / delta_clamped_T,
+    }
+
+def thermal_inputs(parts, props, temperatures, d, clamped_model):
+    # compute_stiffness_batch için ısıl girdi; esneklikler d (skaler veya eksen dizisi) başına
+    if not len(temperatures):
+        return None
+    check_thermal_properties(parts, props)
+    return {'parts': parts, 'compliances': part_compliances(parts, d, clamped_model),
+            'bolt_props': props, 'temperatures': temperatures}
+
+def valid_combinations(L_shank, L_thread, preload_percent):
+    # compute_stiffness'ın reddettiği satırları dışarıda bırakan maske
+    return (np.asarray(L_shank) > 0) & (np.asarray(L_thread) >= 0) & (np.asarray(preload_percent) >= 0) & (np.asarray(preload_percent) <= 100)
+
+def joint_diagram(k_bolt, k_clamped, F_preload, F_yield, F_ext=0.0, steps=50, load_max=None):
+    # Bağlantı diyagramı: her tasarım için 0..load_max arasında `steps` dış yük adımı.
+    # Girdiler tasarım ekseninde yayınlanır; örnekli çıktılar (tasarım..., steps) şeklindedir.
+    # Ayrılmadan önce cıvata Φ·P, kavrama (1-Φ)·P alır; ayrılmadan sonra yükün tamamı cıvatadadır.
+    # load_max verilmezse aralık hem çalışma yükünü hem ayrılma/akma noktasını kapsar.
+    k_bolt, k_clamped, F_preload, F_yield, F_ext = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (k_bolt, k_clamped, F_preload, F_yield, F_ext)))
+    phi = k_bolt / (k_bolt + k_clamped)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        separation_load = np.where(phi < 1, F_preload / (1 - phi), 0.0)
+        # Akma başlangıcı: ayrılmadan önce F_p + Φ·P = F_y, sonra P = F_y
+        yield_before = (F_yield - F_preload) / phi
+    yield_load = np.where(F_preload >= F_yield, 0.0, np.where(yield_before <= separation_load, yield_before, F_yield))
+    if load_max is None:
+        load_max = np.maximum(F_ext, 1.1 * np.minimum(separation_load, yield_load))
+    load_max = np.broadcast_to(np.asarray(load_max, dtype=float), phi.shape)
+
+    load = load_max[..., None] * np.linspace(0, 1, steps)
+    separated = load >= separation_load[..., None]
+    bolt_force = np.where(separated, load, F_preload[..., None] + phi[..., None] * load)
+    clamped_force = np.where(separated, 0.0, F_preload[..., None] - (1 - phi[..., None]) * load)
+
+    preload_elongation = F_preload / k_bolt
+    preload_compression = F_preload / k_clamped
+    operating_separated = F_ext >= separation_load
+    return {
+        "load_factor": phi,
+        "preload_elongation": preload_elongation,
+        "preload_compression": preload_compression,
+        "separation_load": separation_load,
+        "yield_load": yield_load,
+        "operating_bolt_force": np.where(operating_separated, F_ext, F_preload + phi * F_ext),
+        "operating_clamped_force": np.where(operating_separated, 0.0, F_preload - (1 - phi) * F_ext),
+        "external_load": load,
+        "bolt_force": bolt_force,
+        "clamped_force": clamped_force,
+        # Ortak eksen: cıvata uzaması sağa, kavrama eğrisi (δ_b0 + δ_c0) noktasından geriye doğru
+        "bolt_elongation": bolt_force / k_bolt[..., None],
+        "clamped_position": (preload_elongation + preload_compression)[..., None] - clamped_force / k_clamped[..., None],
+    }
+
+# Analitik duyarlılıkların alındığı girdiler ve türevi alınan çıktılar
+sensitivity_inputs = ["shank_length", "thread_length", "preload_percent", "tensile_force",
+                      "E_bolt", "yield_strength", "ultimate_strength", "clamped_stiffness"]
+sensitivity_outputs = ["stiffness", "load_factor", "bolt_force", "safety_factor"]
+
+def sensitivity_key(output, wrt):
+    return f"d_{output}/d_{wrt}"
+
+def stiffness_sensitivities(E_bolt, yield_strength, A_shank, A_thread, preload_percent, F_ext_tensile,
+                            k_bolt, k_clamped, F_bolt_total, safety_factor, safety_basis="Yield"):
+    # Kapalı form kısmi türevler; k_b = E / (L_s/A_s + L_t/A_t) olduğundan dişli uzunluğu 0
+    # olduğunda da aynı ifadeler geçerlidir. F_b <= 0 (sonsuz güvenlik) satırlarında
+    # güvenlik faktörü türevleri NaN döner.
+    shape = np.broadcast_shapes(np.shape(k_bolt), np.shape(F_bolt_total), np.shape(k_clamped))
+    zeros = np.zeros(shape)
+    dk = {
+        "shank_length": -k_bolt**2 / (E_bolt * A_shank),
+        "thread_length": -k_bolt**2 / (E_bolt * A_thread),
+        "E_bolt": k_bolt / E_bolt,
+    }
+    k_sum = k_bolt + k_clamped
+    dphi_dk = k_clamped / k_sum**2
+    dphi = {name: dphi_dk * d for name, d in dk.items()}
+    dphi["clamped_stiffness"] = -k_bolt / k_sum**2
+
+    dF = {name: F_ext_tensile * d for name, d in dphi.items()}
+    dF["preload_percent"] = yield_strength * A_thread / 100
+    dF["tensile_force"] = k_bolt / k_sum
+    dF["yield_strength"] = (preload_percent / 100) * A_thread
+    dF["ultimate_strength"] = zeros
+
+    positive = F_bolt_total > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dSF = {name: np.where(positive, -safety_factor / F_bolt_total * d, np.nan) for name, d in dF.items()}
+        strength_term = np.where(positive, A_thread / F_bolt_total, np.nan)
+    strength_input = "yield_strength" if safety_basis == "Yield" else "ultimate_strength"
+    dSF[strength_input] = dSF[strength_input] + strength_term
+
+    derivatives = {
+        "stiffness": dk,
+        "load_factor": dphi,
+        "bolt_force": dF,
+        "safety_factor": dSF,
+    }
+    return {sensitivity_key(output, wrt): np.broadcast_to(np.asarray(derivatives[output].get(wrt, zeros), dtype=float), shape)
+            for output in sensitivity_outputs for wrt in sensitivity_inputs}
+
+# Emniyet katsayısı akma ("Yield") veya çekme ("Ultimate") dayanımına göre; kesme gerilmesi
+# gövde ("Shank") veya diş ("Thread") kesitinde hesaplanır. Tanınmayan değerler ikinci seçeneğe düşer
+safety_bases = ["Yield", "Ultimate"]
+shear_areas = ["Shank", "Thread"]
+
+def compute_stiffness_batch(E_bolt, yield_strength, ultimate_strength, A_shank, A_thread,
+                            L_shank, L_thread, preload_percent, F_ext_tensile, F_ext_shear,
+                            k_clamped, safety_basis="Yield", shear_area="Thread", sensitivities=False,
+                            load_ratio=0.0, endurance=None, fatigue_criterion="Goodman",
+                            thermal=None, k_bolt=None):
+    # k_bolt verilirse (ör. DesignGraph önbelleğinden) yeniden hesaplanmaz
+    if k_bolt is None:
+        k_bolt = bolt_stiffness(E_bolt, A_shank, A_thread, L_shank, L_thread)
+    F_preload = preload_force(np.asarray(preload_percent, dtype=float), yield_strength, A_thread)
+    F_ext_tensile = np.asarray(F_ext_tensile, dtype=float)
+
+    delta_F_bolt = (k_bolt / (k_bolt + k_clamped)) * F_ext_tensile
+    F_bolt_total = F_preload + delta_F_bolt
+    F_clamped = F_ext_tensile - delta_F_bolt
+
+    delta_L_bolt = F_bolt_total / k_bolt
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta_L_clamped = np.where(np.asarray(k_clamped) > 0, F_clamped / k_clamped, 0.0)
+
+    strength = yield_strength if safety_basis == "Yield" else ultimate_strength
+    max_load = strength * np.asarray(A_thread, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        safety_factor = np.where(F_bolt_total > 0, max_load / F_bolt_total, np.inf)
+
+    shear_area_value = A_shank if shear_area == "Shank" else A_thread
+    shear_stress = np.asarray(F_ext_shear, dtype=float) / shear_area_value
+
+    # Yorulma: çekme kuvveti yük aralığının üst sınırı, alt sınır load_ratio·F_ext
+    sigma_i, sigma_a, sigma_m = fatigue_stresses(F_preload, k_bolt / (k_bolt + k_clamped), F_ext_tensile,
+                                                 load_ratio * F_ext_tensile, np.asarray(A_thread, dtype=float))
+    fatigue_factor = fatigue_safety_factor(sigma_i, sigma_a, sigma_m, endurance_limit(ultimate_strength, endurance),
+                                           ultimate_strength, yield_strength, fatigue_criterion)
+
+    # Isıl: thermal = {'parts', 'compliances', 'bolt_props', 'temperatures'}; yoksa ön yük sabit
+    if thermal and len(thermal['temperatures']):
+        preload_T = thermal_preload(F_preload, k_bolt, thermal['compliances'], thermal['parts'],
+                                    thermal['bolt_props'], thermal['temperatures'])["preload"]
+        min_preload, max_preload = preload_T.min(axis=-1), preload_T.max(axis=-1)
+    else:
+        min_preload = max_preload = F_preload
+
+    columns = (k_bolt, k_clamped, F_bolt_total, delta_L_bolt, delta_L_clamped, shear_stress, safety_factor,
+               sigma_a, sigma_m, fatigue_factor, min_preload, max_preload)
+    shape = np.broadcast_shapes(*(np.shape(c) for c in columns))
+    result = {name: np.broadcast_to(np.asarray(c, dtype=float), shape) for name, c in zip(output_columns, columns)}
+    if sensitivities:
+        # Türevler aynı geçişte, yukarıdaki ara değerler yeniden kullanılarak hesaplanır
+        result["load_factor"] = np.broadcast_to(k_bolt / (k_bolt + k_clamped), shape)
+        derivatives = stiffness_sensitivities(
+            E_bolt, yield_strength, np.asarray(A_shank, dtype=float), np.asarray(A_thread, dtype=float),
+            np.asarray(preload_percent, dtype=float), F_ext_tensile, k_bolt, k_clamped,
+            F_bolt_total, safety_factor, safety_basis)
+        result.update({key: np.broadcast_to(d, shape) for key, d in derivatives.items()})
+    return result
+
+def design_inputs(catalog, bolt_size, L_shank, L_thread, props, preload_percent, F_ext_tensile, F_ext_shear, parts,
+                  safety_basis="Yield", shear_area="Thread", clamped_model="Prismatic", fatigue_criterion="Goodman",
+                  load_ratio=0.0, temperatures=()):
+    # Doğrulanmış tek bir tasarımı compute_stiffness_batch argümanlarına çevirir
+    # (arayüzdeki tekil hesap ve GoldenCorpus aynı yolu kullanır)
+    temperatures = np.asarray(temperatures, dtype=float)
+    (A_shank,), (A_thread,) = catalog.areas([bolt_size])
+    d = catalog.nominal_diameter(bolt_size)
+    return {
+        'inputs': {
+            'E_bolt': props['E'], 'yield_strength': props['yield_strength'], 'ultimate_strength': props['ultimate_strength'],
+            'A_shank': A_shank, 'A_thread': A_thread, 'L_shank': L_shank, 'L_thread': L_thread,
+            'preload_percent': preload_percent, 'F_ext_tensile': F_ext_tensile, 'F_ext_shear': F_ext_shear,
+            'k_clamped': clamped_stiffness(parts, d, clamped_model),
+        },
+        'options': {'safety_basis': safety_basis, 'shear_area': shear_area, 'load_ratio': load_ratio,
+                    'endurance': props.get('endurance_limit'), 'fatigue_criterion': fatigue_criterion},
+        'thermal': thermal_inputs(parts, props, temperatures, d, clamped_model),
+        'temperatures': temperatures,
+    }
+
+def evaluate_designs(designs, sensitivities=False):
+    # Birçok design_inputs çıktısını birlikte hesaplar: aynı seçeneklere sahip ısıl olmayan tasarımlar
+    # tek bir compute_stiffness_batch çağrısında vektörleştirilir. Girdi sırasıyla float sözlükleri döner.
+    results = [None] * len(designs)
+    groups = {}
+    for i, design in enumerate(designs):
+        if design['thermal']:
+            out = compute_stiffness_batch(**design['inputs'], **design['options'], sensitivities=sensitivities, thermal=design['thermal'])
+            results[i] = {name: float(value) for name, value in out.items()}
+        else:
+            groups.setdefault(tuple(sorted(design['options'].items())), []).append(i)
+    for options, indices in groups.items():
+        inputs = {name: np.array([designs[i]['inputs'][name] for i in indices], dtype=float) for name in designs[indices[0]]['inputs']}
+        out = compute_stiffness_batch(**inputs, **dict(options), sensitivities=sensitivities)
+        columns = {name: np.broadcast_to(value, len(indices)).tolist() for name, value in out.items()}
+        for j, i in enumerate(indices):
+            results[i] = {name: column[j] for name, column in columns.items()}
+    return results
+
+# Monte Carlo tolerans analizi: her tasarım için N örnek, seçilen girdiler dağılımlardan çekilir
+# ve compute_stiffness_batch ile tasarım blokları ve örnek parçaları halinde değerlendirilir. Girdiler
+# skaler veya (tasarım,) şeklinde olabilir; örnekler son eksende tutulur. Aynı seed, parça boyutu ve
+# bellek sınırı aynı sonucu verir.
+mc_distributions = ["normal", "uniform", "lognormal"]
+mc_percentiles = (1, 5, 50, 95, 99)
+mc_outputs = ["safety_factor", "fatigue_safety_factor", "bolt_force"]
+mc_correlated = {"ultimate_strength": "yield_strength"}  # Aynı standart çekilişi paylaşan girdiler
+mc_memory_budget = 128 << 20  # Bir tasarım bloğunda tutulan örneklerin en fazla boyutu (bayt)
+
+def sample_tolerance(rng, nominal, distribution, spread, relative, shape, standard=None):
+    # spread: normal/lognormal için standart sapma (relative ise değişim katsayısı),
+    # uniform için ± yarı genişlik. standard verilirse bağıntılı girdi aynı çekilişi kullanır.
+    nominal = np.asarray(nominal, dtype=float)[..., None]
+    if standard is None:
+        standard = rng.uniform(-1, 1, shape) if distribution == "uniform" else rng.standard_normal(shape)
+    if distribution == "lognormal":
+        sigma = np.sqrt(np.log1p(spread**2))
+        return nominal * np.exp(sigma * standard - sigma**2 / 2), standard
+    if distribution not in ("normal", "uniform"):
+        raise ValueError(f"Bilinmeyen dağılım: {distribution}")
+    return (nominal * (1 + spread * standard) if relative else nominal + spread * standard), standard
+
+def monte_carlo_stiffness(inputs, tolerances, samples=100_000, seed=None, chunk_size=1 << 18,
+                          percentiles=mc_percentiles, thermal=None, memory_budget=mc_memory_budget, **options):
+    # inputs: compute_stiffness_batch'in sayısal argümanları (ad -> değer)
+    # tolerances: {ad: (dağılım, yayılım, göreli mi)}; options: safety_basis, load_ratio vb.
+    # thermal: thermal_inputs çıktısı (esneklikler tasarım şeklinde olabilir).
+    # Tasarımlar bloklar halinde işlenir: bir blokta yalnızca o tasarımların örnekleri tutulur
+    # (blok × örnek × çıktı ≤ memory_budget bayt); yüzdelikler blok bitince hesaplanıp örnekler bırakılır.
+    rng = np.random.default_rng(seed)
+    designs = np.broadcast_shapes(*(np.shape(v) for v in inputs.values()))
+    count = int(np.prod(designs))
+    flat = {name: np.broadcast_to(np.asarray(value, dtype=float), designs).reshape(count) for name, value in inputs.items()}
+    compliances = None
+    if thermal and len(thermal['temperatures']):
+        compliances = np.asarray(thermal['compliances'], dtype=float)
+        compliances = np.broadcast_to(compliances, compliances.shape[:1] + designs).reshape(len(compliances), count)
+    block = max(1, min(count, memory_budget // (samples * len(mc_outputs) * 4)))
+    result = {"samples": samples, "percentiles": np.asarray(percentiles)}
+    for name in mc_outputs:
+        result[name] = {"percentiles": np.empty((count, len(percentiles))), "mean": np.empty(count), "std": np.empty(count)}
+    failures = {name: np.zeros(count, dtype=np.int64) for name in ("safety_factor", "fatigue_safety_factor")}
+    for first in range(0, count, block):
+        rows = slice(first, min(first + block, count))
+        size = rows.stop - rows.start
+        block_inputs = {name: value[rows] for name, value in flat.items()}
+        if compliances is not None:
+            # Örnek ekseni esnekliklerin de son eksenidir; sıcaklık ekseni thermal_preload'da eklenir
+            options['thermal'] = {**thermal, 'compliances': compliances[:, rows, None]}
+        collected = {name: np.empty((size, samples), dtype=np.float32) for name in mc_outputs}
+        step = max(1, chunk_size // size)  # Tek çağrıda en fazla chunk_size (tasarım × örnek) değeri
+        for start in range(0, samples, step):
+            n = min(step, samples - start)
+            shape = (size, n)
+            drawn, standards = {}, {}
+            for name in sorted(tolerances, key=lambda name: name in mc_correlated):
+                distribution, spread, relative = tolerances[name]
+                partner = mc_correlated.get(name)
+                shared = standards.get(partner) if partner and tolerances.get(partner, (None,))[0] == distribution else None
+                drawn[name], standards[name] = sample_tolerance(rng, block_inputs[name], distribution, spread, relative, shape, shared)
+            args = {name: drawn.get(name, value[..., None]) for name, value in block_inputs.items()}
+            # Uzunluklar fiziksel sınırlarda tutulur
+            args["L_shank"] = np.maximum(args["L_shank"], 1e-6)
+            args["L_thread"] = np.maximum(args["L_thread"], 0.0)
+            out = compute_stiffness_batch(**args, **options)
+            for name in mc_outputs:
+                collected[name][:, start:start + n] = out[name]
+            for name in failures:
+                failures[name][rows] += (out[name] < 1).sum(axis=-1)
+        for name in mc_outputs:
+            values = collected[name]
+            finite = np.where(np.isfinite(values), values, np.nan)
+            result[name]["percentiles"][rows] = np.moveaxis(np.percentile(values, percentiles, axis=-1), 0, -1)
+            result[name]["mean"][rows] = np.nanmean(finite, axis=-1, dtype=np.float64)
+            result[name]["std"][rows] = np.nanstd(finite, axis=-1, dtype=np.float64)
+    for name in mc_outputs:
+        stats = result[name]
+        stats["percentiles"] = stats["percentiles"].reshape(designs + (len(percentiles),))
+        stats["mean"], stats["std"] = stats["mean"].reshape(designs), stats["std"].reshape(designs)
+    for name, failed in failures.items():
+        result[name]["failure_probability"] = failed.reshape(designs) / samples
+    return result
+
+# Cıvata deseni (rijit plaka varsayımı): konumlar (..., n, 2) mm, eksik cıvatalar NaN ile doldurulur.
+# Eksenel kuvvet ve eğilme momentleri ağırlık merkezine göre doğrusal dağılır (Mx +y tarafını,
+# My +x tarafını çeker); kesme kuvveti eşit paylaşılır, burulma momenti Mz yarıçapla orantılıdır.
+pattern_loads = ["F_axial", "F_x", "F_y", "M_x", "M_y", "M_z"]
+
+def circular_pattern(count, diameter, start_angle=0.0):
+    angles = np.deg2rad(start_angle) + 2 * np.pi * np.arange(count) / count
+    return 0.5 * diameter * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+
+def pad_patterns(patterns):
+    # Farklı cıvata sayılı desenleri tek (varyant, n_max, 2) dizisinde toplar
+    patterns = [np.asarray(p, dtype=float).reshape(-1, 2) for p in patterns]
+    padded = np.full((len(patterns), max(len(p) for p in patterns), 2), np.nan)
+    for i, p in enumerate(patterns):
+        padded[i, :len(p)] = p
+    return padded
+
+def bolt_pattern_loads(positions, F_axial=0.0, F_x=0.0, F_y=0.0, M_x=0.0, M_y=0.0, M_z=0.0):
+    positions = np.asarray(positions, dtype=float)
+    present = np.isfinite(positions).all(axis=-1)
+    count = present.sum(axis=-1)
+    if np.any(count == 0):
+        raise ValueError("Desen en az bir cıvata içermelidir.")
+    loads = [np.asarray(v, dtype=float)[..., None] for v in (F_axial, F_x, F_y, M_x, M_y, M_z)]
+    F_axial, F_x, F_y, M_x, M_y, M_z = loads
+    xy = np.where(present[..., None], positions, 0.0)
+    centroid = xy.sum(axis=-2) / count[..., None]
+    x = np.where(present, xy[..., 0] - centroid[..., None, 0], 0.0)
+    y = np.where(present, xy[..., 1] - centroid[..., None, 1], 0.0)
+    Ixx, Iyy, Ixy = (y * y).sum(axis=-1), (x * x).sum(axis=-1), (x * y).sum(axis=-1)
+    n = count[..., None]
+
+    # Eğilme: F_i = F/n + a·x_i + b·y_i, Σ F_i·x_i = My ve Σ F_i·y_i = Mx koşullarından;
+    # tek sıra (doğrusal) desenlerde her eksen ayrı ayrı çözülür
+    Ixx, Iyy, Ixy = Ixx[..., None], Iyy[..., None], Ixy[..., None]
+    det = Iyy * Ixx - Ixy ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a = np.where(det > 1e-12 * (Ixx + Iyy) ** 2, (M_y * Ixx - M_x * Ixy) / det, np.where(Iyy > 0, M_y / Iyy, 0.0))
+        b = np.where(det > 1e-12 * (Ixx + Iyy) ** 2, (M_x * Iyy - M_y * Ixy) / det, np.where(Ixx > 0, M_x / Ixx, 0.0))
+        J = Ixx + Iyy
+        torsion = np.where(J > 0, M_z / J, 0.0)
+    tensile = F_axial / n + a * x + b * y
+    shear_x = F_x / n - torsion * y
+    shear_y = F_y / n + torsion * x
+    shear = np.hypot(shear_x, shear_y)
+    return {
+        "tensile": np.where(present, tensile, np.nan),
+        "shear": np.where(present, shear, np.nan),
+        "centroid": centroid,
+        "count": count,
+    }
+
+def bolt_pattern_analysis(positions, loads, **batch):
+    # loads: pattern_loads anahtarlı kuvvet/momentler; batch: F_ext_* dışındaki compute_stiffness_batch argümanları
+    distribution = bolt_pattern_loads(positions, **{name: loads.get(name, 0.0) for name in pattern_loads})
+    out = compute_stiffness_batch(F_ext_tensile=distribution["tensile"], F_ext_shear=distribution["shear"], **batch)
+    present = np.isfinite(distribution["tensile"])
+    # Doldurma (eksik cıvata) konumlarının çıktıları NaN olarak işaretlenir
+    out = {name: np.where(present, values, np.nan) for name, values in out.items()}
+    result = dict(out, tensile=distribution["tensile"], shear=distribution["shear"],
+                  centroid=distribution["centroid"], count=distribution["count"])
+    for name in ("safety_factor", "fatigue_safety_factor"):
+        values = np.where(present, out[name], np.inf)
+        result[f"critical_{name}"] = values.min(axis=-1)
+        result[f"critical_bolt_{name}"] = values.argmin(axis=-1)
+    result["max_shear_stress"] = np.where(present, out["shear_stress"], -np.inf).max(axis=-1)
+    return result
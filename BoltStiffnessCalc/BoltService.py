@@ -0,0 +1,479 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+from BoltEngine import design_inputs, evaluate_designs, check_thermal_properties, clamped_models, fatigue_criteria, safety_bases, shear_areas, output_columns, load_bolt_catalog
+from MaterialLibrary import MaterialLibrary, default_materials
+from ParametricSweep import load_run, validate_axes, excluded_combinations
+from ResultStore import input_columns
+from SweepJobs import JobManager
+
+# Hesap çekirdeği için yerel HTTP/JSON servisi (yalnızca standart kütüphane, asyncio).
+# CAD eklentileri ve PLM betikleri arayüzü sürmeden aynı motoru ve aynı sonuç veritabanını kullanır.
+#   python BoltService.py                     -> 127.0.0.1:8765
+#   python BoltService.py --port 9000 --workers 8
+#
+#   GET    /health                   durum
+#   GET    /catalog, /materials      cıvata boyutları ve malzeme adları
+#   POST   /stiffness                tek tasarım -> {"outputs": {...}}
+#   POST   /stiffness/batch          {"designs": [...]} -> {"results": [...]}
+#   POST   /jobs                     parametrik tarama gönderir -> {"id": ...} (202)
+#   GET    /jobs, /jobs/<id>         iş listesi / durum ve ilerleme
+#   DELETE /jobs/<id>                işi iptal eder
+#   GET    /jobs/<id>/results        biten işin satırları (?format=ndjson|csv, parça parça aktarılır)
+#   GET    /runs/<run_id>/results    veritabanındaki herhangi bir çalıştırmanın satırları
+#
+# Eşzamanlı tekil istekler olay döngüsünde toplanır ve iş havuzunda tek bir vektörleştirilmiş
+# evaluate_designs çağrısıyla hesaplanır; böylece istek başına NumPy çağrı maliyeti paylaşılır.
+
+default_host = "127.0.0.1"
+default_port = 8765
+default_workers = min(4, os.cpu_count() or 1)
+default_sweep_workers = 2  # Aynı anda çalışan parametrik tarama sayısı
+batch_limit = 4096  # Tek vektörleştirilmiş çağrıda toplanan en fazla tekil istek
+stream_rows = 65536  # Sonuç aktarımında parça başına satır
+max_body = 64 << 20
+
+material_db_path = "materials.db"
+db_path = "parametric_results.db"
+results_dir = "parametric_runs"
+
+status_texts = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def number(data, name, default=None, minimum=None, maximum=None, message=None):
+    value = data.get(name, default)
+    try:
+        value = float(value if value is not None else 0)
+    except (TypeError, ValueError):
+        raise ValueError(message or f"{name} sayısal olmalıdır.")
+    if not math.isfinite(value):
+        # NaN her karşılaştırmada False verir; aralık denetiminden önce reddedilir
+        raise ValueError(message or f"{name} sonlu bir sayı olmalıdır.")
+    if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+        raise ValueError(message or f"{name} {minimum}…{maximum} aralığında olmalıdır.")
+    return value
+
+class BoltService:
+    def __init__(self, workers=default_workers, sweep_workers=default_sweep_workers, db_path=db_path,
+                 material_db_path=material_db_path, results_root=None):
+        self.catalog = load_bolt_catalog()
+        self.materials = MaterialLibrary(material_db_path, default_materials)  # Yalnızca olay döngüsü iş parçacığında okunur
+        self.db_path = db_path
+        self.results_root = results_root or os.path.join(os.path.dirname(os.path.abspath(db_path)), results_dir)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="service-calc")
+        self.jobs = JobManager(db_path, self.results_root, sweep_workers, keep_results=False)
+        self.pending = []  # (tasarım, duyarlılık, future) — bir sonraki toplu hesabı bekleyenler
+        self.flush_scheduled = False
+        self.requests = 0
+
+    # --- girdiler -------------------------------------------------------------------------
+
+    def material_props(self, material):
+        # Malzeme adı (materials.db) veya özellik sözlüğü
+        if isinstance(material, dict):
+            props = dict(material)
+            for name in ("E", "yield_strength", "ultimate_strength"):
+                message = f"Malzeme özelliği '{name}' pozitif bir sayı olmalıdır."
+                if number(props, name, message=message) <= 0:
+                    raise ValueError(message)
+            if props.get("endurance_limit") is not None:
+                message = "Malzeme özelliği 'endurance_limit' pozitif bir sayı olmalıdır."
+                if number(props, "endurance_limit", message=message) <= 0:
+                    raise ValueError(message)
+            return props
+        if material not in self.materials:
+            raise ValueError("Geçerli bir malzeme seçin.")
+        return {**self.materials[material], 'name': material}
+
+    def read_parts(self, parts):
+        result = []
+        for part in parts or []:
+            thickness = number(part, "thickness", message="Parça kalınlığı sayısal olmalıdır.")
+            if thickness <= 0:
+                raise ValueError("Parça kalınlığı 0'dan büyük olmalıdır.")
+            area = number(part, "area", message="Parça alanı sayısal olmalıdır.")
+            if area <= 0:
+                raise ValueError("Parça alanı 0'dan büyük olmalıdır.")
+            props = self.material_props(part.get("material"))
+            result.append({'type': part.get("type", "Plate"), 'thickness': thickness,
+                           'material': part.get("material") if isinstance(part.get("material"), str) else "custom",
+                           'E': float(props['E']), 'area': area, 'thermal_expansion': props.get('thermal_expansion'),
+                           'modulus_temp_coeff': props.get('modulus_temp_coeff')})
+        if not result:
+            raise ValueError("En az bir sıkıştırılan parça eklenmelidir.")
+        return result
+
+    def read_options(self, data):
+        clamped_model = data.get("clamped_model", "Prismatic")
+        if clamped_model not in clamped_models:
+            raise ValueError("Geçerli bir kavrama modeli seçin.")
+        fatigue_criterion = data.get("fatigue_criterion", "Goodman")
+        if fatigue_criterion not in fatigue_criteria:
+            raise ValueError("Geçerli bir yorulma kriteri seçin.")
+        safety_basis = data.get("safety_basis", "Yield")
+        if safety_basis not in safety_bases:
+            raise ValueError("Emniyet katsayısı temeli 'Yield' veya 'Ultimate' olmalıdır.")
+        shear_area = data.get("shear_area", "Thread")
+        if shear_area not in shear_areas:
+            raise ValueError("Kesme alanı 'Shank' veya 'Thread' olmalıdır.")
+        temperatures = np.unique(np.asarray(data.get("temperatures") or [], dtype=float))
+        if not np.isfinite(temperatures).all():
+            raise ValueError("Sıcaklıklar sonlu sayılar olmalıdır.")
+        if (temperatures < -273.15).any():
+            raise ValueError("Sıcaklık mutlak sıfırın altında olamaz.")
+        return {'safety_basis': safety_basis, 'shear_area': shear_area,
+                'clamped_model': clamped_model, 'fatigue_criterion': fatigue_criterion,
+                'load_ratio': number(data, "load_ratio", 0.0, -1, 1, "Yük oranı R -1 ile 1 arasında olmalıdır."),
+                'temperatures': temperatures}
+
+    def read_design(self, data):
+        # Arayüzdeki read_design_values ile aynı kurallar; JSON anahtarları design_inputs parametreleridir
+        if not isinstance(data, dict):
+            raise ValueError("Tasarım bir JSON nesnesi olmalıdır.")
+        bolt_size = data.get("bolt_size")
+        if not bolt_size or bolt_size not in self.catalog:
+            raise ValueError("Geçerli bir cıvata boyutu seçin.")
+        L_shank = number(data, "L_shank")
+        if L_shank <= 0:
+            raise ValueError("Gövde uzunluğu 0'dan büyük olmalıdır.")
+        return design_inputs(
+            self.catalog, bolt_size, L_shank,
+            number(data, "L_thread", minimum=0, message="Dişli kısım uzunluğu negatif olamaz."),
+            self.material_props(data.get("material")),
+            number(data, "preload_percent", minimum=0, maximum=100, message="Ön yükleme yüzdesi 0-100 arasında olmalıdır."),
+            number(data, "F_ext_tensile"), number(data, "F_ext_shear"), self.read_parts(data.get("parts")),
+            **self.read_options(data))
+
+    # --- tekil ve toplu hesap ---------------------------------------------------------------
+
+    async def evaluate(self, design, sensitivities=False):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((design, sensitivities, future))
+        if not self.flush_scheduled:
+            # Aynı döngü turunda gelen tüm istekler tek bir toplu hesapta birleşir
+            self.flush_scheduled = True
+            loop.call_soon(self.flush)
+        return await future
+
+    def flush(self):
+        self.flush_scheduled = False
+        loop = asyncio.get_running_loop()
+        while self.pending:
+            batch, self.pending = self.pending[:batch_limit], self.pending[batch_limit:]
+            for sensitivities in (False, True):
+                group = [item for item in batch if item[1] == sensitivities]
+                if group:
+                    task = loop.run_in_executor(self.pool, self.evaluate_group, [design for design, _, _ in group], sensitivities)
+                    task.add_done_callback(lambda task, group=group: self.resolve(task, group))
+
+    @staticmethod
+    def evaluate_group(designs, sensitivities):
+        try:
+            return evaluate_designs(designs, sensitivities)
+        except Exception:
+            # Toplu hesap bozulursa hatalı tasarım yalnızca kendi isteğini etkiler
+            results = []
+            for design in designs:
+                try:
+                    results.extend(evaluate_designs([design], sensitivities))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+    @staticmethod
+    def resolve(task, group):
+        if task.cancelled() or task.exception():
+            # İptal edilen görevde exception() CancelledError fırlatır; bekleyenlere iptal iletilir
+            for _, _, future in group:
+                if not future.done():
+                    if task.cancelled():
+                        future.cancel()
+                    else:
+                        future.set_exception(task.exception())
+            return
+        for (_, _, future), result in zip(group, task.result()):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def post_stiffness(self, body, query):
+        try:
+            design = self.read_design(body)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        return 200, {"outputs": await self.evaluate(design, bool(body.get("sensitivities")))}
+
+    async def post_stiffness_batch(self, body, query):
+        designs = body.get("designs") if isinstance(body, dict) else None
+        if not isinstance(designs, list):
+            raise HTTPError(400, "designs bir liste olmalıdır.")
+        results, valid = [None] * len(designs), []
+        for i, data in enumerate(designs):
+            try:
+                valid.append((i, self.read_design(data)))
+            except ValueError as e:
+                results[i] = {"error": str(e)}
+        outputs = await asyncio.get_running_loop().run_in_executor(
+            self.pool, self.evaluate_group, [design for _, design in valid], bool(body.get("sensitivities")))
+        for (i, _), out in zip(valid, outputs):
+            results[i] = {"error": str(out)} if isinstance(out, Exception) else {"outputs": out}
+        return 200, {"results": results}
+
+    # --- parametrik işler -------------------------------------------------------------------
+
+    async def post_jobs(self, body, query):
+        # Tüm girdiler gönderimde bir kez denetlenir; hatalar tek bir 400 yanıtında listelenir
+        if not isinstance(body, dict):
+            raise HTTPError(400, "İstek bir JSON nesnesi olmalıdır.")
+        raw = body.get("axes")
+        axes, errors, excluded = validate_axes(self.catalog, raw if isinstance(raw, dict) else {})
+        values = {}
+        for name, read in (("parts", lambda: self.read_parts(body.get("parts"))),
+                           ("props", lambda: self.material_props(body.get("material"))),
+                           ("F_ext_shear", lambda: number(body, "F_ext_shear")),
+                           ("options", lambda: self.read_options(body))):
+            try:
+                values[name] = read()
+            except ValueError as e:
+                errors.append(str(e))
+        if not errors and len(values["options"]["temperatures"]):
+            try:
+                check_thermal_properties(values["parts"], values["props"])
+            except ValueError as e:
+                errors.append(str(e))
+        if errors:
+            return 400, {"error": "Parametrik tarama başlatılmadı.", "errors": errors}
+        material = body.get("material")
+        sweep = dict(catalog=self.catalog, axes=axes, parts=values["parts"],
+                     material=material if isinstance(material, str) else "custom", props=values["props"],
+                     F_ext_shear=values["F_ext_shear"], **values["options"])
+        job = self.jobs.submit(sweep, str(body.get("label", "")), to_disk=bool(body.get("to_disk")),
+                               excluded=excluded_combinations(axes, excluded))
+        return 202, dict(job.status(), excluded={name: v.tolist() for name, v in excluded.items()})
+
+    def find_job(self, job_id):
+        job = self.jobs.get(int(job_id)) if job_id.isdigit() else None
+        if job is None:
+            raise HTTPError(404, f"İş bulunamadı: {job_id}")
+        return job
+
+    async def get_jobs(self, body, query):
+        return 200, {"jobs": [job.status() for job in self.jobs.jobs.values()]}
+
+    async def get_job(self, body, query, job_id):
+        return 200, self.find_job(job_id).status()
+
+    async def delete_job(self, body, query, job_id):
+        job = self.find_job(job_id)
+        self.jobs.cancel(job.id)
+        return 200, job.status()
+
+    async def get_job_results(self, body, query, job_id):
+        job = self.find_job(job_id)
+        if job.run_id is None:
+            raise HTTPError(409, f"İş henüz bitmedi (durum: {job.state}).")
+        return await self.get_run_results(body, query, str(job.run_id))
+
+    async def get_run_results(self, body, query, run_id):
+        if not run_id.isdigit():
+            raise HTTPError(404, f"Çalıştırma bulunamadı: {run_id}")
+        fmt = query.get("format", ["ndjson"])[0]
+        if fmt not in ("ndjson", "csv"):
+            raise HTTPError(400, "format ndjson veya csv olmalıdır.")
+        try:
+            store = await asyncio.get_running_loop().run_in_executor(self.pool, self.open_run, int(run_id))
+        except FileNotFoundError as e:
+            raise HTTPError(404, str(e))
+        if store is None:
+            raise HTTPError(404, f"Çalıştırma bulunamadı: {run_id}")
+        if store.meta.get('status') == "running":
+            raise HTTPError(409, f"Çalıştırma {run_id} henüz bitmedi.")
+        return 200, ResultStream(store, fmt)
+
+    def open_run(self, run_id):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            return load_run(conn, run_id, categorical_order=self.catalog.names)
+        finally:
+            conn.close()
+
+    # --- diğer ----------------------------------------------------------------------------
+
+    async def get_health(self, body, query):
+        return 200, {"status": "ok", "requests": self.requests, "jobs": len(self.jobs.jobs), "active": self.jobs.active_count()}
+
+    async def get_catalog(self, body, query):
+        return 200, {"bolt_sizes": list(self.catalog.names)}
+
+    async def get_materials(self, body, query):
+        return 200, {"materials": list(self.materials)}
+
+    def route(self, method, path):
+        parts = [p for p in path.split("/") if p]
+        routes = {
+            ("GET", ("health",)): self.get_health,
+            ("GET", ("catalog",)): self.get_catalog,
+            ("GET", ("materials",)): self.get_materials,
+            ("POST", ("stiffness",)): self.post_stiffness,
+            ("POST", ("stiffness", "batch")): self.post_stiffness_batch,
+            ("GET", ("jobs",)): self.get_jobs,
+            ("POST", ("jobs",)): self.post_jobs,
+        }
+        handler = routes.get((method, tuple(parts)))
+        if handler:
+            return handler, ()
+        if len(parts) >= 2 and parts[0] in ("jobs", "runs"):
+            key = (method, parts[0], len(parts) == 3 and parts[2] == "results")
+            handler = {("GET", "jobs", False): self.get_job, ("DELETE", "jobs", False): self.delete_job,
+                       ("GET", "jobs", True): self.get_job_results, ("GET", "runs", True): self.get_run_results}.get(key)
+            if handler and len(parts) == (3 if key[2] else 2):
+                return handler, (parts[1],)
+        if any(path_parts == tuple(parts) for _, path_parts in routes):
+            raise HTTPError(405, f"İzin verilmeyen yöntem: {method}")
+        raise HTTPError(404, f"Bilinmeyen adres: {path}")
+
+    # --- HTTP -----------------------------------------------------------------------------
+
+    async def handle_connection(self, reader, writer):
+        # HTTP/1.1 kalıcı bağlantı: aynı soketten art arda istekler okunur
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              if version == "HTTP/1.1" else headers.get("connection", "").lower() == "keep-alive")
+                length = int(headers.get("content-length") or 0)
+                if length > max_body:
+                    await self.send(writer, 413, {"error": "İstek gövdesi çok büyük."}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self.dispatch(method, target, body)
+                await self.send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, target, body):
+        self.requests += 1
+        url = urlsplit(target)
+        try:
+            handler, args = self.route(method, url.path)
+            try:
+                data = json.loads(body) if body else {}
+            except ValueError:
+                raise HTTPError(400, "Geçersiz JSON.")
+            return await handler(data, parse_qs(url.query), *args)
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    async def send(self, writer, status, payload, keep_alive):
+        head = f"HTTP/1.1 {status} {status_texts.get(status, '')}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        if isinstance(payload, ResultStream):
+            writer.write(f"{head}Content-Type: {payload.content_type}\r\nTransfer-Encoding: chunked\r\n\r\n".encode("latin-1"))
+            loop = asyncio.get_running_loop()
+            for start in range(0, max(len(payload.store), 1), stream_rows):
+                chunk = await loop.run_in_executor(self.pool, payload.render, start)
+                if chunk:
+                    writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    await writer.drain()
+            writer.write(b"0\r\n\r\n")
+        else:
+            data = json.dumps(json_safe(payload), ensure_ascii=False, allow_nan=False).encode("utf-8")
+            writer.write(f"{head}Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(data)}\r\n\r\n".encode("latin-1") + data)
+        await writer.drain()
+
+    async def serve(self, host=default_host, port=default_port, ready=None):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        if ready:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.jobs.cancel_all()
+        self.pool.shutdown(wait=False)
+
+def json_safe(payload):
+    # JSON NaN/inf içermez; bu değerler (ör. ısıl hesap yokken min_preload) null olarak gönderilir
+    if isinstance(payload, float):
+        return payload if np.isfinite(payload) else None
+    if isinstance(payload, dict):
+        return {name: json_safe(value) for name, value in payload.items()}
+    if isinstance(payload, list):
+        return [json_safe(value) for value in payload]
+    return payload
+
+class ResultStream:
+    # Sonuç deposunu stream_rows satırlık parçalar hâlinde NDJSON veya CSV olarak üretir
+    def __init__(self, store, fmt):
+        self.store = store
+        self.fmt = fmt
+        self.content_type = "text/csv; charset=utf-8" if fmt == "csv" else "application/x-ndjson"
+
+    def render(self, start):
+        rows = slice(start, min(start + stream_rows, len(self.store)))
+        frame = self.store.to_dataframe(rows)
+        frame.columns = input_columns + output_columns
+        if self.fmt == "csv":
+            return frame.to_csv(index=False, header=start == 0).encode("utf-8")
+        if not len(frame):
+            return b""
+        return (frame.to_json(orient="records", lines=True, force_ascii=False).rstrip("\n") + "\n").encode("utf-8")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cıvata sertliği hesap servisi (yerel HTTP/JSON)")
+    parser.add_argument("--host", default=default_host)
+    parser.add_argument("--port", type=int, default=default_port)
+    parser.add_argument("--workers", type=int, default=default_workers, help="tekil/toplu hesap iş parçacığı sayısı")
+    parser.add_argument("--sweep-workers", type=int, default=default_sweep_workers, help="aynı anda çalışan tarama sayısı")
+    parser.add_argument("--db", default=db_path, help="parametrik sonuç veritabanı")
+    parser.add_argument("--materials", default=material_db_path, help="malzeme veritabanı")
+    args = parser.parse_args(argv)
+
+    service = BoltService(args.workers, args.sweep_workers, args.db, args.materials)
+    print(f"Servis dinleniyor: http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,29 +4,30 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 from PIL import Image, ImageTk
 import io
+import zipfile
 import numpy as np
 import pandas as pd
-from itertools import product
 import threading
 import queue
 import sqlite3
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from BoltEngine import compute_stiffness_batch, design_inputs, check_thermal_properties, clamped_models, fatigue_criteria, preload_force, joint_diagram, monte_carlo_stiffness, circular_pattern, pad_patterns, bolt_pattern_analysis, output_columns, sensitivity_key, load_bolt_catalog
+from ResultStore import ParametricResults, input_columns, column_labels
+from MaterialLibrary import MaterialLibrary, default_materials
+from ParametricSweep import load_run, validate_axes, excluded_combinations
+from Instrumentation import StageTimings
+from DesignGraph import design_graph
+from ResultHistory import ResultHistory
+from SweepJobs import JobManager
 
 # Cıvata boyutları ve malzeme özellikleri
-bolt_sizes = {
-    'M6': {'A_shank': 28.27, 'A_thread': 20.1},
-    'M8': {'A_shank': 50.27, 'A_thread': 36.6},
-    'M10': {'A_shank': 78.54, 'A_thread': 58.0},
-    'M12': {'A_shank': 113.10, 'A_thread': 84.3},
-    'M14': {'A_shank': 153.94, 'A_thread': 114.8},
-    'M16': {'A_shank': 201.06, 'A_thread': 157.1},
-}
-materials = {
-    'Steel': {'E': 200000, 'yield_strength': 800, 'ultimate_strength': 1000, 'poisson_ratio': 0.30, 'percent_elongation': 40, 'density': 7.85},
-    'Aluminum': {'E': 70000, 'yield_strength': 275, 'ultimate_strength': 310, 'poisson_ratio': 0.33, 'percent_elongation': 12, 'density': 2.70},
-    'Titanium': {'E': 110000, 'yield_strength': 800, 'ultimate_strength': 900, 'poisson_ratio': 0.34, 'percent_elongation': 10, 'density': 4.51},
-}
+bolt_catalog = load_bolt_catalog()  # Başlangıçta bir kez okunur (bolt_catalog.csv)
+material_db_path = "materials.db"
+materials = MaterialLibrary(material_db_path, default_materials)  # Başlangıçta bir kez yüklenir
 
 # Wiki metni (Markdown ve LaTeX karışımı)
 wiki_text = """
@@ -49,6 +50,10 @@ Cıvata sertliği \( k_b \) ve kavrama sertliği \( k_c \) aşağıdaki gibi hes
   $$ k_c = \\frac{1}{\\sum \\frac{L_i}{E_i \\cdot A_i}} $$
   Burada \( L_i \), \( E_i \), ve \( A_i \) sırasıyla her bir sıkıştırılan parçanın uzunluğu, elastiklik modülü ve kesit alanıdır.
 
+- **Basınç Konisi (VDI 2230):**
+  $$ k_i = \\frac{\\pi E_i d \\tan\\alpha}{\\ln\\frac{(2t\\tan\\alpha + D - d)(D + d)}{(2t\\tan\\alpha + D + d)(D - d)}} $$
+  Koni, \( D = 1.5d \) oturma yüzeyinden \( \\alpha = 30^\\circ \) ile açılır ve kavrama boyunun ortasında birleşir. Plate parçaları koni dilimleri, Washer ve Cylinder parçaları \( E \\cdot A / t \) olarak seri bağlanır.
+
 ## Örnek Hesaplama
 
 Bir M10 cıvata için:
@@ -66,18 +71,114 @@ $$ k_b = \\frac{200000 \\cdot 58}{40} = 290000 \, \text{N/mm} $$
 # Parça türleri
 clamped_part_types = ['Washer', 'Plate', 'Cylinder']
 
+# Parametrik sonuç eksenleri (dil anahtarı, sonuç sütunu) ve grafiklenebilir çıktılar
+parametric_axes = [
+    ("civata_boyutu", "bolt_size"),
+    ("govde_uzunlugu", "shank_length"),
+    ("disli_kisim_uzunlugu", "thread_length"),
+    ("on_yukleme_yuzdesi", "preload_percent"),
+    ("cekme_kuvveti", "tensile_force"),
+]
+parametric_outputs = {
+    "Güvenlik Faktörü": "safety_factor",
+    "Toplam Cıvata Kuvveti (N)": "bolt_force",
+    "Cıvata Çarpılma (mm)": "bolt_deflection",
+    "Kavrama Çarpılma (mm)": "clamped_deflection",
+    "Kesme Gerilimi (MPa)": "shear_stress",
+    "Toplam Cıvata Sertliği (N/mm)": "stiffness",
+    "Toplam Kavrama Sertliği (N/mm)": "clamped_stiffness",
+    "Yorulma Güvenlik Faktörü": "fatigue_safety_factor",
+    "Alternatif Gerilme (MPa)": "alternating_stress",
+    "Ortalama Gerilme (MPa)": "mean_stress",
+    "Min Ön Yük (N)": "min_preload",
+    "Maks Ön Yük (N)": "max_preload",
+}
+# Tekil hesaplamada gösterilen analitik duyarlılıklar (çıktı, girdi, tablo satırı)
+sensitivity_rows = [
+    ("safety_factor", "shank_length", "∂GF/∂Gövde Uzunluğu (1/mm)"),
+    ("safety_factor", "thread_length", "∂GF/∂Dişli Kısım Uzunluğu (1/mm)"),
+    ("safety_factor", "preload_percent", "∂GF/∂Ön Yükleme Yüzdesi (1/%)"),
+    ("safety_factor", "tensile_force", "∂GF/∂Çekme Kuvveti (1/N)"),
+    ("bolt_force", "shank_length", "∂F_cıvata/∂Gövde Uzunluğu (N/mm)"),
+    ("bolt_force", "thread_length", "∂F_cıvata/∂Dişli Kısım Uzunluğu (N/mm)"),
+    ("bolt_force", "preload_percent", "∂F_cıvata/∂Ön Yükleme Yüzdesi (N/%)"),
+    ("bolt_force", "tensile_force", "∂F_cıvata/∂Çekme Kuvveti"),
+    ("stiffness", "shank_length", "∂k_cıvata/∂Gövde Uzunluğu (N/mm²)"),
+    ("stiffness", "thread_length", "∂k_cıvata/∂Dişli Kısım Uzunluğu (N/mm²)"),
+]
+# Onay sorulan kombinasyon sayısı. Temel sürümde 1000 idi; vektörleştirilmiş motorla bu kadarı anlık
+# biter. Bir milyon kombinasyon birkaç saniye ve bellekte ~60 MB (diske yazılmazsa) tutar.
+parametric_warn_limit = 1_000_000
+para_display_rows = 1000  # Parametrik tabloda gösterilen en iyi satır sayısı
+excel_row_limit = 1_048_576
+joint_diagram_steps = 60  # Bağlantı diyagramındaki dış yük adımı sayısı
+joint_overlay_rows = 20  # Optimal grafikte arka planda gösterilen en iyi tasarım sayısı
+# Monte Carlo tolerans analizi: (etiket, varsayılan, girdiler, dağılım, göreli mi)
+monte_carlo_fields = [
+    ("Ön Yük Saçılımı (±%)", "25", ("preload_percent",), "uniform", True),
+    ("Uzunluk Toleransı σ (mm)", "0.1", ("L_shank", "L_thread"), "normal", False),
+    ("Mukavemet CoV (%)", "5", ("yield_strength", "ultimate_strength"), "normal", True),
+    ("Elastisite Modülü CoV (%)", "2", ("E_bolt",), "normal", True),
+    ("Dış Yük CoV (%)", "10", ("F_ext_tensile",), "normal", True),
+]
+monte_carlo_defaults = {"samples": "100000", "seed": "42"}
+# Cıvata deseni: (etiket, BoltEngine yük adı, varsayılan)
+pattern_load_fields = [
+    ("Eksenel Kuvvet Fz (N)", "F_axial", "200000"),
+    ("Kesme Kuvveti Fx (N)", "F_x", "0"),
+    ("Kesme Kuvveti Fy (N)", "F_y", "0"),
+    ("Eğilme Momenti Mx (N·mm)", "M_x", "0"),
+    ("Eğilme Momenti My (N·mm)", "M_y", "0"),
+    ("Burulma Momenti Mz (N·mm)", "M_z", "0"),
+]
+
 # Global değişkenler
 current_material = None
 clamped_parts_frames = []
 parametric_clamped_parts_frames = []  # Parametrik hesaplama için bağımsız parça listesi
-results_history = []
 max_rows = 5
 canvas = None
 para_canvas = None
-parametric_results = []
-analysis_queue = queue.Queue()
-cancel_flag = threading.Event()
+parametric_results = None  # ParametricResults (sütun tabanlı depo)
+analysis_queue = queue.Queue()  # Tarama işlerinin olayları: (olay, iş no, ...)
+# Tekil hesap arka planda çalışır; sonuçlar kuyruktan root.after ile uygulanır.
+# Her girdi değişikliği nesil sayacını artırır, eski nesle ait sonuçlar atılır.
+calc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="single-calc")
+# Monte Carlo ayrı bir iş parçacığında: uzun bir örnekleme canlı yeniden hesapları bekletmez
+mc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="monte-carlo")
+calc_queue = queue.Queue()
+calc_generation = 0
+calc_pending = 0
+calc_polling = False
+calc_poll_ms = 30
+calc_debounce_ms = 300  # Yazarken canlı hesap için bekleme
+live_recalc_job = None
+live_recalc_var = None
+live_result = None  # Canlı hesabın son sonucu (geçmişe eklenmez, tabloda "Canlı" sütunu)
+single_graph = design_graph(bolt_catalog)  # Yalnızca tekil hesap iş parçacığından kullanılır
+dev_timings = StageTimings()  # Geliştirici paneli için aşama süreleri (tarama ve tekil hesap)
+dev_refresh_ms = 500
+dev_refresh_job = None
+dev_tree = None
+dev_summary_label = None
+dev_profile_tree = None
+dev_profile_label = None
+profile_run_var = None  # Geliştirici sekmesindeki "bu çalıştırmayı profille" seçeneği
+dev_profile_rows = []  # Son profillenen çalıştırmanın en pahalı fonksiyonları
 db_path = "parametric_results.db"
+results_dir = "parametric_runs"  # Disk üzerindeki (memmap) parametrik sonuç klasörleri
+results_history = ResultHistory(db_path, max_rows)  # Görünen son hesaplar; eskiler SQLite'a taşınır
+results_columns = []  # Sonuç tablosunda şu an kurulu sütunlar
+# Parametrik taramalar iş kuyruğunda; her işin ilerlemesi, iptali ve sonucu kendine aittir.
+# Biten işlerin depoları bellekte tutulmaz: yalnızca gösterilen depo (parametric_results) kalır,
+# başka bir iş seçilince sonuçları run_id ile veritabanından okunur
+sweep_jobs = JobManager(db_path, os.path.join(os.path.dirname(os.path.abspath(db_path)), results_dir),
+                        notify=lambda event, job, *args: analysis_queue.put((event, job.id) + args), keep_results=False)
+followed_job = None  # İlerleme çubuğu ve sonuç tablosunun izlediği iş no
+jobs_polling = False
+jobs_tree = None
+job_concurrency_var = None
+finished_jobs = []  # Kuyruk boşalınca özetlenecek biten işler
 test_buttons = []
 notebook = None
 bolt_size_var = None
@@ -89,23 +190,51 @@ tensile_force_var = None
 shear_force_var = None
 shear_area_var = None
 safety_basis_var = None
+clamped_model_var = None
+fatigue_criterion_var = None
+load_ratio_var = None
+temperatures_var = None
+sensitivity_var = None
 clamped_parts_frame = None
+parametric_clamped_parts_frame = None
 results_tree = None
 material_tree = None
+material_name_var = None
+material_E_var = None
+material_yield_var = None
+material_ultimate_var = None
+material_poisson_var = None
+material_elongation_var = None
+material_density_var = None
+material_endurance_var = None
+material_expansion_var = None
+material_modulus_coeff_var = None
+stress_strain_figure = None  # Malzeme sekmesindeki tek önizleme grafiği
+stress_strain_canvas = None
+stress_strain_lines = {}  # Malzeme adı -> (sürüm, çizgi); her sürüm bir kez çizilir
+material_table_headers = ["Malzeme Adı", "Elastiklik Modülü (GPa)", "Verim Dayanımı (MPa)", "Nihai Dayanım (MPa)", "Poisson Oranı", "Uzama Yüzdesi (%)", "Yoğunluk (g/cm³)", "Yorulma Dayanımı (MPa)", "Isıl Genleşme (10⁻⁶/K)", "E Sıcaklık Katsayısı (%/100 K)"]
 para_results_tree = None
 param_to_graph_var = None
+param_to_graph_y_var = None
+graph_output_var = None
+graph_aggregate_var = None
 progress_bar = None
 progress_label = None
 optimal_label = None
 para_plot_frame = None
 plot_frame = None
 material_entry = None
+material_pickers = []  # Açık malzeme seçicileri: (combobox, değişken)
+material_picker_limit = 200  # Açılır listede gösterilen en fazla eşleşme
+material_search = {}  # Seçici -> (yazılan arama metni, son tuş zamanı)
+material_search_reset = 1.5  # s
 max_rows_var = None
 param_bolt_size_var = None
 param_shank_length_var = None
 param_thread_length_var = None
 param_preload_percent_var = None
 param_tensile_force_var = None
+param_memmap_var = None
 
 # Dil desteği için sözlük
 dil_sozlugu = {
@@ -125,14 +254,25 @@ dil_sozlugu = {
         "guvenlik_faktoru": "Güvenlik Faktörü",
         "verim": "Verim",
         "nihai": "Nihai",
+        "kavrama_modeli": "Kavrama Modeli",
+        "yorulma": "Yorulma Kriteri",
+        "yuk_orani": "R = Fmin/Fmax",
+        "sicakliklar": "Çalışma Sıcaklıkları (°C)",
+        "sicaklik_ornek": "örn. -40,20,150 veya -40:150:10",
+        "prizmatik": "Prizmatik (E·A/t)",
+        "koni": "Basınç Konisi (VDI 2230)",
         "parca_ekle": "Parça Ekle",
         "hesapla": "Hesapla",
         "temizle": "Temizle",
         "test": "Test",
+        "monte_carlo": "Monte Carlo…",
+        "civata_deseni": "Cıvata Deseni…",
+        "eski_hesaplar": "Eski Hesaplar…",
         "sonuclar_tablosu": "Sonuçlar Tablosu",
         "gosterilecek_hesaplama_sayisi": "Gösterilecek Hesaplama Sayısı:",
         "guncelle": "Güncelle",
         "excel_aktar": "Excel'e Aktar",
+        "diyagram_aktar": "Bağlantı Diyagramlarını Aktar",
         "yuk_carpilma_egrisi": "Yük-Çarpılma Eğrisi",
         "malzeme_kutuphanesi": "Malzeme Kütüphanesi",
         "malzeme_adi": "Malzeme Adı *:",
@@ -142,20 +282,45 @@ dil_sozlugu = {
         "poisson_orani": "Poisson Oranı:",
         "uzama_yuzdesi": "Uzama Yüzdesi (%):",
         "yogunluk": "Yoğunluk (g/cm³):",
+        "yorulma_dayanimi": "Yorulma Dayanımı Se (MPa):",
+        "isil_genlesme": "Isıl Genleşme α (10⁻⁶/K):",
+        "e_sicaklik_katsayisi": "E Sıcaklık Katsayısı (%/100 K):",
         "malzeme_ozellikleri": "Malzeme Özellikleri",
+        "gerilme_onizleme": "Gerilme-Şekil Değiştirme (çoklu seçim karşılaştırır)",
         "kaydet": "Kaydet",
         "yeni": "Yeni",
         "sil": "Sil",
+        "ice_aktar": "İçe Aktar (CSV/Excel)",
         "parametrik_hesaplama": "Parametrik Hesaplama",
         "iptal_et": "İptal Et",
         "en_optimal_kombinasyon": "En Optimal Kombinasyon",
         "parametrik_sonuclar": "Parametrik Sonuçlar",
+        "is_kuyrugu": "İş Kuyruğu",
+        "eszamanli_is": "Eşzamanlı İş:",
+        "sonuclari_goster": "Sonuçları Göster",
+        "kaldir": "Kaldır",
         "grafik_parametresi": "Grafik Parametresi:",
         "grafik_ciz": "Grafik Çiz",
+        "y_ekseni": "Y Ekseni:",
+        "cikti": "Çıktı:",
+        "toplama": "Toplama:",
+        "ortalama": "Ortalama",
+        "maksimum": "Maksimum",
+        "minimum": "Minimum",
+        "isi_haritasi_ciz": "Isı Haritası Çiz",
+        "duyarlilik": "Duyarlılıkları hesapla (analitik türevler)",
+        "canli_hesap": "Yazarken hesapla (canlı)",
+        "son_analizi_yukle": "Son Analizi Yükle",
+        "diske_yaz": "Sonuçları diske yaz (memmap, çok büyük taramalar için)",
+        "diskten_ac": "Diskten Aç",
         "optimal_grafik_ciz": "Optimal Grafik Çiz",
         "parametrik_grafik": "Parametrik Grafik",
         "bilgi": "Bilgi",
         "ayarlar": "Ayarlar",
+        "gelistirici": "Geliştirici",
+        "json_aktar": "JSON'a Aktar",
+        "sifirla": "Sıfırla",
+        "profille": "Sonraki parametrik çalıştırmayı profille (cProfile)",
         "dil_secimi": "Dil Seçimi",
         "gelistirici_modu": "Geliştirici Modu",
         "test_degerleri_yuklendi": "Test değerleri yüklendi. 'Hesapla' butonuna basarak sonuçları görebilirsiniz.",
@@ -177,14 +342,24 @@ dil_sozlugu = {
         "guvenlik_faktoru": "Safety Factor",
         "verim": "Yield",
         "nihai": "Ultimate",
+        "kavrama_modeli": "Clamped Member Model",
+        "yorulma": "Fatigue Criterion",
+        "yuk_orani": "R = Fmin/Fmax",
+        "sicakliklar": "Operating Temperatures (°C)",
+        "sicaklik_ornek": "e.g. -40,20,150 or -40:150:10",
+        "prizmatik": "Prismatic (E·A/t)",
+        "koni": "Pressure Cone (VDI 2230)",
         "parca_ekle": "Add Part",
         "hesapla": "Calculate",
         "temizle": "Clear",
         "test": "Test",
+        "monte_carlo": "Monte Carlo…",
+        "civata_deseni": "Bolt Pattern…",
         "sonuclar_tablosu": "Results Table",
         "gosterilecek_hesaplama_sayisi": "Number of Calculations to Show:",
         "guncelle": "Update",
         "excel_aktar": "Export to Excel",
+        "diyagram_aktar": "Export Joint Diagrams",
         "yuk_carpilma_egrisi": "Load-Deflection Curve",
         "malzeme_kutuphanesi": "Material Library",
         "malzeme_adi": "Material Name *:",
@@ -194,20 +369,46 @@ dil_sozlugu = {
         "poisson_orani": "Poisson's Ratio:",
         "uzama_yuzdesi": "Percent Elongation (%):",
         "yogunluk": "Density (g/cm³):",
+        "yorulma_dayanimi": "Endurance Limit Se (MPa):",
+        "isil_genlesme": "Thermal Expansion α (10⁻⁶/K):",
+        "e_sicaklik_katsayisi": "E Temperature Coefficient (%/100 K):",
         "malzeme_ozellikleri": "Material Properties",
+        "gerilme_onizleme": "Stress-Strain (select several to compare)",
         "kaydet": "Save",
         "yeni": "New",
         "sil": "Delete",
+        "ice_aktar": "Import (CSV/Excel)",
         "parametrik_hesaplama": "Parametric Calculation",
         "iptal_et": "Cancel",
         "en_optimal_kombinasyon": "Most Optimal Combination",
         "parametrik_sonuclar": "Parametric Results",
+        "is_kuyrugu": "Job Queue",
+        "eszamanli_is": "Concurrent Jobs:",
+        "sonuclari_goster": "Show Results",
+        "kaldir": "Remove",
         "grafik_parametresi": "Graph Parameter:",
         "grafik_ciz": "Draw Graph",
+        "y_ekseni": "Y Axis:",
+        "cikti": "Output:",
+        "toplama": "Aggregation:",
+        "ortalama": "Mean",
+        "maksimum": "Maximum",
+        "minimum": "Minimum",
+        "isi_haritasi_ciz": "Draw Heatmap",
+        "duyarlilik": "Compute sensitivities (analytic derivatives)",
+        "canli_hesap": "Recalculate while typing (live)",
+        "eski_hesaplar": "Older Results…",
+        "son_analizi_yukle": "Load Last Run",
+        "diske_yaz": "Write results to disk (memmap, for very large sweeps)",
+        "diskten_ac": "Open From Disk",
         "optimal_grafik_ciz": "Draw Optimal Graph",
         "parametrik_grafik": "Parametric Graph",
         "bilgi": "Information",
         "ayarlar": "Settings",
+        "gelistirici": "Developer",
+        "json_aktar": "Export JSON",
+        "sifirla": "Reset",
+        "profille": "Profile the next parametric run (cProfile)",
         "dil_secimi": "Language Selection",
         "gelistirici_modu": "Developer Mode",
         "test_degerleri_yuklendi": "Test values loaded. Press 'Calculate' to see results.",
@@ -313,17 +514,23 @@ def create_all_frames(dil, dev_mode_flag):
     notebook.add(settings_frame, text=dil_sozlugu[dil]["ayarlar"])
     create_settings_frame(settings_frame, dil, dev_mode)
 
+    # Geliştirici sekmesi (yalnızca geliştirici modunda)
+    if dev_mode:
+        dev_frame = ttk.Frame(notebook)
+        notebook.add(dev_frame, text=dil_sozlugu[dil]["gelistirici"])
+        create_dev_frame(dev_frame, dil)
+
     toggle_dev_mode()
 
 # Hesaplama sekmesi oluşturma
 def create_calc_frame(parent, dil):
-    global bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, shear_area_var, safety_basis_var, clamped_parts_frame, results_tree, plot_frame, material_entry, max_rows_var, test_buttons
+    global live_recalc_var, sensitivity_var, bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, shear_area_var, safety_basis_var, clamped_model_var, fatigue_criterion_var, load_ratio_var, temperatures_var, clamped_parts_frame, results_tree, plot_frame, material_entry, max_rows_var, test_buttons
     input_frame = ttk.LabelFrame(parent, text=dil_sozlugu[dil]["parametre_tanimlama"], padding=5)
     input_frame.pack(side="left", fill='y', padx=5, pady=5)
 
     tk.Label(input_frame, text=dil_sozlugu[dil]["civata_boyutu"]).grid(row=0, column=0, padx=10, pady=5, sticky="e")
     bolt_size_var = tk.StringVar()
-    bolt_size_entry = ttk.Combobox(input_frame, textvariable=bolt_size_var, values=list(bolt_sizes.keys()), width=15)
+    bolt_size_entry = ttk.Combobox(input_frame, textvariable=bolt_size_var, values=bolt_catalog.names, width=15)
     bolt_size_entry.grid(row=0, column=1, padx=10, pady=5)
     ToolTip(bolt_size_entry, dil_sozlugu[dil]["civata_boyutu"])
 
@@ -337,7 +544,7 @@ def create_calc_frame(parent, dil):
 
     tk.Label(input_frame, text=dil_sozlugu[dil]["malzeme"]).grid(row=3, column=0, padx=10, pady=5, sticky="e")
     material_var = tk.StringVar(value='Steel')
-    material_entry = ttk.Combobox(input_frame, textvariable=material_var, values=list(materials.keys()), width=18, state="readonly")
+    material_entry = create_material_picker(input_frame, material_var, width=18)
     material_entry.grid(row=3, column=1, padx=10, pady=5)
 
     tk.Label(input_frame, text=dil_sozlugu[dil]["on_yukleme_yuzdesi"]).grid(row=4, column=0, padx=10, pady=5, sticky="e")
@@ -364,17 +571,49 @@ def create_calc_frame(parent, dil):
     ttk.Radiobutton(safety_frame, text=dil_sozlugu[dil]["verim"], variable=safety_basis_var, value="Yield").pack(side="left", padx=2)
     ttk.Radiobutton(safety_frame, text=dil_sozlugu[dil]["nihai"], variable=safety_basis_var, value="Ultimate").pack(side="left", padx=2)
 
+    model_frame = ttk.LabelFrame(input_frame, text=dil_sozlugu[dil]["kavrama_modeli"], padding=2)
+    model_frame.grid(row=9, column=0, columnspan=2, pady=5)
+    clamped_model_var = tk.StringVar(value="Prismatic")
+    ttk.Radiobutton(model_frame, text=dil_sozlugu[dil]["prizmatik"], variable=clamped_model_var, value="Prismatic").pack(side="left", padx=2)
+    ttk.Radiobutton(model_frame, text=dil_sozlugu[dil]["koni"], variable=clamped_model_var, value="Cone").pack(side="left", padx=2)
+
+    fatigue_frame = ttk.LabelFrame(input_frame, text=dil_sozlugu[dil]["yorulma"], padding=2)
+    fatigue_frame.grid(row=10, column=0, columnspan=2, pady=5)
+    fatigue_criterion_var = tk.StringVar(value="Goodman")
+    for criterion in fatigue_criteria:
+        ttk.Radiobutton(fatigue_frame, text=criterion, variable=fatigue_criterion_var, value=criterion).pack(side="left", padx=2)
+    tk.Label(fatigue_frame, text=dil_sozlugu[dil]["yuk_orani"]).pack(side="left", padx=2)
+    load_ratio_var = tk.StringVar(value="0")
+    tk.Entry(fatigue_frame, textvariable=load_ratio_var, width=6).pack(side="left", padx=2)
+
+    thermal_frame = ttk.LabelFrame(input_frame, text=dil_sozlugu[dil]["sicakliklar"], padding=2)
+    thermal_frame.grid(row=11, column=0, columnspan=2, pady=5)
+    temperatures_var = tk.StringVar()
+    tk.Entry(thermal_frame, textvariable=temperatures_var, width=20).pack(side="left", padx=2)
+    tk.Label(thermal_frame, text=dil_sozlugu[dil]["sicaklik_ornek"], fg="gray").pack(side="left", padx=2)
+
     clamped_parts_frame = ttk.Frame(input_frame)
-    clamped_parts_frame.grid(row=9, column=0, columnspan=2, pady=5)
-    ttk.Button(input_frame, text=dil_sozlugu[dil]["parca_ekle"], command=add_clamped_part, style="Accent.TButton").grid(row=10, column=0, columnspan=2, pady=5)
+    clamped_parts_frame.grid(row=12, column=0, columnspan=2, pady=5)
+    ttk.Button(input_frame, text=dil_sozlugu[dil]["parca_ekle"], command=add_clamped_part, style="Accent.TButton").grid(row=13, column=0, columnspan=2, pady=5)
 
     button_frame = ttk.Frame(input_frame)
-    button_frame.grid(row=11, column=0, columnspan=2, pady=10)
+    button_frame.grid(row=14, column=0, columnspan=2, pady=10)
     ttk.Button(button_frame, text=dil_sozlugu[dil]["hesapla"], command=calculate_stiffness, style="Accent.TButton").pack(side="left", padx=5)
     ttk.Button(button_frame, text=dil_sozlugu[dil]["temizle"], command=clear_inputs, style="Danger.TButton").pack(side="left", padx=5)
     test_button = ttk.Button(button_frame, text=dil_sozlugu[dil]["test"], command=test_values, style="Test.TButton")
     test_button.pack(side="left", padx=5)
+    ttk.Button(button_frame, text=dil_sozlugu[dil]["monte_carlo"], command=open_monte_carlo, style="TButton").pack(side="left", padx=5)
+    ttk.Button(button_frame, text=dil_sozlugu[dil]["civata_deseni"], command=open_bolt_pattern, style="TButton").pack(side="left", padx=5)
     test_buttons = [test_button]
+    sensitivity_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(input_frame, text=dil_sozlugu[dil]["duyarlilik"], variable=sensitivity_var).grid(row=15, column=0, columnspan=2, pady=2)
+    live_recalc_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(input_frame, text=dil_sozlugu[dil]["canli_hesap"], variable=live_recalc_var).grid(row=16, column=0, columnspan=2, pady=2)
+    live_recalc_var.trace_add("write", on_live_recalc_toggled)
+    for var in (bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var,
+                shear_force_var, shear_area_var, safety_basis_var, clamped_model_var, fatigue_criterion_var, load_ratio_var,
+                temperatures_var, sensitivity_var):
+        var.trace_add("write", schedule_live_recalc)
 
     right_frame = ttk.Frame(parent)
     right_frame.pack(side="right", fill='both', expand=True, padx=10, pady=5)
@@ -388,6 +627,7 @@ def create_calc_frame(parent, dil):
     tk.Entry(rows_frame, textvariable=max_rows_var, width=5).pack(side="left", padx=5)
     ttk.Button(rows_frame, text=dil_sozlugu[dil]["guncelle"], command=update_results_table).pack(side="left", padx=5)
     ttk.Button(rows_frame, text=dil_sozlugu[dil]["excel_aktar"], command=export_to_excel, style="Export.TButton").pack(side="left", padx=5)
+    ttk.Button(rows_frame, text=dil_sozlugu[dil]["eski_hesaplar"], command=open_history).pack(side="left", padx=5)
     ttk.Button(rows_frame, text=dil_sozlugu[dil]["temizle"], command=clear_results, style="Danger.TButton").pack(side="left", padx=5)
 
     results_tree = ttk.Treeview(result_frame, height=7, show="headings")
@@ -401,7 +641,7 @@ def create_calc_frame(parent, dil):
 
 # Malzeme Kütüphanesi sekmesi oluşturma
 def create_material_frame(parent, dil):
-    global material_tree
+    global material_tree, material_name_var, material_E_var, material_yield_var, material_ultimate_var, material_poisson_var, material_elongation_var, material_density_var, material_endurance_var, material_expansion_var, material_modulus_coeff_var, stress_strain_figure, stress_strain_canvas, stress_strain_lines
     material_input_frame = ttk.Frame(parent)
     material_input_frame.pack(fill='both', expand=True, padx=5, pady=5)
 
@@ -437,9 +677,34 @@ def create_material_frame(parent, dil):
     material_density_var = tk.StringVar()
     tk.Entry(input_subframe, textvariable=material_density_var, width=20).grid(row=6, column=1, padx=5, pady=2)
 
+    # Boş bırakılırsa yorulma hesabında haddelenmiş diş için 0.156·Su tahmini kullanılır
+    tk.Label(input_subframe, text=dil_sozlugu[dil]["yorulma_dayanimi"]).grid(row=7, column=0, padx=5, pady=2, sticky="e")
+    material_endurance_var = tk.StringVar()
+    tk.Entry(input_subframe, textvariable=material_endurance_var, width=20).grid(row=7, column=1, padx=5, pady=2)
+
+    tk.Label(input_subframe, text=dil_sozlugu[dil]["isil_genlesme"]).grid(row=8, column=0, padx=5, pady=2, sticky="e")
+    material_expansion_var = tk.StringVar()
+    tk.Entry(input_subframe, textvariable=material_expansion_var, width=20).grid(row=8, column=1, padx=5, pady=2)
+
+    tk.Label(input_subframe, text=dil_sozlugu[dil]["e_sicaklik_katsayisi"]).grid(row=9, column=0, padx=5, pady=2, sticky="e")
+    material_modulus_coeff_var = tk.StringVar()
+    tk.Entry(input_subframe, textvariable=material_modulus_coeff_var, width=20).grid(row=9, column=1, padx=5, pady=2)
+
+    preview_frame = ttk.LabelFrame(input_subframe, text=dil_sozlugu[dil]["gerilme_onizleme"], padding=5)
+    preview_frame.grid(row=0, column=2, rowspan=10, padx=10, pady=2, sticky="nsew")
+    if stress_strain_figure is not None:
+        plt.close(stress_strain_figure)
+    stress_strain_figure, ax = plt.subplots(figsize=(5, 2.6))
+    ax.set_xlabel('Strain (mm/mm)')
+    ax.set_ylabel('Stress (MPa)')
+    ax.grid(True)
+    stress_strain_lines = {}
+    stress_strain_canvas = FigureCanvasTkAgg(stress_strain_figure, master=preview_frame)
+    stress_strain_canvas.get_tk_widget().pack(fill='both', expand=True)
+
     material_tree_frame = ttk.LabelFrame(material_input_frame, text=dil_sozlugu[dil]["malzeme_ozellikleri"], padding=5)
     material_tree_frame.pack(fill='both', expand=True, pady=5)
-    material_tree = ttk.Treeview(material_tree_frame, show="headings")
+    material_tree = ttk.Treeview(material_tree_frame, show="headings", selectmode="extended")
     material_tree.pack(fill='both', expand=True)
     scrollbar = ttk.Scrollbar(material_tree_frame, orient="vertical", command=material_tree.yview)
     scrollbar.pack(side="right", fill="y")
@@ -452,10 +717,11 @@ def create_material_frame(parent, dil):
     ttk.Button(material_button_frame, text=dil_sozlugu[dil]["kaydet"], command=save_material, style="Accent.TButton").pack(side="left", padx=5)
     ttk.Button(material_button_frame, text=dil_sozlugu[dil]["yeni"], command=new_material, style="TButton").pack(side="left", padx=5)
     ttk.Button(material_button_frame, text=dil_sozlugu[dil]["sil"], command=delete_material, style="Danger.TButton").pack(side="left", padx=5)
+    ttk.Button(material_button_frame, text=dil_sozlugu[dil]["ice_aktar"], command=import_materials, style="Export.TButton").pack(side="left", padx=5)
 
 # Parametrik Hesaplama sekmesi oluşturma
 def create_parametric_frame(parent, dil):
-    global para_results_tree, progress_bar, progress_label, optimal_label, para_plot_frame, param_to_graph_var, param_bolt_size_var, param_shank_length_var, param_thread_length_var, param_preload_percent_var, param_tensile_force_var, test_buttons, parametric_clamped_parts_frames
+    global para_results_tree, progress_bar, progress_label, optimal_label, para_plot_frame, param_to_graph_var, param_to_graph_y_var, graph_output_var, graph_aggregate_var, param_memmap_var, param_bolt_size_var, param_shank_length_var, param_thread_length_var, param_preload_percent_var, param_tensile_force_var, test_buttons, parametric_clamped_parts_frames, parametric_clamped_parts_frame, jobs_tree, job_concurrency_var
     para_input_frame = ttk.LabelFrame(parent, text=dil_sozlugu[dil]["parametre_tanimlama"], padding=5)
     para_input_frame.pack(side="left", fill='y', padx=5, pady=5)
 
@@ -491,6 +757,9 @@ def create_parametric_frame(parent, dil):
     parametric_clamped_parts_frame.pack(fill='x', pady=2)
     ttk.Button(clamped_frame, text=dil_sozlugu[dil]["parca_ekle"], command=lambda: add_param_clamped_part(parametric_clamped_parts_frame), style="Accent.TButton").pack(pady=5)
 
+    param_memmap_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(para_input_frame, text=dil_sozlugu[dil]["diske_yaz"], variable=param_memmap_var).grid(row=6, column=0, columnspan=3, pady=2)
+
     button_frame = ttk.Frame(para_input_frame)
     button_frame.grid(row=7, column=0, columnspan=3, pady=10)
     ttk.Button(button_frame, text=dil_sozlugu[dil]["hesapla"], command=run_parametric_analysis, style="Accent.TButton").pack(side="left", padx=5)
@@ -504,6 +773,24 @@ def create_parametric_frame(parent, dil):
     progress_label = ttk.Label(parent, text="Hesaplama: 0% tamamlandı")
     progress_label.pack(pady=5)
 
+    jobs_frame = ttk.LabelFrame(parent, text=dil_sozlugu[dil]["is_kuyrugu"], padding=5)
+    jobs_frame.pack(fill='x', padx=10, pady=5)
+    columns = ["İş", "Tarama", "Durum", "İlerleme", "Süre (s)", "Çalıştırma"]
+    jobs_tree = ttk.Treeview(jobs_frame, columns=columns, show="headings", height=4)
+    for col in columns:
+        jobs_tree.heading(col, text=col, anchor="center")
+        jobs_tree.column(col, anchor="w" if col == "Tarama" else "center", width=320 if col == "Tarama" else 90)
+    jobs_tree.pack(fill='x')
+    jobs_tree.bind("<<TreeviewSelect>>", on_job_selected)
+    jobs_tree.bind("<Double-1>", lambda _: show_job_results())
+    jobs_button_frame = ttk.Frame(jobs_frame)
+    jobs_button_frame.pack(pady=5)
+    tk.Label(jobs_button_frame, text=dil_sozlugu[dil]["eszamanli_is"]).pack(side="left", padx=5)
+    job_concurrency_var = tk.StringVar(value=str(sweep_jobs.concurrency))
+    ttk.Spinbox(jobs_button_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=job_concurrency_var, width=4, command=set_job_concurrency).pack(side="left", padx=5)
+    ttk.Button(jobs_button_frame, text=dil_sozlugu[dil]["sonuclari_goster"], command=show_job_results).pack(side="left", padx=5)
+    ttk.Button(jobs_button_frame, text=dil_sozlugu[dil]["kaldir"], command=remove_finished_jobs).pack(side="left", padx=5)
+
     optimal_frame = ttk.LabelFrame(parent, text=dil_sozlugu[dil]["en_optimal_kombinasyon"], padding=5)
     optimal_frame.pack(side="right", fill='y', padx=5, pady=5)
     optimal_label = ttk.Label(optimal_frame, text="En Optimal Kombinasyon: Henüz hesaplanmadı")
@@ -516,16 +803,36 @@ def create_parametric_frame(parent, dil):
     para_scrollbar = ttk.Scrollbar(para_results_frame, orient="horizontal", command=para_results_tree.xview)
     para_scrollbar.pack(side="bottom", fill="x")
     para_results_tree.configure(xscrollcommand=para_scrollbar.set)
-    ttk.Button(para_results_frame, text=dil_sozlugu[dil]["excel_aktar"], command=export_parametric_to_excel, style="Export.TButton").pack(pady=5)
+    para_export_frame = ttk.Frame(para_results_frame)
+    para_export_frame.pack(pady=5)
+    ttk.Button(para_export_frame, text=dil_sozlugu[dil]["excel_aktar"], command=export_parametric_to_excel, style="Export.TButton").pack(side="left", padx=5)
+    ttk.Button(para_export_frame, text=dil_sozlugu[dil]["diyagram_aktar"], command=export_joint_diagrams, style="Export.TButton").pack(side="left", padx=5)
+    ttk.Button(para_export_frame, text=dil_sozlugu[dil]["son_analizi_yukle"], command=load_last_parametric_run).pack(side="left", padx=5)
+    ttk.Button(para_export_frame, text=dil_sozlugu[dil]["diskten_ac"], command=open_parametric_run_from_disk).pack(side="left", padx=5)
 
     para_graph_frame = ttk.Frame(para_results_frame)
     para_graph_frame.pack(fill='x', pady=5)
     tk.Label(para_graph_frame, text=dil_sozlugu[dil]["grafik_parametresi"]).pack(side="left", padx=5)
+    axis_labels = list(parametric_axis_options(dil).keys())
     param_to_graph_var = tk.StringVar()
-    ttk.Combobox(para_graph_frame, textvariable=param_to_graph_var, values=[dil_sozlugu[dil]["civata_boyutu"].rstrip(":"), dil_sozlugu[dil]["govde_uzunlugu"].rstrip(":"), dil_sozlugu[dil]["disli_kisim_uzunlugu"].rstrip(":"), dil_sozlugu[dil]["on_yukleme_yuzdesi"].rstrip(":"), dil_sozlugu[dil]["cekme_kuvveti"].rstrip(":")], width=20).pack(side="left", padx=5)
+    ttk.Combobox(para_graph_frame, textvariable=param_to_graph_var, values=axis_labels, width=20).pack(side="left", padx=5)
     ttk.Button(para_graph_frame, text=dil_sozlugu[dil]["grafik_ciz"], command=draw_parametric_graph).pack(side="left", padx=5)
     ttk.Button(para_graph_frame, text=dil_sozlugu[dil]["optimal_grafik_ciz"], command=draw_optimal_graph).pack(side="left", padx=5)
 
+    # Yanıt yüzeyi (iki eksenli ısı haritası) seçimleri
+    surface_frame = ttk.Frame(para_results_frame)
+    surface_frame.pack(fill='x', pady=5)
+    tk.Label(surface_frame, text=dil_sozlugu[dil]["y_ekseni"]).pack(side="left", padx=5)
+    param_to_graph_y_var = tk.StringVar()
+    ttk.Combobox(surface_frame, textvariable=param_to_graph_y_var, values=axis_labels, width=20).pack(side="left", padx=5)
+    tk.Label(surface_frame, text=dil_sozlugu[dil]["cikti"]).pack(side="left", padx=5)
+    graph_output_var = tk.StringVar(value="Güvenlik Faktörü")
+    ttk.Combobox(surface_frame, textvariable=graph_output_var, values=list(parametric_outputs), width=25, state="readonly").pack(side="left", padx=5)
+    tk.Label(surface_frame, text=dil_sozlugu[dil]["toplama"]).pack(side="left", padx=5)
+    graph_aggregate_var = tk.StringVar(value=dil_sozlugu[dil]["ortalama"])
+    ttk.Combobox(surface_frame, textvariable=graph_aggregate_var, values=[dil_sozlugu[dil]["ortalama"], dil_sozlugu[dil]["maksimum"], dil_sozlugu[dil]["minimum"]], width=10, state="readonly").pack(side="left", padx=5)
+    ttk.Button(surface_frame, text=dil_sozlugu[dil]["isi_haritasi_ciz"], command=draw_response_surface).pack(side="left", padx=5)
+
     para_plot_frame = ttk.LabelFrame(parent, text=dil_sozlugu[dil]["parametrik_grafik"], padding=5)
     para_plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
@@ -560,116 +867,595 @@ def create_settings_frame(parent, dil, dev_mode):
 
     ttk.Button(settings_frame, text=dil_sozlugu[dil]["kaydet"], command=save_settings, style="Accent.TButton").grid(row=3, column=0, columnspan=2, pady=10)
 
-# Mevcut fonksiyonlar
-def compute_stiffness(bolt_size, L_shank, L_thread, material, preload_percent, F_ext_tensile, F_ext_shear, clamped_parts):
+# Geliştirici sekmesi: aşama süreleri, hız, kuyruk derinliği ve bellek (canlı)
+def create_dev_frame(parent, dil):
+    global dev_tree, dev_summary_label, dev_refresh_job, dev_profile_tree, dev_profile_label, profile_run_var
+    dev_summary_label = ttk.Label(parent, text="", justify="left")
+    dev_summary_label.pack(fill='x', padx=5, pady=5)
+    columns = ["Aşama", "Süre (s)", "Çağrı", "Pay (%)"]
+    dev_tree = ttk.Treeview(parent, columns=columns, show="headings", height=10)
+    for col in columns:
+        dev_tree.heading(col, text=col, anchor="center")
+        dev_tree.column(col, anchor="center", width=120)
+    dev_tree.pack(fill='x', padx=5, pady=5)
+    button_frame = ttk.Frame(parent)
+    button_frame.pack(pady=5)
+    ttk.Button(button_frame, text=dil_sozlugu[dil]["json_aktar"], command=export_dev_timings, style="Export.TButton").pack(side="left", padx=5)
+    ttk.Button(button_frame, text=dil_sozlugu[dil]["sifirla"], command=lambda: [panel_timings().reset(), refresh_dev_panel(False)], style="Danger.TButton").pack(side="left", padx=5)
+
+    profile_run_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(parent, text=dil_sozlugu[dil]["profille"], variable=profile_run_var).pack(anchor="w", padx=5, pady=2)
+    dev_profile_label = ttk.Label(parent, text="")
+    dev_profile_label.pack(fill='x', padx=5)
+    columns = ["Fonksiyon", "Çağrı", "Öz Süre (s)", "Kümülatif (s)"]
+    dev_profile_tree = ttk.Treeview(parent, columns=columns, show="headings", height=12)
+    for col in columns:
+        dev_profile_tree.heading(col, text=col, anchor="center")
+        dev_profile_tree.column(col, anchor="w" if col == "Fonksiyon" else "center", width=360 if col == "Fonksiyon" else 100)
+    dev_profile_tree.pack(fill='both', expand=True, padx=5, pady=5)
+    show_profile(None, dev_profile_rows)
+    if dev_refresh_job:
+        root.after_cancel(dev_refresh_job)
+    refresh_dev_panel()
+
+def panel_timings():
+    # Geliştirici paneli izlenen taramanın sürelerini, tarama yoksa tekil hesap/çizim sürelerini gösterir
+    job = sweep_jobs.get(followed_job)
+    return job.timings if job else dev_timings
+
+def refresh_dev_panel(repeat=True):
+    global dev_refresh_job
+    if not dev_tree or not dev_tree.winfo_exists():
+        dev_refresh_job = None
+        return
+    snapshot = panel_timings().snapshot()
+    dev_tree.delete(*dev_tree.get_children())
+    for name, stage in snapshot["stages"].items():
+        dev_tree.insert("", "end", values=(name, f"{stage['seconds']:.4f}", stage["calls"], f"{stage['share'] * 100:.1f}"))
+    gauges = snapshot["gauges"]
+    memory = gauges.get("peak_memory_mb")
+    dev_summary_label.config(text=(
+        f"Geçen süre: {snapshot['elapsed']:.2f} s   Kombinasyon: {snapshot['counters'].get('combinations', 0)}\n"
+        f"Hız: {snapshot['throughput']:.3g} komb./s (hesap: {snapshot['compute_throughput']:.3g} komb./s)\n"
+        f"Kuyruk derinliği: {gauges.get('queue_depth', 0)}   Depo: {gauges.get('store_mb', 0):.1f} MB   "
+        f"Tepe bellek: {'-' if memory is None else f'{memory:.0f} MB'}\n"
+        f"Tekil hesap düğümleri: {', '.join(f'{name} {count}' for name, count in single_graph.evaluations.items())}"))
+    if repeat:
+        dev_refresh_job = root.after(dev_refresh_ms, refresh_dev_panel)
+
+def show_profile(path, rows):
+    global dev_profile_rows
+    dev_profile_rows = rows
+    if not dev_profile_tree or not dev_profile_tree.winfo_exists():
+        return
+    if path:
+        dev_profile_label.config(text=f"Profil: {path}")
+    dev_profile_tree.delete(*dev_profile_tree.get_children())
+    for row in rows:
+        dev_profile_tree.insert("", "end", values=(row["function"], row["calls"], f"{row['tottime']:.4f}", f"{row['cumtime']:.4f}"))
+
+def export_dev_timings():
+    file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+    if not file_path:
+        return
     try:
-        if not bolt_size or bolt_size not in bolt_sizes:
-            raise ValueError("Geçerli bir cıvata boyutu seçin.")
-        L_shank = float(L_shank or 0)
-        if L_shank <= 0:
-            raise ValueError("Gövde uzunluğu 0'dan büyük olmalıdır.")
-        L_thread = float(L_thread or 0)
-        if L_thread < 0:
-            raise ValueError("Dişli kısım uzunluğu negatif olamaz.")
-        if not material or material not in materials:
-            raise ValueError("Geçerli bir malzeme seçin.")
-        E_bolt = materials[material]['E']
-        yield_strength = materials[material]['yield_strength']
-        ultimate_strength = materials[material]['ultimate_strength']
-        A_shank = bolt_sizes[bolt_size]['A_shank']
-        A_thread = bolt_sizes[bolt_size]['A_thread']
-        preload_percent = float(preload_percent or 0)
-        if not 0 <= preload_percent <= 100:
-            raise ValueError("Ön yükleme yüzdesi 0-100 arasında olmalıdır.")
-        F_preload = (preload_percent / 100) * yield_strength * A_thread
-        F_ext_tensile = float(F_ext_tensile or 0)
-        F_ext_shear = float(F_ext_shear or 0)
-
-        k_shank = (E_bolt * A_shank) / L_shank
-        if L_thread > 0:
-            k_thread = (E_bolt * A_thread) / L_thread
-            k_bolt = 1 / (1/k_shank + 1/k_thread)
-        else:
-            k_bolt = k_shank
+        panel_timings().to_json(file_path)
+    except OSError as e:
+        messagebox.showerror("Hata", f"Dosya kaydedilemedi: {e}")
+        return
+    messagebox.showinfo("Bilgi", "Aşama süreleri kaydedildi.")
 
-        k_clamped_total = 0
-        total_thickness = 0
-        for part in clamped_parts:
+# Mevcut fonksiyonlar
+def read_clamped_parts(clamped_parts):
+    # Arayüz değişkenlerinden düz parça listesi (iş parçacıklarına güvenle aktarılabilir).
+    # Tüm parçalar tek geçişte denetlenir; hatalar parça numarasıyla tek mesajda toplanır.
+    parts, errors = [], []
+    for number, part in enumerate(clamped_parts, start=1):
+        problems = []
+        try:
             thickness = float(part['thickness_var'].get())
             if thickness <= 0:
-                raise ValueError("Parça kalınlığı 0'dan büyük olmalıdır.")
-            material_part = part['material_var'].get()
-            E_part = materials[material_part]['E']
+                problems.append("kalınlık 0'dan büyük olmalıdır")
+        except ValueError:
+            problems.append("kalınlık sayısal olmalıdır")
+        material_part = part['material_var'].get()
+        if material_part not in materials:
+            problems.append("geçerli bir malzeme seçin")
+        try:
             area = float(part['area_var'].get())
             if area <= 0:
-                raise ValueError("Parça alanı 0'dan büyük olmalıdır.")
-            total_thickness += thickness
-            k_part = (E_part * area) / thickness
-            k_clamped_total = k_part if k_clamped_total == 0 else 1 / (1/k_clamped_total + 1/k_part)
-
-        if total_thickness == 0:
-            raise ValueError("En az bir sıkıştırılan parça eklenmelidir.")
-
-        delta_F_bolt = (k_bolt / (k_bolt + k_clamped_total)) * F_ext_tensile
-        F_bolt_total = F_preload + delta_F_bolt
-        F_clamped = F_ext_tensile - delta_F_bolt
-
-        delta_L_bolt = F_bolt_total / k_bolt
-        delta_L_clamped = F_clamped / k_clamped_total if k_clamped_total > 0 else 0
-
-        safety_basis = safety_basis_var.get()
-        max_load = yield_strength * A_thread if safety_basis == "Yield" else ultimate_strength * A_thread
-        safety_factor = max_load / F_bolt_total if F_bolt_total > 0 else float('inf')
-
-        shear_area = shear_area_var.get()
-        shear_area_value = A_shank if shear_area == "Shank" else A_thread
-        shear_stress = F_ext_shear / shear_area_value
-
-        result = {
-            "Toplam Cıvata Sertliği (N/mm)": f"{k_bolt:.2f}",
-            "Toplam Kavrama Sertliği (N/mm)": f"{k_clamped_total:.2f}",
-            "Toplam Cıvata Kuvveti (N)": f"{F_bolt_total:.2f}",
-            "Cıvata Çarpılma (mm)": f"{delta_L_bolt:.4f}",
-            "Kavrama Çarpılma (mm)": f"{delta_L_clamped:.4f}",
-            "Kesme Gerilimi (MPa)": f"{shear_stress:.2f}",
-            f"Güvenlik Faktörü ({safety_basis})": f"{safety_factor:.2f}"
-        }
-        return result
+                problems.append("alan 0'dan büyük olmalıdır")
+        except ValueError:
+            problems.append("alan sayısal olmalıdır")
+        if problems:
+            errors.append(f"Parça {number}: {', '.join(problems)}.")
+            continue
+        props = materials[material_part]
+        parts.append({'type': part['type_var'].get(), 'thickness': thickness, 'material': material_part,
+                      'E': props['E'], 'area': area, 'thermal_expansion': props.get('thermal_expansion'),
+                      'modulus_temp_coeff': props.get('modulus_temp_coeff')})
+    if errors:
+        raise ValueError("\n".join(errors))
+    if not parts:
+        raise ValueError("En az bir sıkıştırılan parça eklenmelidir.")
+    return parts
+
+def parse_value_list(text, message):
+    # "-40,20,150" veya "-40:150:10" (başlangıç:bitiş:adım) biçimleri
+    values = []
+    try:
+        for token in filter(None, (t.strip() for t in (text or "").split(','))):
+            if ':' in token:
+                start, stop, step = (float(v) for v in token.split(':'))
+                if step <= 0:
+                    raise ValueError
+                values.extend(np.arange(start, stop + step / 2, step))
+            else:
+                values.append(float(token))
+    except ValueError:
+        raise ValueError(message)
+    return values
+
+def parse_temperatures(text=None):
+    # Boşsa ısıl hesap yapılmaz
+    text = temperatures_var.get() if text is None else text
+    values = parse_value_list(text, "Sıcaklıklar sayı listesi veya başlangıç:bitiş:adım biçiminde olmalıdır.")
+    if any(t < -273.15 for t in values):
+        raise ValueError("Sıcaklık mutlak sıfırın altında olamaz.")
+    return np.unique(values)
+
+def read_fatigue_inputs(fatigue_criterion=None, load_ratio=None):
+    fatigue_criterion = fatigue_criterion or fatigue_criterion_var.get()
+    if fatigue_criterion not in fatigue_criteria:
+        raise ValueError("Geçerli bir yorulma kriteri seçin.")
+    load_ratio = float(load_ratio if load_ratio is not None else load_ratio_var.get() or 0)
+    if not -1 <= load_ratio <= 1:
+        raise ValueError("Yük oranı R -1 ile 1 arasında olmalıdır.")
+    return fatigue_criterion, load_ratio
+
+def read_design_values(bolt_size, L_shank, L_thread, material, preload_percent, F_ext_tensile, F_ext_shear, clamped_parts, safety_basis=None, shear_area=None, clamped_model=None, fatigue_criterion=None, load_ratio=None, temperatures=None):
+    # Girdileri doğrular ve design_inputs / DesignGraph anahtarlarıyla düz bir sözlük döndürür; hatalı girdide ValueError
+    if not bolt_size or bolt_size not in bolt_catalog:
+        raise ValueError("Geçerli bir cıvata boyutu seçin.")
+    L_shank = float(L_shank or 0)
+    if L_shank <= 0:
+        raise ValueError("Gövde uzunluğu 0'dan büyük olmalıdır.")
+    L_thread = float(L_thread or 0)
+    if L_thread < 0:
+        raise ValueError("Dişli kısım uzunluğu negatif olamaz.")
+    if not material or material not in materials:
+        raise ValueError("Geçerli bir malzeme seçin.")
+    preload_percent = float(preload_percent or 0)
+    if not 0 <= preload_percent <= 100:
+        raise ValueError("Ön yükleme yüzdesi 0-100 arasında olmalıdır.")
+    F_ext_tensile = float(F_ext_tensile or 0)
+    F_ext_shear = float(F_ext_shear or 0)
+    parts = read_clamped_parts(clamped_parts)
+
+    safety_basis = safety_basis or safety_basis_var.get()
+    shear_area = shear_area or shear_area_var.get()
+    clamped_model = clamped_model or clamped_model_var.get()
+    if clamped_model not in clamped_models:
+        raise ValueError("Geçerli bir kavrama modeli seçin.")
+    fatigue_criterion, load_ratio = read_fatigue_inputs(fatigue_criterion, load_ratio)
+    temperatures = parse_temperatures(temperatures)
+    props = {**materials[material], 'name': material}
+    if len(temperatures):
+        check_thermal_properties(parts, props)
+    return {'bolt_size': bolt_size, 'L_shank': L_shank, 'L_thread': L_thread, 'props': props,
+            'preload_percent': preload_percent, 'F_ext_tensile': F_ext_tensile, 'F_ext_shear': F_ext_shear, 'parts': parts,
+            'safety_basis': safety_basis, 'shear_area': shear_area, 'clamped_model': clamped_model,
+            'fatigue_criterion': fatigue_criterion, 'load_ratio': load_ratio, 'temperatures': temperatures}
+
+def read_design(*args, **kwargs):
+    # Doğrulanmış girdileri compute_stiffness_batch argümanlarına çevirir
+    return design_inputs(bolt_catalog, **read_design_values(*args, **kwargs))
+
+def compute_stiffness(bolt_size, L_shank, L_thread, material, preload_percent, F_ext_tensile, F_ext_shear, clamped_parts, safety_basis=None, shear_area=None, sensitivities=False, clamped_model=None, fatigue_criterion=None, load_ratio=None, temperatures=None):
+    try:
+        design = read_design(bolt_size, L_shank, L_thread, material, preload_percent, F_ext_tensile, F_ext_shear, clamped_parts,
+                             safety_basis, shear_area, clamped_model, fatigue_criterion, load_ratio, temperatures)
+        return evaluate_design(design, sensitivities)
     except ValueError as e:
         return {'error': str(e)}
 
-def calculate_stiffness():
-    global canvas, bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, clamped_parts_frames
-    result = compute_stiffness(
+def evaluate_design(design, sensitivities=False):
+    # Tk değişkenlerine dokunmaz; arka plan iş parçacığında çalışabilir
+    out = compute_stiffness_batch(**design['inputs'], **design['options'], sensitivities=sensitivities, thermal=design['thermal'])
+    return format_result(out, design['options']['safety_basis'], design['options']['fatigue_criterion'], design['temperatures'], sensitivities)
+
+def evaluate_design_values(values, sensitivities=False):
+    # Bağımlılık grafiği üzerinden: yalnızca değişen girdilere bağlı düğümler yeniden hesaplanır
+    single_graph.update(dict(values, temperatures=tuple(values['temperatures']), sensitivities=bool(sensitivities)))
+    out = single_graph.get("outputs")
+    return format_result(out, values['safety_basis'], values['fatigue_criterion'], values['temperatures'], sensitivities)
+
+def format_result(out, safety_basis, fatigue_criterion, temperatures, sensitivities=False):
+    out = {name: float(value) for name, value in out.items()}
+
+    result = {
+        "Toplam Cıvata Sertliği (N/mm)": f"{out['stiffness']:.2f}",
+        "Toplam Kavrama Sertliği (N/mm)": f"{out['clamped_stiffness']:.2f}",
+        "Toplam Cıvata Kuvveti (N)": f"{out['bolt_force']:.2f}",
+        "Cıvata Çarpılma (mm)": f"{out['bolt_deflection']:.4f}",
+        "Kavrama Çarpılma (mm)": f"{out['clamped_deflection']:.4f}",
+        "Kesme Gerilimi (MPa)": f"{out['shear_stress']:.2f}",
+        f"Güvenlik Faktörü ({safety_basis})": f"{out['safety_factor']:.2f}",
+        "Alternatif Gerilme (MPa)": f"{out['alternating_stress']:.2f}",
+        "Ortalama Gerilme (MPa)": f"{out['mean_stress']:.2f}",
+        f"Yorulma Güvenlik Faktörü ({fatigue_criterion})": f"{out['fatigue_safety_factor']:.2f}"
+    }
+    if len(temperatures):
+        span = f"{temperatures[0]:g}…{temperatures[-1]:g} °C"
+        result[f"Min Ön Yük (N) [{span}]"] = f"{out['min_preload']:.2f}"
+        result[f"Maks Ön Yük (N) [{span}]"] = f"{out['max_preload']:.2f}"
+    if sensitivities:
+        result["Yük Faktörü Φ"] = f"{out['load_factor']:.4f}"
+        for output, wrt, label in sensitivity_rows:
+            result[label] = f"{out[sensitivity_key(output, wrt)]:.4g}"
+    return result
+
+def calculate_stiffness(live=False):
+    # Girdiler ana iş parçacığında okunur ve doğrulanır; hesap ve biçimlendirme arka planda yapılır
+    global calc_generation, calc_pending, calc_polling, live_recalc_job
+    live_recalc_job = None
+    calc_generation += 1
+    generation = calc_generation
+    try:
+        values = read_design_values(
+            bolt_size_var.get(), shank_length_var.get(), thread_length_var.get(),
+            material_var.get(), preload_percent_var.get(), tensile_force_var.get(),
+            shear_force_var.get(), clamped_parts_frames
+        )
+    except ValueError as e:
+        if not live:
+            messagebox.showerror("Giriş Hatası", str(e))
+        return
+    calc_pending += 1
+    calc_executor.submit(calculation_worker, generation, values, sensitivity_var.get(), live)
+    if not calc_polling:
+        calc_polling = True
+        root.after(calc_poll_ms, check_calc_queue)
+
+def calculation_worker(generation, values, sensitivities, live):
+    try:
+        with dev_timings.stage("single"):
+            result = evaluate_design_values(values, sensitivities)
+    except Exception as e:
+        result = {'error': str(e)}
+    calc_queue.put((generation, result, live))
+
+def check_calc_queue():
+    global calc_pending, calc_polling, live_result
+    try:
+        while True:
+            generation, result, live = calc_queue.get_nowait()
+            calc_pending -= 1
+            if generation != calc_generation:
+                continue  # Hesap sürerken girdiler değişti; sonuç bayat
+            if 'error' in result:
+                if not live:
+                    messagebox.showerror("Giriş Hatası", result['error'])
+                continue
+            if live:
+                live_result = result
+            else:
+                results_history.append(result)
+                live_result = None
+            with dev_timings.stage("ui_update"):
+                update_results_table()
+            plot_load_deflection(result)
+    except queue.Empty:
+        pass
+    if calc_pending > 0:
+        root.after(calc_poll_ms, check_calc_queue)
+    else:
+        calc_polling = False
+
+def schedule_live_recalc(*_):
+    # Her girdi değişikliği uçuştaki sonuçları geçersiz kılar; canlı modda hesap kısa bir beklemeyle tetiklenir
+    global calc_generation, live_recalc_job
+    calc_generation += 1
+    if live_recalc_job:
+        root.after_cancel(live_recalc_job)
+        live_recalc_job = None
+    if live_recalc_var is not None and live_recalc_var.get():
+        live_recalc_job = root.after(calc_debounce_ms, lambda: calculate_stiffness(live=True))
+
+def on_live_recalc_toggled(*_):
+    global live_result
+    if live_recalc_var.get():
+        schedule_live_recalc()
+    elif live_result:
+        live_result = None
+        update_results_table()
+
+def read_monte_carlo(spreads):
+    # Girdiler ana iş parçacığında okunur ve doğrulanır: (tasarım, toleranslar)
+    design = read_design(
         bolt_size_var.get(), shank_length_var.get(), thread_length_var.get(),
         material_var.get(), preload_percent_var.get(), tensile_force_var.get(),
         shear_force_var.get(), clamped_parts_frames
     )
-    if 'error' in result:
-        messagebox.showerror("Giriş Hatası", result['error'])
+    tolerances = {}
+    for (label, _, names, distribution, relative), spread in zip(monte_carlo_fields, spreads):
+        if spread < 0:
+            raise ValueError(f"{label} negatif olamaz.")
+        if spread > 0:
+            tolerances.update({name: (distribution, spread / 100 if relative else spread, relative) for name in names})
+    return design, tolerances
+
+def run_monte_carlo(design, tolerances, samples, seed):
+    # Tek tasarımın toleranslı girdilerle dağılımı; yüzdelikler ve hasar olasılığı sonuç tablosuna eklenir.
+    # Tk'ye dokunmaz, mc_executor'da çalışır
+    start = time.perf_counter()
+    mc = monte_carlo_stiffness(design['inputs'], tolerances, samples, seed, thermal=design['thermal'], **design['options'])
+    elapsed = time.perf_counter() - start
+    basis, criterion = design['options']['safety_basis'], design['options']['fatigue_criterion']
+    result = {}
+    for p, value in zip(mc['percentiles'], mc['safety_factor']['percentiles']):
+        result[f"MC Güvenlik Faktörü ({basis}) P{p:g}"] = f"{value:.2f}"
+    result["MC P(Güvenlik Faktörü < 1)"] = f"{mc['safety_factor']['failure_probability']:.2e}"
+    result[f"MC Yorulma Güvenlik Faktörü ({criterion}) P5"] = f"{mc['fatigue_safety_factor']['percentiles'][list(mc['percentiles']).index(5)]:.2f}"
+    result["MC P(Yorulma Güvenlik Faktörü < 1)"] = f"{mc['fatigue_safety_factor']['failure_probability']:.2e}"
+    result["MC Cıvata Kuvveti Ort. ± σ (N)"] = f"{mc['bolt_force']['mean']:.0f} ± {mc['bolt_force']['std']:.0f}"
+    result["MC Örnek Sayısı / Tohum"] = f"{samples} / {seed}"
+    result["MC Süre (s)"] = f"{elapsed:.2f}"
+    return result
+
+def parse_pattern_positions(text):
+    # "x,y; x,y; ..." (mm) biçiminde serbest cıvata konumları
+    try:
+        positions = [[float(v) for v in point.split(',')] for point in filter(None, (p.strip() for p in text.split(';')))]
+    except ValueError:
+        raise ValueError("Konumlar 'x,y; x,y' biçiminde sayısal olmalıdır.")
+    if any(len(point) != 2 for point in positions) or not positions:
+        raise ValueError("Konumlar 'x,y; x,y' biçiminde sayısal olmalıdır.")
+    return positions
+
+def run_bolt_pattern(counts_text, diameters_text, positions_text, loads):
+    # Desen varyantları (cıvata sayısı × daire çapı veya serbest konumlar) tek vektörel çağrıda çözülür
+    design = read_design(
+        bolt_size_var.get(), shank_length_var.get(), thread_length_var.get(),
+        material_var.get(), preload_percent_var.get(), 0, 0, clamped_parts_frames
+    )
+    if positions_text.strip():
+        variants = [("-", "-")]
+        patterns = [parse_pattern_positions(positions_text)]
     else:
+        counts = parse_value_list(counts_text, "Cıvata sayıları sayı listesi olmalıdır.")
+        diameters = parse_value_list(diameters_text, "Cıvata dairesi çapları sayı listesi olmalıdır.")
+        if not counts or not diameters or any(n < 1 or n != int(n) for n in counts) or any(D <= 0 for D in diameters):
+            raise ValueError("Cıvata sayısı pozitif tamsayı, daire çapı pozitif olmalıdır.")
+        variants = [(int(n), D) for n in counts for D in diameters]
+        patterns = [circular_pattern(n, D) for n, D in variants]
+    inputs = {name: value for name, value in design['inputs'].items() if name not in ("F_ext_tensile", "F_ext_shear")}
+    start = time.perf_counter()
+    out = bolt_pattern_analysis(pad_patterns(patterns), loads, **inputs, **design['options'])
+    elapsed = time.perf_counter() - start
+    rows = []
+    for i, (count, diameter) in enumerate(variants):
+        rows.append((count, diameter if isinstance(diameter, str) else f"{diameter:g}",
+                     int(out['critical_bolt_safety_factor'][i]) + 1,
+                     f"{np.nanmax(out['tensile'][i]):.0f}", f"{np.nanmax(out['shear'][i]):.0f}",
+                     f"{np.nanmax(out['bolt_force'][i]):.0f}",
+                     f"{out['critical_safety_factor'][i]:.2f}", f"{out['critical_fatigue_safety_factor'][i]:.2f}"))
+    worst = int(np.argmin(out['critical_safety_factor']))
+    basis, criterion = design['options']['safety_basis'], design['options']['fatigue_criterion']
+    result = {
+        "Desen Varyant Sayısı": str(len(variants)),
+        "Kritik Desen (n / Ø mm)": f"{rows[worst][0]} / {rows[worst][1]}",
+        "Kritik Cıvata No": str(rows[worst][2]),
+        "Maks Cıvata Çekme Yükü (N)": rows[worst][3],
+        "Maks Cıvata Kesme Yükü (N)": rows[worst][4],
+        "Maks Toplam Cıvata Kuvveti (N)": rows[worst][5],
+        f"Min Güvenlik Faktörü ({basis})": rows[worst][6],
+        f"Min Yorulma Güvenlik Faktörü ({criterion})": rows[worst][7],
+        "Desen Süre (s)": f"{elapsed:.3f}",
+    }
+    return rows, result
+
+def open_bolt_pattern():
+    popup = tk.Toplevel(root)
+    popup.title("Cıvata Deseni Analizi")
+    popup.geometry("760x560")
+
+    form = ttk.Frame(popup)
+    form.pack(fill="x", padx=5, pady=5)
+    tk.Label(form, text="Cıvata Sayısı:").grid(row=0, column=0, padx=5, pady=3, sticky="w")
+    counts_var = tk.StringVar(value="24:72:12")
+    tk.Entry(form, textvariable=counts_var).grid(row=0, column=1, padx=5, pady=3)
+    tk.Label(form, text="Cıvata Dairesi Çapı (mm):").grid(row=1, column=0, padx=5, pady=3, sticky="w")
+    diameters_var = tk.StringVar(value="500")
+    tk.Entry(form, textvariable=diameters_var).grid(row=1, column=1, padx=5, pady=3)
+    tk.Label(form, text="Serbest Konumlar (x,y; ...):").grid(row=2, column=0, padx=5, pady=3, sticky="w")
+    positions_var = tk.StringVar()
+    tk.Entry(form, textvariable=positions_var, width=40).grid(row=2, column=1, columnspan=3, padx=5, pady=3, sticky="w")
+    load_vars = {}
+    for i, (label, name, default) in enumerate(pattern_load_fields):
+        tk.Label(form, text=label + ":").grid(row=3 + i // 2, column=2 * (i % 2), padx=5, pady=3, sticky="w")
+        load_vars[name] = tk.StringVar(value=default)
+        tk.Entry(form, textvariable=load_vars[name]).grid(row=3 + i // 2, column=2 * (i % 2) + 1, padx=5, pady=3)
+
+    headers = ["n", "Ø (mm)", "Kritik Cıvata", "Maks Çekme (N)", "Maks Kesme (N)", "Maks Cıvata Kuvveti (N)", "Min GF", "Min Yorulma GF"]
+    tree = ttk.Treeview(popup, columns=headers, show="headings", height=14)
+    for col in headers:
+        tree.heading(col, text=col, anchor="center")
+        tree.column(col, anchor="center", width=90)
+    tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def apply_bolt_pattern():
+        try:
+            loads = {}
+            for label, name, _ in pattern_load_fields:
+                try:
+                    loads[name] = float(load_vars[name].get() or 0)
+                except ValueError:
+                    raise ValueError(f"{label} sayısal olmalıdır.")
+            rows, result = run_bolt_pattern(counts_var.get(), diameters_var.get(), positions_var.get(), loads)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+        tree.delete(*tree.get_children())
+        for row in rows:
+            tree.insert("", "end", values=row)
         results_history.append(result)
         update_results_table()
-        plot_load_deflection(result)
 
+    ttk.Button(popup, text="Hesapla", command=apply_bolt_pattern, style="Accent.TButton").pack(pady=5)
+
+def open_monte_carlo():
+    popup = tk.Toplevel(root)
+    popup.title("Monte Carlo Tolerans Analizi")
+    popup.geometry("380x300")
+
+    tk.Label(popup, text="Örnek Sayısı:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+    samples_var = tk.StringVar(value=monte_carlo_defaults["samples"])
+    tk.Entry(popup, textvariable=samples_var).grid(row=0, column=1, padx=5, pady=5)
+    tk.Label(popup, text="Tohum (seed):").grid(row=1, column=0, padx=5, pady=5, sticky="w")
+    seed_var = tk.StringVar(value=monte_carlo_defaults["seed"])
+    tk.Entry(popup, textvariable=seed_var).grid(row=1, column=1, padx=5, pady=5)
+    spread_vars = []
+    for row, (label, default, _, _, _) in enumerate(monte_carlo_fields, start=2):
+        tk.Label(popup, text=label + ":").grid(row=row, column=0, padx=5, pady=5, sticky="w")
+        spread_vars.append(tk.StringVar(value=default))
+        tk.Entry(popup, textvariable=spread_vars[-1]).grid(row=row, column=1, padx=5, pady=5)
+
+    def apply_monte_carlo():
+        try:
+            samples = int(samples_var.get())
+            if samples <= 0:
+                raise ValueError("Örnek sayısı pozitif olmalı.")
+            seed = int(seed_var.get()) if seed_var.get().strip() else None
+            design, tolerances = read_monte_carlo([float(var.get() or 0) for var in spread_vars])
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+        # Hesap tekil hesap gibi arka planda yapılır; pencere sonuç gelene kadar açık kalır
+        run_button.config(state="disabled", text="Hesaplanıyor…")
+        poll_monte_carlo(mc_executor.submit(run_monte_carlo, design, tolerances, samples, seed), popup, run_button)
+
+    run_button = ttk.Button(popup, text="Çalıştır", command=apply_monte_carlo, style="Accent.TButton")
+    run_button.grid(row=len(monte_carlo_fields) + 2, column=0, columnspan=2, pady=10)
+
+def poll_monte_carlo(future, popup, run_button):
+    if not future.done():
+        root.after(calc_poll_ms, poll_monte_carlo, future, popup, run_button)
+        return
+    try:
+        result = future.result()
+    except Exception as e:
+        # Girdi hataları dışında MemoryError gibi motor hataları da gösterilir; pencere yeniden kullanılabilir kalır
+        messagebox.showerror("Hata", str(e) or type(e).__name__)
+        if popup.winfo_exists():
+            run_button.config(state="normal", text="Çalıştır")
+        return
+    results_history.append(result)
+    update_results_table()
+    if popup.winfo_exists():
+        popup.destroy()
+
+def joint_diagram_lines(diagram):
+    # Sıkma (orijinden ön yüke) ve yükleme bölümleri tek dizide birleştirilir: (..., steps + 1).
+    # Çok tasarımlı diyagramlar ax.plot(x.T, y.T) ile tek çağrıda çizilir.
+    origin = np.zeros(diagram["bolt_force"].shape[:-1] + (1,))
+    grip = (diagram["preload_elongation"] + diagram["preload_compression"])[..., None]
+    bolt = (np.concatenate((origin, diagram["bolt_elongation"]), axis=-1), np.concatenate((origin, diagram["bolt_force"]), axis=-1))
+    member = (np.concatenate((grip, diagram["clamped_position"]), axis=-1), np.concatenate((origin, diagram["clamped_force"]), axis=-1))
+    return bolt, member
+
+def draw_joint_diagram(ax, diagram, k_bolt, F_yield, bolt_color='blue', label=''):
+    (x_bolt, y_bolt), (x_member, y_member) = joint_diagram_lines(diagram)
+    ax.plot(x_bolt, y_bolt, color=bolt_color, label=f'Cıvata {label}'.strip())
+    ax.plot(x_member, y_member, color='orange', label=f'Kavrama {label}'.strip())
+    # Çalışma noktası: cıvata ve kavrama kuvvetleri aynı çarpılmada, aradaki fark dış yüktür
+    x_operating = float(diagram["operating_bolt_force"]) / k_bolt
+    ax.plot([x_operating, x_operating], [float(diagram["operating_clamped_force"]), float(diagram["operating_bolt_force"])],
+            color='red', marker='o', label='Çalışma Yükü')
+    if float(diagram["separation_load"]) <= float(diagram["external_load"][-1]):
+        ax.plot(float(diagram["preload_elongation"] + diagram["preload_compression"]), float(diagram["separation_load"]),
+                marker='s', color='black', linestyle='none', label='Ayrılma')
+    if 0 < float(diagram["yield_load"]) <= float(diagram["external_load"][-1]):
+        ax.plot(F_yield / k_bolt, F_yield, marker='^', color='purple', linestyle='none', label='Akma Başlangıcı')
+    ax.set_xlabel('Çarpılma (mm)')
+    ax.set_ylabel('Yük (N)')
+    ax.grid(True)
+
+@dev_timings.timed("plot")
 def plot_load_deflection(result):
-    global canvas, plot_frame, preload_percent_var, material_var, bolt_size_var
+    global canvas, plot_frame, preload_percent_var, material_var, bolt_size_var, tensile_force_var
     if canvas:
         canvas.get_tk_widget().destroy()
+        plt.close(canvas.figure)  # Canlı hesapta her güncellemede yeni figür açılır
     fig, ax = plt.subplots(figsize=(4, 3))
-    F_preload = (float(preload_percent_var.get() or 0) / 100) * materials[material_var.get()]['yield_strength'] * bolt_sizes[bolt_size_var.get()]['A_thread']
-    x_bolt = [0, F_preload / float(result["Toplam Cıvata Sertliği (N/mm)"]), float(result["Cıvata Çarpılma (mm)"])]
-    y_bolt = [0, F_preload, float(result["Toplam Cıvata Kuvveti (N)"])]
-    ax.plot(x_bolt, y_bolt, marker='o', label='Yük-Çarpılma', color='blue')
-    ax.set_xlabel('Çarpılma (mm)')
-    ax.set_ylabel('Yük (N)')
-    ax.set_title('Yük-Çarpılma Eğrisi')
-    ax.grid(True)
-    ax.legend()
+    props = materials[material_var.get()]
+    A_thread = bolt_catalog.areas([bolt_size_var.get()])[1][0]
+    k_bolt = float(result["Toplam Cıvata Sertliği (N/mm)"])
+    F_yield = props['yield_strength'] * A_thread
+    diagram = joint_diagram(k_bolt, float(result["Toplam Kavrama Sertliği (N/mm)"]),
+                            preload_force(float(preload_percent_var.get() or 0), props['yield_strength'], A_thread),
+                            F_yield, float(tensile_force_var.get() or 0), joint_diagram_steps)
+    draw_joint_diagram(ax, diagram, k_bolt, F_yield)
+    ax.set_title('Bağlantı Diyagramı')
+    ax.legend(fontsize=7)
     canvas = FigureCanvasTkAgg(fig, master=plot_frame)
     canvas.draw()
     canvas.get_tk_widget().pack(fill='both', expand=True)
 
+# Malzeme seçici: salt okunur liste, odaktayken yazılan metinle kütüphane dizininde arar ("st", "E>150 yield>=300" gibi).
+# Yalnızca kütüphanedeki adlar seçilebilir; ilk eşleşme seçilir, açılan liste eşleşmeleri gösterir.
+# Arama metni kısa bir duraklamadan sonra (material_search_reset saniye) sıfırlanır.
+def create_material_picker(parent, variable, width=15):
+    picker = ttk.Combobox(parent, textvariable=variable, width=width, state="readonly")
+    picker['postcommand'] = lambda: filter_material_picker(picker)
+    picker.bind('<KeyPress>', lambda event: search_material_picker(picker, variable, event))
+    picker.bind('<FocusOut>', lambda event: material_search.pop(picker, None))
+    material_pickers.append((picker, variable))
+    return picker
+
+def filter_material_picker(picker):
+    # Açılırken son arama hâlâ geçerliyse eşleşmeler, değilse tüm kütüphane listelenir
+    query, typed = material_search.get(picker, ("", 0))
+    if time.monotonic() - typed > material_search_reset:
+        query = ""
+    picker['values'] = materials.search(query, limit=material_picker_limit)
+
+def search_material_picker(picker, variable, event):
+    query, typed = material_search.get(picker, ("", 0))
+    if time.monotonic() - typed > material_search_reset:
+        query = ""
+    if event.keysym == 'BackSpace':
+        query = query[:-1]
+    elif event.keysym == 'Escape':
+        query = ""
+    elif event.char and event.char.isprintable():
+        query += event.char
+    else:
+        return None  # Ok tuşları vb. combobox'ın kendi davranışına bırakılır
+    material_search[picker] = (query, time.monotonic())
+    matches = materials.search(query, limit=material_picker_limit)
+    picker['values'] = matches
+    if matches:
+        variable.set(matches[0])
+    return "break"
+
+def on_materials_changed(event, names):
+    # Silinen malzemeyi gösteren seçiciler varsayılana döner; yok edilmiş seçiciler listeden çıkarılır
+    global material_pickers
+    material_pickers[:] = [(picker, variable) for picker, variable in material_pickers if picker.winfo_exists()]
+    if event == 'delete':
+        for name in names:
+            if name in stress_strain_lines:
+                stress_strain_lines.pop(name)[1].remove()
+                stress_strain_canvas.draw_idle()
+        fallback = 'Steel' if 'Steel' in materials else next(iter(materials), '')
+        for picker, variable in material_pickers:
+            if variable.get() in names:
+                variable.set(fallback)
+
+# Kütüphane, kayıt/silme yapan iş parçacığında bildirim gönderir; pencere öğeleri yalnızca Tk döngüsünde güncellenir
+materials.subscribe(lambda event, names: root.after(0, on_materials_changed, event, names))
+
 def add_clamped_part(type='Washer', thickness='', material='Steel', area=''):
     global clamped_parts_frame
     frame = ttk.Frame(clamped_parts_frame)
@@ -680,17 +1466,21 @@ def add_clamped_part(type='Washer', thickness='', material='Steel', area=''):
     tk.Entry(frame, textvariable=thickness_var, width=10).pack(side='left', padx=5)
     tk.Label(frame, text="Uzunluk (mm)").pack(side='left', padx=5)  # Kalınlık için etiket eklendi
     material_var = tk.StringVar(value=material)
-    ttk.Combobox(frame, textvariable=material_var, values=list(materials.keys()), width=15).pack(side='left', padx=5)
+    create_material_picker(frame, material_var, width=15).pack(side='left', padx=5)
     area_var = tk.StringVar(value=area)
     tk.Entry(frame, textvariable=area_var, width=10).pack(side='left', padx=5)
     tk.Label(frame, text="Alan (mm²)").pack(side='left', padx=5)
     ttk.Button(frame, text="Kaldır", command=lambda: remove_clamped_part(frame), style="Danger.TButton").pack(side='left', padx=5)
-    clamped_parts_frames.append({'type_var': type_var, 'thickness_var': thickness_var, 'material_var': material_var, 'area_var': area_var})
+    clamped_parts_frames.append({'frame': frame, 'type_var': type_var, 'thickness_var': thickness_var, 'material_var': material_var, 'area_var': area_var})
+    for var in (type_var, thickness_var, material_var, area_var):
+        var.trace_add("write", schedule_live_recalc)
+    schedule_live_recalc()
 
 def remove_clamped_part(frame):
     global clamped_parts_frames
     frame.destroy()
-    clamped_parts_frames[:] = [f for f in clamped_parts_frames if f['thickness_var'].get() != frame.winfo_children()[1].get()]
+    clamped_parts_frames[:] = [f for f in clamped_parts_frames if f['frame'] is not frame]
+    schedule_live_recalc()
 
 # Parametrik hesaplama için sıkıştırılan parça ekleme
 def add_param_clamped_part(frame, type='Washer', thickness='', material='Steel', area=''):
@@ -702,179 +1492,339 @@ def add_param_clamped_part(frame, type='Washer', thickness='', material='Steel',
     tk.Entry(param_frame, textvariable=thickness_var, width=10).pack(side='left', padx=5)
     tk.Label(param_frame, text="Uzunluk (mm)").pack(side='left', padx=5)  # Kalınlık için etiket eklendi
     material_var = tk.StringVar(value=material)
-    ttk.Combobox(param_frame, textvariable=material_var, values=list(materials.keys()), width=15).pack(side='left', padx=5)
+    create_material_picker(param_frame, material_var, width=15).pack(side='left', padx=5)
     area_var = tk.StringVar(value=area)
     tk.Entry(param_frame, textvariable=area_var, width=10).pack(side='left', padx=5)
     tk.Label(param_frame, text="Alan (mm²)").pack(side='left', padx=5)
     ttk.Button(param_frame, text="Kaldır", command=lambda: remove_param_clamped_part(param_frame), style="Danger.TButton").pack(side='left', padx=5)
-    parametric_clamped_parts_frames.append({'type_var': type_var, 'thickness_var': thickness_var, 'material_var': material_var, 'area_var': area_var})
+    parametric_clamped_parts_frames.append({'frame': param_frame, 'type_var': type_var, 'thickness_var': thickness_var, 'material_var': material_var, 'area_var': area_var})
 
 def remove_param_clamped_part(frame):
     global parametric_clamped_parts_frames
     frame.destroy()
-    parametric_clamped_parts_frames[:] = [f for f in parametric_clamped_parts_frames if f['thickness_var'].get() != frame.winfo_children()[1].get()]
+    parametric_clamped_parts_frames[:] = [f for f in parametric_clamped_parts_frames if f['frame'] is not frame]
 
 def update_results_table():
-    global results_tree, max_rows_var, results_history, max_rows
+    # Tablo yeniden kurulmaz: satırlar parametre adıyla tutulur ve yerinde güncellenir,
+    # sütunlar yalnızca görünen hesaplar değiştiğinde (yeni hesap eklendi, en eskisi düştü) değişir
+    global results_tree, max_rows_var, results_history, max_rows, results_columns
     try:
         new_max = int(max_rows_var.get())
-        if new_max > 0:
+        if new_max > 0 and new_max != max_rows:
             max_rows = new_max
+            results_history.resize(max_rows)
     except ValueError:
         pass
-    for item in results_tree.get_children():
-        results_tree.delete(item)
-    if not results_history:
+    shown = list(results_history.recent) + ([("Canlı", live_result)] if live_result else [])
+    columns = ["Parametre"] + [f"h{seq}" for seq, _ in shown]
+    if columns != results_columns:
+        results_tree["columns"] = columns
+        for col in columns:
+            results_tree.column(col, anchor="center", width=150 if col == "Parametre" else 120)
+            results_tree.heading(col, text=f"Hesaplama {col[1:]}" if col[0] == "h" else col, anchor="center")
+        results_columns = columns
+    params = list(dict.fromkeys(key for _, r in shown for key in r))
+    stale = [item for item in results_tree.get_children() if item not in params]
+    if stale:
+        results_tree.delete(*stale)
+    for index, param in enumerate(params):
+        values = [param] + [r.get(param, "") for _, r in shown]
+        if results_tree.exists(param):
+            results_tree.item(param, values=values)
+            if results_tree.index(param) != index:
+                results_tree.move(param, "", index)
+        else:
+            results_tree.insert("", index, iid=param, values=values)
+
+def open_history():
+    # SQLite'a taşınmış eski hesaplar; her satır bir hesap, sayfa sayfa okunur
+    if not results_history.spilled:
+        messagebox.showinfo("Bilgi", "Tabloda görünenlerden daha eski hesap yok.")
         return
-    headers = ["Parametre"] + [f"Hesaplama {i+1}" for i in range(min(len(results_history), max_rows))]
-    results_tree["columns"] = headers
-    for col in headers:
-        results_tree.column(col, anchor="center", width=150 if col == "Parametre" else 120)
-        results_tree.heading(col, text=col, anchor="center")
-    for param in results_history[0]:
-        values = [param] + [r[param] for r in results_history[-max_rows:]]
-        results_tree.insert("", "end", values=values)
+    popup = tk.Toplevel(root)
+    popup.title("Eski Hesaplar")
+    popup.geometry("900x400")
+    tree = ttk.Treeview(popup, show="headings", height=15)
+    tree.pack(fill="both", expand=True, padx=5, pady=5)
+    scrollbar = ttk.Scrollbar(popup, orient="horizontal", command=tree.xview)
+    scrollbar.pack(fill="x")
+    tree.configure(xscrollcommand=scrollbar.set)
+    status = tk.Label(popup)
+    status.pack()
+    headers = ["Hesaplama"]
+    loaded = 0
+
+    def load_more():
+        nonlocal headers, loaded
+        rows = results_history.older(offset=loaded)
+        new = list(dict.fromkeys(key for _, r in rows for key in r if key not in headers))
+        if new or loaded == 0:
+            # Yeni parametre sütunu gelirse mevcut satırlar da yeni sütun düzenine göre yazılır
+            existing = [dict(zip(headers, tree.item(item, "values"))) for item in tree.get_children()]
+            headers = headers + new
+            tree["columns"] = headers
+            for col in headers:
+                tree.heading(col, text=col, anchor="center")
+                tree.column(col, anchor="center", width=90 if col == "Hesaplama" else 120)
+            for item, row in zip(tree.get_children(), existing):
+                tree.item(item, values=[row.get(h, "") for h in headers])
+        for seq, r in rows:
+            tree.insert("", "end", values=[seq] + [r.get(h, "") for h in headers[1:]])
+        loaded += len(rows)
+        status.config(text=f"{loaded} / {results_history.spilled} eski hesap gösteriliyor")
+        more_button.config(state="normal" if loaded < results_history.spilled else "disabled")
+
+    more_button = ttk.Button(popup, text="Daha Fazla", command=load_more)
+    more_button.pack(pady=5)
+    load_more()
+
+def parametric_axis_tokens():
+    # Boş bırakılan eksen tekil hesap girdisini kullanır; doğrulama validate_axes ile yapılır
+    raw = {
+        "bolt_size": param_bolt_size_var.get() or bolt_size_var.get(),
+        "shank_length": param_shank_length_var.get() or shank_length_var.get(),
+        "thread_length": param_thread_length_var.get() or thread_length_var.get(),
+        "preload_percent": param_preload_percent_var.get() or preload_percent_var.get(),
+        "tensile_force": param_tensile_force_var.get() or tensile_force_var.get(),
+    }
+    return {name: [v.strip() for v in text.split(',') if v.strip()] for name, text in raw.items()}
 
 def run_parametric_analysis():
-    global cancel_flag, parametric_results, progress_bar, progress_label, material_var, shear_force_var, parametric_clamped_parts_frames
-    cancel_flag.clear()
-    parametric_results.clear()
-
-    if not parametric_clamped_parts_frames:
-        messagebox.showerror("Hata", "Parametrik analiz için en az bir sıkıştırılan parça eklenmelidir!")
+    global progress_bar, progress_label, material_var, shear_force_var, parametric_clamped_parts_frames, followed_job
+    # Tüm girdiler tarama başlamadan bir kez denetlenir; hatalar tek pencerede listelenir
+    axes, errors, excluded = validate_axes(bolt_catalog, parametric_axis_tokens())
+    if material_var.get() not in materials:
+        errors.append("Geçerli bir malzeme seçin.")
+    parts = F_ext_shear = fatigue_criterion = load_ratio = temperatures = None
+    try:
+        parts = read_clamped_parts(parametric_clamped_parts_frames)
+    except ValueError as e:
+        errors.append(str(e))
+    try:
+        F_ext_shear = float(shear_force_var.get() or 0)
+    except ValueError:
+        errors.append("Kesme kuvveti sayısal olmalıdır.")
+    try:
+        fatigue_criterion, load_ratio = read_fatigue_inputs()
+    except ValueError as e:
+        errors.append(str(e))
+    try:
+        temperatures = parse_temperatures()
+        if len(temperatures) and parts is not None and material_var.get() in materials:
+            check_thermal_properties(parts, {**materials[material_var.get()], 'name': material_var.get()})
+    except ValueError as e:
+        errors.append(str(e))
+    if errors:
+        messagebox.showerror("Giriş Hatası", "Parametrik analiz başlatılmadı:\n\n" + "\n".join(errors))
         return
 
-    bolt_size_vals = param_bolt_size_var.get().split(',') if param_bolt_size_var.get() else [bolt_size_var.get()]
-    shank_length_vals = param_shank_length_var.get().split(',') if param_shank_length_var.get() else [shank_length_var.get()]
-    thread_length_vals = param_thread_length_var.get().split(',') if param_thread_length_var.get() else [thread_length_var.get()]
-    preload_percent_vals = param_preload_percent_var.get().split(',') if param_preload_percent_var.get() else [preload_percent_var.get()]
-    tensile_force_vals = param_tensile_force_var.get().split(',') if param_tensile_force_var.get() else [tensile_force_var.get()]
-
-    bolt_size_vals = [v.strip() for v in bolt_size_vals]
-    shank_length_vals = [v.strip() for v in shank_length_vals]
-    thread_length_vals = [v.strip() for v in thread_length_vals]
-    preload_percent_vals = [v.strip() for v in preload_percent_vals]
-    tensile_force_vals = [v.strip() for v in tensile_force_vals]
-
-    combinations = list(product(bolt_size_vals, shank_length_vals, thread_length_vals, preload_percent_vals, tensile_force_vals))
-    total_combinations = len(combinations)
-
-    if total_combinations > 1000:
+    total_combinations = int(np.prod([len(axes[name]) for name in input_columns]))
+    if total_combinations > parametric_warn_limit:
         if not messagebox.askyesno("Uyarı", "Bu işlem uzun sürebilir. Devam etmek istiyor musunuz?"):
             return
 
+    profile = bool(dev_mode and profile_run_var and profile_run_var.get())
+    material = material_var.get()
+    sweep = dict(catalog=bolt_catalog, axes=axes, parts=parts, material=material, props=dict(materials[material]),
+                 F_ext_shear=F_ext_shear, safety_basis=safety_basis_var.get(), shear_area=shear_area_var.get(),
+                 clamped_model=clamped_model_var.get(), fatigue_criterion=fatigue_criterion, load_ratio=load_ratio,
+                 temperatures=temperatures)
+    label = f"{material}, {', '.join(axes['bolt_size'])}, {total_combinations:,} kombinasyon"
+    skipped = excluded_combinations(axes, excluded)
+    if skipped:
+        label += f" ({skipped:,} geçersiz hariç)"
+    job = sweep_jobs.submit(sweep, label, to_disk=param_memmap_var.get(), profile=profile, excluded=skipped)
+    followed_job = job.id
     progress_bar['maximum'] = total_combinations
     progress_bar['value'] = 0
-    progress_label.config(text="Hesaplama: 0% tamamlandı")
+    progress_label.config(text=f"İş {job.id}: sırada")
+    update_job_row(job)
+    start_jobs_polling()
+
+def start_jobs_polling():
+    global jobs_polling
+    if not jobs_polling:
+        jobs_polling = True
+        root.after(100, check_queue)
 
-    worker = threading.Thread(target=parametric_worker, args=(combinations, parametric_clamped_parts_frames, material_var.get(), shear_force_var.get()))
-    worker.daemon = True
-    worker.start()
-    root.after(100, check_queue)
+def job_row(job):
+    percent = job.done / job.total * 100 if job.total else 0.0
+    elapsed = ((job.finished or time.time()) - job.started) if job.started else 0.0
+    states = {"queued": "Sırada", "running": "Çalışıyor", "done": "Tamamlandı", "canceled": "İptal edildi", "error": "Hata"}
+    return (job.id, job.label, states[job.state], f"{percent:.1f}%", f"{elapsed:.1f}", job.run_id or "")
 
-def parametric_worker(combinations, clamped_parts, material, F_ext_shear):
-    global analysis_queue, cancel_flag
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS results (
-                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                 bolt_size TEXT, shank_length TEXT, thread_length TEXT,
-                 preload_percent TEXT, tensile_force TEXT,
-                 stiffness TEXT, clamped_stiffness TEXT,
-                 bolt_force TEXT, bolt_deflection TEXT,
-                 clamped_deflection TEXT, shear_stress TEXT,
-                 safety_factor TEXT)''')
-    conn.commit()
-
-    total_combinations = len(combinations)
-    for i, (bolt_size, L_shank, L_thread, preload_percent, F_ext_tensile) in enumerate(combinations):
-        if cancel_flag.is_set():
-            analysis_queue.put(('canceled',))
-            break
-        result = compute_stiffness(bolt_size, L_shank, L_thread, material, preload_percent, F_ext_tensile, F_ext_shear, clamped_parts)
-        if 'error' in result:
-            analysis_queue.put(('error', result['error']))
-        else:
-            c.execute('''INSERT INTO results (bolt_size, shank_length, thread_length, preload_percent, tensile_force,
-                        stiffness, clamped_stiffness, bolt_force, bolt_deflection, clamped_deflection, shear_stress, safety_factor)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                      (bolt_size, L_shank, L_thread, preload_percent, F_ext_tensile,
-                       result["Toplam Cıvata Sertliği (N/mm)"],
-                       result["Toplam Kavrama Sertliği (N/mm)"],
-                       result["Toplam Cıvata Kuvveti (N)"],
-                       result["Cıvata Çarpılma (mm)"],
-                       result["Kavrama Çarpılma (mm)"],
-                       result["Kesme Gerilimi (MPa)"],
-                       result[f"Güvenlik Faktörü ({safety_basis_var.get()})"]))
-            conn.commit()
-            analysis_queue.put(('result', {
-                'Cıvata Boyutu': bolt_size, 'Gövde Uzunluğu': L_shank, 'Dişli Kısım Uzunluğu': L_thread,
-                'Ön Yükleme Yüzdesi': preload_percent, 'Çekme Kuvveti': F_ext_tensile,
-                **result
-            }))
-        analysis_queue.put(('progress', i + 1, total_combinations))
-    analysis_queue.put(('done',))
-    conn.close()
+def update_job_row(job):
+    if not jobs_tree:
+        return
+    iid = str(job.id)
+    if jobs_tree.exists(iid):
+        jobs_tree.item(iid, values=job_row(job))
+    else:
+        jobs_tree.insert("", "end", iid=iid, values=job_row(job))
+
+def update_progress(job):
+    progress_bar['maximum'] = max(job.total, 1)
+    progress_bar['value'] = job.done
+    if job.state == "canceled":
+        progress_label.config(text=f"İş {job.id}: hesaplama iptal edildi.")
+    elif job.state == "queued":
+        progress_label.config(text=f"İş {job.id}: sırada")
+    else:
+        progress_label.config(text=f"İş {job.id}: {(job.done / max(job.total, 1)) * 100:.1f}% tamamlandı")
 
 def check_queue():
-    global analysis_queue, progress_bar, progress_label, parametric_results
+    global analysis_queue, progress_bar, progress_label, parametric_results, jobs_polling
     try:
         while True:
             msg = analysis_queue.get_nowait()
+            job = sweep_jobs.get(msg[1])
+            if job is None:
+                continue  # Listeden kaldırılmış iş
+            job.timings.gauge("queue_depth", analysis_queue.qsize())
             if msg[0] == 'progress':
-                progress_bar['value'] = msg[1]
-                progress_label.config(text=f"Hesaplama: {(msg[1] / msg[2]) * 100:.1f}% tamamlandı")
-            elif msg[0] == 'result':
-                parametric_results.append(msg[1])
+                # İş parçacığının mesajı koyması ile arayüzün alması arasındaki gecikme
+                job.timings.add("queue", time.perf_counter() - msg[2])
+                with job.timings.stage("ui_update"):
+                    update_job_row(job)
+                    if job.id == followed_job:
+                        update_progress(job)
+            elif msg[0] == 'profile':
+                show_profile(job.profile_path, msg[2])
             elif msg[0] == 'done':
-                load_parametric_results_from_db()
-                update_parametric_results()
-                messagebox.showinfo("Bilgi", "Parametrik analiz tamamlandı!")
-                return
-            elif msg[0] == 'canceled':
-                progress_bar['value'] = 0
-                progress_label.config(text="Hesaplama iptal edildi.")
-                messagebox.showinfo("Bilgi", "Parametrik analiz iptal edildi.")
-                return
-            elif msg[0] == 'error':
-                messagebox.showerror("Hata", msg[1])
+                update_job_row(job)
+                finished_jobs.append(job.id)
+                if job.id == followed_job:
+                    update_progress(job)
+                    parametric_results = msg[2]
+                    with job.timings.stage("ui_update"):
+                        update_parametric_results()
+            elif msg[0] in ('canceled', 'error', 'started'):
+                update_job_row(job)
+                if job.id == followed_job:
+                    update_progress(job)
+                if msg[0] == 'error':
+                    messagebox.showerror("Hata", f"İş {job.id}: {job.error}")
+                elif msg[0] == 'canceled':
+                    finished_jobs.append(job.id)
     except queue.Empty:
+        pass
+    if sweep_jobs.active_count() or not analysis_queue.empty():
         root.after(100, check_queue)
+        return
+    jobs_polling = False
+    report_finished_jobs()
+
+def report_finished_jobs():
+    # Kuyruk boşalınca tek bir özet gösterilir (her iş için ayrı pencere açılmaz)
+    jobs = sorted((job for job in map(sweep_jobs.get, finished_jobs) if job), key=lambda job: job.id)
+    finished_jobs.clear()
+    if not jobs:
+        return
+    if all(job.state == "canceled" for job in jobs):
+        messagebox.showinfo("Bilgi", "Parametrik analiz iptal edildi.")
+        return
+    lines = []
+    for job in jobs:
+        line = f"İş {job.id}: {'tamamlandı' if job.state == 'done' else 'iptal edildi'}"
+        if job.skipped:
+            line += f", {job.skipped} geçersiz kombinasyon atlandı"
+        lines.append(line)
+    messagebox.showinfo("Bilgi", "Parametrik analiz tamamlandı!\n" + "\n".join(lines))
+
+def selected_jobs():
+    return [sweep_jobs.get(int(iid)) for iid in jobs_tree.selection() if sweep_jobs.get(int(iid))] if jobs_tree else []
+
+def on_job_selected(_=None):
+    global followed_job
+    jobs = selected_jobs()
+    if jobs:
+        followed_job = jobs[-1].id
+        update_progress(jobs[-1])
+
+def show_job_results():
+    global parametric_results, followed_job
+    jobs = selected_jobs() or ([sweep_jobs.get(followed_job)] if sweep_jobs.get(followed_job) else [])
+    if not jobs:
+        return
+    job = jobs[-1]
+    followed_job = job.id
+    if job.run_id is None:
+        messagebox.showwarning("Uyarı", f"İş {job.id} için henüz sonuç yok.")
+        return
+    if parametric_results is None or parametric_results.meta.get('run_id') != job.run_id:
+        try:
+            store = load_parametric_results_from_db(job.run_id)
+        except FileNotFoundError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+        if store is None:
+            messagebox.showwarning("Uyarı", f"İş {job.id} için kayıtlı sonuç bulunamadı.")
+            return
+        parametric_results = store
+    update_parametric_results()
+
+def remove_finished_jobs():
+    # Seçili (seçim yoksa tüm) biten işleri listeden kaldırır; sonuçlar veritabanında kalır,
+    # gösterilen sonuçlar tabloda kalır
+    jobs = selected_jobs() or list(sweep_jobs.jobs.values())
+    for job in jobs:
+        if sweep_jobs.remove(job.id) and jobs_tree.exists(str(job.id)):
+            jobs_tree.delete(str(job.id))
+
+def set_job_concurrency():
+    try:
+        sweep_jobs.set_concurrency(int(job_concurrency_var.get()))
+    except ValueError:
+        job_concurrency_var.set(str(sweep_jobs.concurrency))
 
-def load_parametric_results_from_db():
-    global parametric_results
-    parametric_results.clear()
+def load_parametric_results_from_db(run_id=None):
     conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute("SELECT * FROM results")
-    rows = c.fetchall()
-    headers = ["bolt_size", "shank_length", "thread_length", "preload_percent", "tensile_force",
-               "stiffness", "clamped_stiffness", "bolt_force", "bolt_deflection",
-               "clamped_deflection", "shear_stress", "safety_factor"]
-    for row in rows[1:]:
-        result = {
-            'Cıvata Boyutu': row[1], 'Gövde Uzunluğu': row[2], 'Dişli Kısım Uzunluğu': row[3],
-            'Ön Yükleme Yüzdesi': row[4], 'Çekme Kuvveti': row[5],
-            "Toplam Cıvata Sertliği (N/mm)": row[6], "Toplam Kavrama Sertliği (N/mm)": row[7],
-            "Toplam Cıvata Kuvveti (N)": row[8], "Cıvata Çarpılma (mm)": row[9],
-            "Kavrama Çarpılma (mm)": row[10], "Kesme Gerilimi (MPa)": row[11],
-            f"Güvenlik Faktörü ({safety_basis_var.get()})": row[12]
-        }
-        parametric_results.append(result)
-    conn.close()
+    try:
+        return load_run(conn, run_id, categorical_order=bolt_catalog.names)
+    finally:
+        conn.close()
+
+def load_last_parametric_run():
+    global parametric_results
+    try:
+        store = load_parametric_results_from_db()
+    except FileNotFoundError as e:
+        messagebox.showerror("Hata", str(e))
+        return
+    if store is None:
+        messagebox.showwarning("Uyarı", "Tamamlanmış kayıtlı parametrik analiz bulunamadı.")
+        return
+    parametric_results = store
+    update_parametric_results()
+
+def open_parametric_run_from_disk():
+    global parametric_results
+    directory = filedialog.askdirectory(initialdir=os.path.join(os.path.dirname(os.path.abspath(db_path)), results_dir))
+    if not directory:
+        return
+    try:
+        parametric_results = ParametricResults.open(directory)
+    except (OSError, ValueError, KeyError) as e:
+        messagebox.showerror("Hata", f"Sonuç klasörü açılamadı: {e}")
+        return
+    update_parametric_results()
 
 def cancel_analysis():
-    global cancel_flag
-    cancel_flag.set()
+    # Seçili işler; seçim yoksa sıradaki ve çalışan tüm işler iptal edilir
+    jobs = [job for job in selected_jobs() if job.active]
+    if not jobs:
+        sweep_jobs.cancel_all()
+    for job in jobs:
+        sweep_jobs.cancel(job.id)
 
 def update_parametric_results():
-    global para_results_tree, parametric_results, optimal_label, safety_basis_var
+    global para_results_tree, parametric_results, optimal_label
     for item in para_results_tree.get_children():
         para_results_tree.delete(item)
-    
+
     if parametric_results:
-        safety_key = f"Güvenlik Faktörü ({safety_basis_var.get()})"
-        optimal_result = max(parametric_results, key=lambda x: float(x[safety_key]))
+        optimal_result = parametric_results.display_row(parametric_results.argbest())
+        safety_key = parametric_results.label("safety_factor")
         optimal_label.config(text=f"En Optimal Kombinasyon:\n"
                                  f"Cıvata Boyutu: {optimal_result['Cıvata Boyutu']}\n"
                                  f"Gövde Uzunluğu: {optimal_result['Gövde Uzunluğu']} mm\n"
@@ -882,110 +1832,197 @@ def update_parametric_results():
                                  f"Ön Yükleme Yüzdesi: {optimal_result['Ön Yükleme Yüzdesi']}%\n"
                                  f"Çekme Kuvveti: {optimal_result['Çekme Kuvveti']} N\n"
                                  f"Güvenlik Faktörü: {optimal_result[safety_key]}")
-        
-        headers = ['Cıvata Boyutu', 'Gövde Uzunluğu', 'Dişli Kısım Uzunluğu', 'Ön Yükleme Yüzdesi', 'Çekme Kuvveti'] + list(parametric_results[0].keys())
-        headers = [h for h in headers if h not in ['Cıvata Boyutu', 'Gövde Uzunluğu', 'Dişli Kısım Uzunluğu', 'Ön Yükleme Yüzdesi', 'Çekme Kuvveti']] + ['Cıvata Boyutu', 'Gövde Uzunluğu', 'Dişli Kısım Uzunluğu', 'Ön Yükleme Yüzdesi', 'Çekme Kuvveti']
+
+        # Büyük taramalarda tablo yalnızca en iyi satırları gösterir; tümü dışa aktarılabilir
+        headers = [parametric_results.label(name) for name in output_columns + input_columns]
         para_results_tree["columns"] = headers
         for col in headers:
             para_results_tree.column(col, anchor="center", width=120)
             para_results_tree.heading(col, text=col, anchor="center")
-        
-        for result in parametric_results:
-            values = [result[h] for h in headers]
-            para_results_tree.insert("", "end", values=values)
 
+        for index in parametric_results.top_k(para_display_rows):
+            result = parametric_results.display_row(index)
+            para_results_tree.insert("", "end", values=[result[h] for h in headers])
+
+@dev_timings.timed("plot")
 def draw_parametric_graph():
-    global para_canvas, para_plot_frame, parametric_results, param_to_graph_var, safety_basis_var
+    global para_canvas, para_plot_frame, parametric_results, param_to_graph_var
     if not parametric_results:
         messagebox.showwarning("Uyarı", "Önce parametrik analiz yapmalısınız!")
         return
-    
-    selected_param = param_to_graph_var.get()
-    safety_key = f"Güvenlik Faktörü ({safety_basis_var.get()})"
-    optimal_result = max(parametric_results, key=lambda x: float(x[safety_key]))
-    
-    grouped_data = {}
-    for result in parametric_results:
-        param_value = result[selected_param]
-        grouped_data[param_value] = grouped_data.get(param_value, []) + [float(result[safety_key])]
-    
-    x_values = list(grouped_data.keys())
-    y_values = [sum(values) / len(values) for values in grouped_data.values()]
-    is_numeric = selected_param in ['Gövde Uzunluğu', 'Dişli Kısım Uzunluğu', 'Ön Yükleme Yüzdesi', 'Çekme Kuvveti']
-    
+
+    dil, _ = load_config()
+    selected_param = parametric_axis_options(dil).get(param_to_graph_var.get())
+    if not selected_param:
+        messagebox.showwarning("Uyarı", "Geçerli bir grafik parametresi seçin.")
+        return
+    best = parametric_results.argbest()
+
+    # Eksen kodları üzerinden blok blok ortalama güvenlik faktörü
+    means, counts = parametric_results.aggregate([selected_param], "safety_factor")
+    present = counts > 0
+    x_values = parametric_results.axes[selected_param][present]
+    y_values = means[present]
+    is_numeric = selected_param != "bolt_size"
+
     if para_canvas:
         para_canvas.get_tk_widget().destroy()
-    
+
     fig, ax = plt.subplots(figsize=(6, 4))
     if is_numeric:
-        x_values = [float(x) for x in x_values]
         ax.plot(x_values, y_values, marker='o', label='Ortalama Güvenlik Faktörü', color='blue')
-        ax.axvline(float(optimal_result[selected_param]), color='red', linestyle='--', label='Optimal Değer')
+        ax.axvline(parametric_results.value(selected_param, best), color='red', linestyle='--', label='Optimal Değer')
     else:
+        x_values = list(x_values)
         ax.bar(x_values, y_values, color='blue', label='Ortalama Güvenlik Faktörü')
-        ax.axvline(x_values.index(optimal_result[selected_param]), color='red', linestyle='--', label='Optimal Değer')
-    
-    ax.set_xlabel(selected_param)
+        ax.axvline(x_values.index(parametric_results.value(selected_param, best)), color='red', linestyle='--', label='Optimal Değer')
+
+    ax.set_xlabel(column_labels[selected_param])
     ax.set_ylabel('Güvenlik Faktörü')
-    ax.set_title(f'{selected_param} vs Güvenlik Faktörü')
+    ax.set_title(f'{column_labels[selected_param]} vs Güvenlik Faktörü')
     ax.grid(True)
     ax.legend()
     para_canvas = FigureCanvasTkAgg(fig, master=para_plot_frame)
     para_canvas.draw()
     para_canvas.get_tk_widget().pack(fill='both', expand=True)
 
+def parametric_axis_options(dil):
+    return {dil_sozlugu[dil][label_key].rstrip(":"): column for label_key, column in parametric_axes}
+
+@dev_timings.timed("plot")
+def draw_response_surface():
+    global para_canvas, para_plot_frame, parametric_results, param_to_graph_var, param_to_graph_y_var, graph_output_var, graph_aggregate_var
+    if not parametric_results:
+        messagebox.showwarning("Uyarı", "Önce parametrik analiz yapmalısınız!")
+        return
+    dil, _ = load_config()
+    axis_options = parametric_axis_options(dil)
+    x_key = axis_options.get(param_to_graph_var.get())
+    y_key = axis_options.get(param_to_graph_y_var.get())
+    if not x_key or not y_key or x_key == y_key:
+        messagebox.showwarning("Uyarı", "Isı haritası için iki farklı eksen seçin.")
+        return
+    z_key = parametric_outputs.get(graph_output_var.get(), "safety_factor")
+    aggregate = {dil_sozlugu[dil]["maksimum"]: "max", dil_sozlugu[dil]["minimum"]: "min"}.get(graph_aggregate_var.get(), "mean")
+
+    x_vals, y_vals = parametric_results.axes[x_key], parametric_results.axes[y_key]
+    grid, _ = parametric_results.aggregate([x_key, y_key], z_key, aggregate)
+    best = parametric_results.argbest()
+    best_x, best_y = parametric_results.codes[x_key][best], parametric_results.codes[y_key][best]
+
+    if para_canvas:
+        para_canvas.get_tk_widget().destroy()
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+    mesh = ax.pcolormesh(np.arange(len(x_vals) + 1) - 0.5, np.arange(len(y_vals) + 1) - 0.5, np.ma.masked_invalid(grid.T), cmap='viridis', shading='flat')
+    fig.colorbar(mesh, ax=ax, label=parametric_results.label(z_key))
+    if "bolt_size" not in (x_key, y_key) and len(x_vals) > 1 and len(y_vals) > 1 and np.isfinite(grid).sum() > 3:
+        ax.contour(np.arange(len(x_vals)), np.arange(len(y_vals)), np.ma.masked_invalid(grid.T), colors='k', linewidths=0.5, alpha=0.6)
+    ax.plot(best_x, best_y, marker='*', markersize=14, color='red', linestyle='none', label='Optimal Değer')
+    for axis_ticks, vals in ((ax.set_xticks, x_vals), (ax.set_yticks, y_vals)):
+        step = max(1, len(vals) // 10)
+        axis_ticks(np.arange(len(vals))[::step], [str(v) if isinstance(v, str) else f"{v:g}" for v in vals[::step]])
+    ax.set_xlabel(column_labels[x_key])
+    ax.set_ylabel(column_labels[y_key])
+    ax.set_title(f'{parametric_results.label(z_key)} ({graph_aggregate_var.get()})')
+    ax.legend(loc='upper right')
+    para_canvas = FigureCanvasTkAgg(fig, master=para_plot_frame)
+    para_canvas.draw()
+    para_canvas.get_tk_widget().pack(fill='both', expand=True)
+
+@dev_timings.timed("plot")
 def draw_optimal_graph():
-    global para_canvas, para_plot_frame, parametric_results, safety_basis_var, bolt_size_var, shank_length_var, thread_length_var, preload_percent_var, tensile_force_var, material_var
+    global para_canvas, para_plot_frame, parametric_results, bolt_size_var, shank_length_var, thread_length_var, preload_percent_var, tensile_force_var, material_var
     if not parametric_results:
         messagebox.showwarning("Uyarı", "Önce parametrik analiz yapmalısınız!")
         return
-    
-    safety_key = f"Güvenlik Faktörü ({safety_basis_var.get()})"
-    optimal_result = max(parametric_results, key=lambda x: float(x[safety_key]))
-    
-    bolt_size_var.set(optimal_result['Cıvata Boyutu'])
-    shank_length_var.set(str(optimal_result['Gövde Uzunluğu']))
-    thread_length_var.set(str(optimal_result['Dişli Kısım Uzunluğu']))
-    preload_percent_var.set(str(optimal_result['Ön Yükleme Yüzdesi']))
-    tensile_force_var.set(str(optimal_result['Çekme Kuvveti']))
-    
-    E_bolt = materials[material_var.get()]['E']
-    yield_strength = materials[material_var.get()]['yield_strength']
-    A_shank = bolt_sizes[optimal_result['Cıvata Boyutu']]['A_shank']
-    A_thread = bolt_sizes[optimal_result['Cıvata Boyutu']]['A_thread']
-    
-    k_shank = (E_bolt * A_shank) / float(optimal_result['Gövde Uzunluğu'])
-    if float(optimal_result['Dişli Kısım Uzunluğu']) > 0:
-        k_thread = (E_bolt * A_thread) / float(optimal_result['Dişli Kısım Uzunluğu'])
-        k_bolt = 1 / (1/k_shank + 1/k_thread)
-    else:
-        k_bolt = k_shank
-    
-    F_preload = (float(optimal_result['Ön Yükleme Yüzdesi']) / 100) * yield_strength * A_thread
-    delta_F_bolt = (k_bolt / (k_bolt + float(optimal_result['Toplam Kavrama Sertliği (N/mm)']))) * float(optimal_result['Çekme Kuvveti'])
-    F_total_bolt = F_preload + delta_F_bolt
-    
-    delta_L_bolt_preload = F_preload / k_bolt
-    delta_L_bolt_total = F_total_bolt / k_bolt
-    
+
+    best = parametric_results.argbest()
+    optimal_result = {name: parametric_results.value(name, best) for name in input_columns + output_columns}
+    bolt_size_var.set(optimal_result['bolt_size'])
+    shank_length_var.set(f"{optimal_result['shank_length']:g}")
+    thread_length_var.set(f"{optimal_result['thread_length']:g}")
+    preload_percent_var.set(f"{optimal_result['preload_percent']:g}")
+    tensile_force_var.set(f"{optimal_result['tensile_force']:g}")
+
+    # En iyi tasarımlar arka planda, optimal tasarım önde; tüm diyagramlar tek dizi işlemiyle hesaplanır
+    rows = parametric_results.top_k(joint_overlay_rows)
+    rows = np.concatenate(([best], rows[rows != best]))[:joint_overlay_rows]
+    try:
+        props, A_thread = parametric_design_props(parametric_results, rows)
+    except ValueError as e:
+        messagebox.showerror("Hata", str(e))
+        return
+    diagram = parametric_joint_diagram(parametric_results, rows)
+    k_bolt = parametric_results.column("stiffness", rows)
+
     if para_canvas:
         para_canvas.get_tk_widget().destroy()
-    
+
     fig, ax = plt.subplots(figsize=(6, 4))
-    x_bolt = [0, delta_L_bolt_preload, delta_L_bolt_total]
-    y_bolt = [0, F_preload, F_total_bolt]
-    ax.plot(x_bolt, y_bolt, marker='o', label='Yük-Çarpılma (Optimal)', color='green')
-    ax.set_xlabel('Çarpılma (mm)')
-    ax.set_ylabel('Yük (N)')
-    ax.set_title('Optimal Kombinasyon Yük-Çarpılma Eğrisi')
-    ax.grid(True)
-    ax.legend()
+    (x_bolt, y_bolt), (x_member, y_member) = joint_diagram_lines(diagram)
+    ax.plot(x_bolt[1:].T, y_bolt[1:].T, color='0.8', linewidth=0.8)
+    ax.plot(x_member[1:].T, y_member[1:].T, color='0.85', linewidth=0.8)
+    draw_joint_diagram(ax, {name: values[0] for name, values in diagram.items()}, k_bolt[0],
+                       props['yield_strength'] * A_thread[0], bolt_color='green', label='(Optimal)')
+    ax.set_title(f'Optimal Kombinasyon Bağlantı Diyagramı (+{len(rows) - 1} en iyi tasarım)')
+    ax.legend(fontsize=7)
     para_canvas = FigureCanvasTkAgg(fig, master=para_plot_frame)
     para_canvas.draw()
     para_canvas.get_tk_widget().pack(fill='both', expand=True)
 
+def parametric_design_props(store, rows):
+    # Analizde kullanılan malzeme (kayıtlıysa çalıştırma anındaki özellikler) ve satırların gerilme kesitleri.
+    # Özellikleri saklanmamış eski bir çalıştırmanın malzemesi kütüphaneden silinmişse ValueError verir
+    name = store.meta.get('material', material_var.get())
+    props = store.meta.get('material_props') or materials.get(name)
+    if props is None:
+        raise ValueError(f"Çalıştırmanın malzemesi '{name}' kütüphanede bulunamadı ve özellikleri kayıtlı değil.")
+    _, A_thread_axis = bolt_catalog.areas(list(store.axes["bolt_size"]))
+    return props, A_thread_axis[store.axis_codes("bolt_size")[rows]]
+
+def parametric_joint_diagram(store, rows, steps=joint_diagram_steps):
+    props, A_thread = parametric_design_props(store, rows)
+    return joint_diagram(store.column("stiffness", rows), store.column("clamped_stiffness", rows),
+                         preload_force(store.column("preload_percent", rows), props['yield_strength'], A_thread),
+                         props['yield_strength'] * A_thread, store.column("tensile_force", rows), steps)
+
+def export_joint_diagrams():
+    # Tablodaki en iyi tasarımların diyagramları uzun formatta (tasarım × yük adımı) dışa aktarılır
+    global parametric_results
+    if not parametric_results:
+        messagebox.showwarning("Uyarı", "Export edilecek veri yok!")
+        return
+    rows = parametric_results.top_k(para_display_rows)
+    try:
+        diagram = parametric_joint_diagram(parametric_results, rows)
+    except ValueError as e:
+        messagebox.showerror("Hata", str(e))
+        return
+    file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx"), ("All files", "*.*")])
+    if not file_path:
+        return
+    steps = diagram["external_load"].shape[-1]
+    df = pd.DataFrame({
+        "Sıra": np.repeat(np.arange(1, len(rows) + 1), steps),
+        parametric_results.label("bolt_size"): np.repeat(parametric_results.column("bolt_size", rows), steps),
+        "Adım": np.tile(np.arange(steps), len(rows)),
+        "Dış Yük (N)": diagram["external_load"].ravel(),
+        "Cıvata Kuvveti (N)": diagram["bolt_force"].ravel(),
+        "Kavrama Kuvveti (N)": diagram["clamped_force"].ravel(),
+        "Cıvata Uzaması (mm)": diagram["bolt_elongation"].ravel(),
+        "Kavrama Konumu (mm)": diagram["clamped_position"].ravel(),
+        "Ayrılma Yükü (N)": np.repeat(diagram["separation_load"], steps),
+        "Akma Başlangıç Yükü (N)": np.repeat(diagram["yield_load"], steps),
+    })
+    if file_path.lower().endswith(".csv"):
+        df.to_csv(file_path, index=False)
+    else:
+        df.to_excel(file_path, index=False)
+    messagebox.showinfo("Başarılı", f"Veriler '{file_path}' dosyasına kaydedildi.")
+
 def clear_inputs():
-    global canvas, bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, shear_area_var, safety_basis_var, clamped_parts_frames
+    global canvas, bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, shear_area_var, safety_basis_var, clamped_model_var, fatigue_criterion_var, load_ratio_var, temperatures_var, clamped_parts_frames
     bolt_size_var.set("")
     shank_length_var.set("")
     thread_length_var.set("")
@@ -995,20 +2032,26 @@ def clear_inputs():
     shear_force_var.set("")
     shear_area_var.set("Thread")
     safety_basis_var.set("Yield")
-    for frame in clamped_parts_frames[:]:
-        frame.winfo_children()[0].master.destroy()
+    clamped_model_var.set("Prismatic")
+    fatigue_criterion_var.set("Goodman")
+    load_ratio_var.set("0")
+    temperatures_var.set("")
+    for part in clamped_parts_frames:
+        part['frame'].destroy()
     clamped_parts_frames.clear()
     if canvas:
         canvas.get_tk_widget().destroy()
+        plt.close(canvas.figure)
         canvas = None
 
 def clear_results():
-    global results_history
-    results_history = []
+    global results_history, live_result
+    results_history.clear()
+    live_result = None
     update_results_table()
 
 def test_values():
-    global bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, shear_area_var, safety_basis_var
+    global bolt_size_var, shank_length_var, thread_length_var, material_var, preload_percent_var, tensile_force_var, shear_force_var, shear_area_var, safety_basis_var, clamped_model_var, fatigue_criterion_var, load_ratio_var, temperatures_var
     clear_inputs()
     root.update()
     bolt_size_var.set("M10")
@@ -1020,6 +2063,10 @@ def test_values():
     shear_force_var.set("5000")
     shear_area_var.set("Thread")
     safety_basis_var.set("Yield")
+    clamped_model_var.set("Prismatic")
+    fatigue_criterion_var.set("Goodman")
+    load_ratio_var.set("0")
+    temperatures_var.set("")
     add_clamped_part(type="Plate", thickness="10", material="Steel", area="100")
     add_clamped_part(type="Washer", thickness="5", material="Aluminum", area="80")
     root.update()
@@ -1035,8 +2082,8 @@ def test_parametric_values():
     param_preload_percent_var.set("60,70,80")  # %60-80
     param_tensile_force_var.set("5000,10000,15000")  # 5000-15000 N
     # Test için sıkıştırılan parçalar ekle
-    for frame in parametric_clamped_parts_frames[:]:
-        frame['type_var'].master.destroy()
+    for part in parametric_clamped_parts_frames:
+        part['frame'].destroy()
     parametric_clamped_parts_frames.clear()
     add_param_clamped_part(parametric_clamped_parts_frame, type="Plate", thickness="10", material="Steel", area="100")
     add_param_clamped_part(parametric_clamped_parts_frame, type="Washer", thickness="5", material="Aluminum", area="80")
@@ -1051,12 +2098,12 @@ def export_to_excel():
         return
     file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")])
     if file_path:
-        df = pd.DataFrame(results_history)
+        df = pd.DataFrame(list(results_history))  # SQLite'a taşınmış eski hesaplar dahil
         df.to_excel(file_path, index=False)
         messagebox.showinfo("Başarılı", f"Veriler '{file_path}' dosyasına kaydedildi.")
 
 def save_material():
-    global current_material, material_entry, material_var
+    global current_material, material_var
     name = material_name_var.get().strip()
     try:
         if not name:
@@ -1079,27 +2126,59 @@ def save_material():
         density = float(material_density_var.get()) if material_density_var.get() else 8.0
         if density <= 0:
             raise ValueError("Yoğunluk 0'dan büyük olmalıdır.")
+        endurance_limit = float(material_endurance_var.get()) if material_endurance_var.get() else None
+        if endurance_limit is not None and not 0 < endurance_limit <= ultimate_strength:
+            raise ValueError("Yorulma dayanımı 0'dan büyük ve nihai dayanımdan küçük olmalıdır.")
+        thermal_expansion = float(material_expansion_var.get()) if material_expansion_var.get() else None
+        if thermal_expansion is not None and thermal_expansion < 0:
+            raise ValueError("Isıl genleşme katsayısı negatif olamaz.")
+        modulus_temp_coeff = float(material_modulus_coeff_var.get()) if material_modulus_coeff_var.get() else None
+        if modulus_temp_coeff is not None and not -100 < modulus_temp_coeff < 100:
+            raise ValueError("E sıcaklık katsayısı -100 ile 100 arasında olmalıdır.")
         
         if current_material and current_material != name and name in materials:
             if not messagebox.askyesno("Uyarı", f"'{name}' zaten var. Üzerine yazmak ister misiniz?"):
                 return
-        materials[name] = {
+        event = materials.save(name, {
             'E': E,
             'yield_strength': yield_strength,
             'ultimate_strength': ultimate_strength,
             'poisson_ratio': poisson_ratio,
             'percent_elongation': percent_elongation,
-            'density': density
-        }
+            'density': density,
+            'endurance_limit': endurance_limit,
+            'thermal_expansion': thermal_expansion,
+            'modulus_temp_coeff': modulus_temp_coeff
+        })
         current_material = name
         material_var.set(name)
-        material_entry['values'] = list(materials.keys())
         clear_material_inputs()
-        update_material_table()
-        plot_stress_strain(name)
+        upsert_material_row(name)
+        if name in stress_strain_lines:
+            plot_stress_strain([n for n, (_, line) in stress_strain_lines.items() if line.get_visible()])
     except ValueError as e:
         messagebox.showerror("Giriş Hatası", str(e))
 
+def import_materials():
+    file_path = filedialog.askopenfilename(filetypes=[("CSV / Excel", "*.csv *.xlsx"), ("All files", "*.*")])
+    if not file_path:
+        return
+    try:
+        events, rejected = materials.import_file(file_path)
+    except (OSError, ValueError, ImportError, zipfile.BadZipFile) as e:
+        # ImportError: Excel için openpyxl/xlrd kurulu değil; BadZipFile: bozuk .xlsx
+        messagebox.showerror("Hata", f"Dosya içe aktarılamadı: {e}")
+        return
+    for name in events:
+        upsert_material_row(name)
+    report = (f"{sum(e == 'insert' for e in events.values())} malzeme eklendi, "
+              f"{sum(e == 'update' for e in events.values())} malzeme güncellendi, {len(rejected)} satır reddedildi.")
+    if rejected:
+        report += "\n\n" + "\n".join(f"Satır {row} ({name or '-'}): {reason}" for row, name, reason in rejected[:20])
+        if len(rejected) > 20:
+            report += f"\n... ve {len(rejected) - 20} satır daha"
+    messagebox.showinfo("İçe Aktarma", report)
+
 def new_material():
     global current_material
     current_material = None
@@ -1109,20 +2188,18 @@ def delete_material():
     global current_material, material_tree, materials, material_var
     selected = material_tree.selection()
     if selected:
-        name = material_tree.item(selected[0])['values'][0]
-        if name in materials:
-            del materials[name]
-            material_var.set('Steel' if 'Steel' in materials else list(materials.keys())[0] if materials else '')
+        name = selected[0]
+        if materials.delete(name):
             if current_material == name:
                 current_material = None
                 clear_material_inputs()
-            update_material_table()
+            material_tree.delete(name)
 
 def on_material_select(event):
     global current_material, material_tree
     selected = material_tree.selection()
     if selected:
-        name = material_tree.item(selected[0])['values'][0]
+        name = selected[0]
         material = materials.get(name)
         if material:
             current_material = name
@@ -1133,10 +2210,13 @@ def on_material_select(event):
             material_poisson_var.set(str(material['poisson_ratio']))
             material_elongation_var.set(str(material['percent_elongation']) if material['percent_elongation'] is not None else "")
             material_density_var.set(str(material['density']))
-            update_material_table()
+            material_endurance_var.set(str(material['endurance_limit']) if material.get('endurance_limit') is not None else "")
+            material_expansion_var.set(str(material['thermal_expansion']) if material.get('thermal_expansion') is not None else "")
+            material_modulus_coeff_var.set(str(material['modulus_temp_coeff']) if material.get('modulus_temp_coeff') is not None else "")
+        plot_stress_strain(list(selected))
 
 def clear_material_inputs():
-    global material_name_var, material_E_var, material_yield_var, material_ultimate_var, material_poisson_var, material_elongation_var, material_density_var
+    global material_name_var, material_E_var, material_yield_var, material_ultimate_var, material_poisson_var, material_elongation_var, material_density_var, material_endurance_var, material_expansion_var, material_modulus_coeff_var
     material_name_var.set("")
     material_E_var.set("")
     material_yield_var.set("")
@@ -1144,56 +2224,79 @@ def clear_material_inputs():
     material_poisson_var.set("")
     material_elongation_var.set("")
     material_density_var.set("")
+    material_endurance_var.set("")
+    material_expansion_var.set("")
+    material_modulus_coeff_var.set("")
+
+def material_row_values(name, props):
+    return [
+        name,
+        str(props['E'] / 1000),
+        str(props['yield_strength']),
+        str(props['ultimate_strength']),
+        str(props['poisson_ratio']),
+        str(props['percent_elongation']) if props['percent_elongation'] is not None else "",
+        str(props['density']),
+        str(props['endurance_limit']) if props.get('endurance_limit') is not None else "",
+        str(props['thermal_expansion']) if props.get('thermal_expansion') is not None else "",
+        str(props['modulus_temp_coeff']) if props.get('modulus_temp_coeff') is not None else ""
+    ]
+
+def upsert_material_row(name):
+    # Tablo yeniden kurulmaz; yalnızca değişen satır eklenir veya güncellenir
+    global material_tree
+    values = material_row_values(name, materials[name])
+    if material_tree.exists(name):
+        material_tree.item(name, values=values)
+    else:
+        material_tree.insert("", "end", iid=name, values=values)
 
 def update_material_table():
+    # Sekme oluşturulurken tablonun tamamını bir kez doldurur
     global material_tree, materials
     for item in material_tree.get_children():
         material_tree.delete(item)
-    headers = ["Malzeme Adı", "Elastiklik Modülü (GPa)", "Verim Dayanımı (MPa)", "Nihai Dayanım (MPa)", "Poisson Oranı", "Uzama Yüzdesi (%)", "Yoğunluk (g/cm³)"]
-    material_tree["columns"] = headers
-    for col in headers:
+    material_tree["columns"] = material_table_headers
+    for col in material_table_headers:
         material_tree.column(col, anchor="w", width=120)
         material_tree.heading(col, text=col, anchor="w")
     for name, props in materials.items():
-        values = [
-            name,
-            str(props['E'] / 1000),
-            str(props['yield_strength']),
-            str(props['ultimate_strength']),
-            str(props['poisson_ratio']),
-            str(props['percent_elongation']) if props['percent_elongation'] is not None else "",
-            str(props['density'])
-        ]
-        material_tree.insert("", "end", values=values)
-
-def plot_stress_strain(material_name):
-    material = materials.get(material_name)
-    if not material:
+        material_tree.insert("", "end", iid=name, values=material_row_values(name, props))
+
+def stress_strain_points(props):
+    strain_yield = props['yield_strength'] / props['E']
+    strain_ultimate = props['percent_elongation'] / 100 if props.get('percent_elongation') else strain_yield * 1.5
+    return [0, strain_yield, strain_ultimate], [0, props['yield_strength'], props['ultimate_strength']]
+
+def plot_stress_strain(material_names):
+    # Seçili malzemeler önizleme panelinde üst üste gösterilir. Çizgiler malzeme sürümü başına
+    # bir kez oluşturulur; seçim değişince yalnızca görünürlükleri değişir.
+    global stress_strain_lines
+    if stress_strain_figure is None:
         return
-    E = material['E']
-    yield_strength = material['yield_strength']
-    ultimate_strength = material['ultimate_strength']
-    percent_elongation = material.get('percent_elongation', None)
-    
-    strain_yield = yield_strength / E
-    strain_ultimate = percent_elongation / 100 if percent_elongation else strain_yield * 1.5
-    
-    strain = [0, strain_yield, strain_ultimate]
-    stress = [0, yield_strength, ultimate_strength]
-    
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(strain, stress, marker='o', label=f'{material_name} Stress-Strain', color='#2196F3')
-    ax.set_xlabel('Strain (mm/mm)')
-    ax.set_ylabel('Stress (MPa)')
-    ax.set_title(f'{material_name} Stress-Strain Eğrisi')
-    ax.grid(True)
-    ax.legend()
-    
-    plot_window = tk.Toplevel(root)
-    plot_window.title("Stress-Strain Eğrisi")
-    canvas = FigureCanvasTkAgg(fig, master=plot_window)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill='both', expand=True)
+    ax = stress_strain_figure.axes[0]
+    shown = [name for name in material_names if name in materials]
+    for name in shown:
+        version = materials.version(name)
+        cached = stress_strain_lines.get(name)
+        if cached and cached[0] == version:
+            continue
+        if cached:
+            cached[1].remove()
+        strain, stress = stress_strain_points(materials[name])
+        line, = ax.plot(strain, stress, marker='o', label=name)
+        stress_strain_lines[name] = (version, line)
+    for name, (_, line) in stress_strain_lines.items():
+        line.set_visible(name in shown)
+    visible = [stress_strain_lines[name][1] for name in shown]
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
+    if ax.get_legend():
+        ax.get_legend().remove()
+    if visible:
+        ax.legend(handles=visible, fontsize=8)
+    ax.set_title(shown[0] if len(shown) == 1 else '')
+    stress_strain_canvas.draw_idle()
 
 def render_latex_to_image(latex_text):
     fig, ax = plt.subplots(figsize=(len(latex_text) * 0.1 + 1, 1), dpi=100)
@@ -1271,10 +2374,15 @@ def export_parametric_to_excel():
     if not parametric_results:
         messagebox.showwarning("Uyarı", "Export edilecek veri yok!")
         return
-    file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")])
+    file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("All files", "*.*")])
     if file_path:
-        df = pd.DataFrame(parametric_results)
-        df.to_excel(file_path, index=False)
+        if file_path.lower().endswith(".csv"):
+            parametric_results.to_csv(file_path)
+        elif len(parametric_results) >= excel_row_limit:
+            messagebox.showerror("Hata", f"Excel en fazla {excel_row_limit - 1} satır destekler. Lütfen CSV olarak kaydedin.")
+            return
+        else:
+            parametric_results.to_dataframe().to_excel(file_path, index=False)
         messagebox.showinfo("Başarılı", f"Veriler '{file_path}' dosyasına kaydedildi.")
 
 # Ana pencere
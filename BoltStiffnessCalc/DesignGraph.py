@@ -0,0 +1,90 @@
+import numpy as np
+
+from BoltEngine import bolt_stiffness, clamped_stiffness, thermal_inputs, compute_stiffness_batch
+
+# Tekil tasarım için küçük bağımlılık grafiği.
+# Girdi düğümleri (cıvata boyutu, uzunluklar, parçalar, yükler...) değiştiğinde yalnızca
+# onlara bağlı türetilmiş düğümler geçersiz olur; örneğin yalnızca çekme kuvveti değişirse
+# k_cıvata ve k_kavrama önbellekten gelir, sadece kuvvet/çarpılma/güvenlik çıktıları hesaplanır.
+
+design_input_names = ["bolt_size", "L_shank", "L_thread", "props", "preload_percent", "F_ext_tensile", "F_ext_shear",
+                      "parts", "safety_basis", "shear_area", "clamped_model", "fatigue_criterion", "load_ratio",
+                      "temperatures", "sensitivities"]
+
+def same_value(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.shape(a) == np.shape(b) and np.array_equal(a, b)
+    return type(a) is type(b) and a == b
+
+class DependencyGraph:
+    def __init__(self):
+        self.values = {}
+        self.nodes = {}  # ad -> (fonksiyon, bağımlılıklar)
+        self.dependents = {}  # ad -> doğrudan bağımlı düğümler
+        self.evaluations = {}  # Düğüm başına hesaplama sayısı (geliştirici paneli için)
+
+    def input(self, name):
+        self.dependents.setdefault(name, [])
+
+    def node(self, name, function, dependencies):
+        self.nodes[name] = (function, list(dependencies))
+        self.dependents.setdefault(name, [])
+        self.evaluations[name] = 0
+        for dependency in dependencies:
+            self.dependents.setdefault(dependency, []).append(name)
+
+    def set(self, name, value):
+        if name in self.values and same_value(self.values[name], value):
+            return False
+        self.values[name] = value
+        self.invalidate(name)
+        return True
+
+    def update(self, values):
+        return [name for name, value in values.items() if self.set(name, value)]
+
+    def invalidate(self, name):
+        for dependent in self.dependents[name]:
+            if dependent in self.values:
+                del self.values[dependent]
+                self.invalidate(dependent)
+
+    def get(self, name):
+        if name not in self.values:
+            function, dependencies = self.nodes[name]
+            self.values[name] = function(*(self.get(dependency) for dependency in dependencies))
+            self.evaluations[name] += 1
+        return self.values[name]
+
+def design_graph(catalog):
+    def geometry(bolt_size):
+        (A_shank,), (A_thread,) = catalog.areas([bolt_size])
+        return A_shank, A_thread, catalog.nominal_diameter(bolt_size)
+
+    def k_bolt(props, geometry, L_shank, L_thread):
+        return bolt_stiffness(props['E'], geometry[0], geometry[1], L_shank, L_thread)
+
+    def k_clamped(parts, geometry, clamped_model):
+        return clamped_stiffness(parts, geometry[2], clamped_model)
+
+    def thermal(parts, props, temperatures, geometry, clamped_model):
+        return thermal_inputs(parts, props, np.asarray(temperatures, dtype=float), geometry[2], clamped_model)
+
+    def outputs(props, geometry, L_shank, L_thread, preload_percent, F_ext_tensile, F_ext_shear, k_bolt, k_clamped,
+                thermal, safety_basis, shear_area, load_ratio, fatigue_criterion, sensitivities):
+        return compute_stiffness_batch(props['E'], props['yield_strength'], props['ultimate_strength'], geometry[0], geometry[1],
+                                       L_shank, L_thread, preload_percent, F_ext_tensile, F_ext_shear, k_clamped,
+                                       safety_basis, shear_area, sensitivities, load_ratio, props.get('endurance_limit'),
+                                       fatigue_criterion, thermal, k_bolt=k_bolt)
+
+    graph = DependencyGraph()
+    for name in design_input_names:
+        graph.input(name)
+    graph.node("geometry", geometry, ["bolt_size"])
+    graph.node("k_bolt", k_bolt, ["props", "geometry", "L_shank", "L_thread"])
+    graph.node("k_clamped", k_clamped, ["parts", "geometry", "clamped_model"])
+    graph.node("thermal", thermal, ["parts", "props", "temperatures", "geometry", "clamped_model"])
+    graph.node("outputs", outputs, ["props", "geometry", "L_shank", "L_thread", "preload_percent", "F_ext_tensile",
+                                    "F_ext_shear", "k_bolt", "k_clamped", "thermal", "safety_basis", "shear_area",
+                                    "load_ratio", "fatigue_criterion", "sensitivities"])
+    return graph
@@ -0,0 +1,274 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from BoltEngine import compute_stiffness_batch, design_inputs, valid_combinations, output_columns, load_bolt_catalog
+from ParametricSweep import run_sweep
+from ResultStore import input_columns
+
+# Altın sonuç derlemi: sabit girdi kümeleri ve tam hassasiyetli beklenen çıktılar.
+# Hesap çekirdeği hızlandırılırken (vektörleştirme, önbellek, paralel) sayıların
+# kaymadığını doğrulamak için kullanılır.
+#   python GoldenCorpus.py verify                 -> tüm motorları derleme karşı doğrular
+#   python GoldenCorpus.py verify --engine batch  -> yalnızca bir motor
+#   python GoldenCorpus.py generate --force       -> derlemi mevcut motorla yeniden üretir
+# Malzeme ve parça özellikleri derlemde açıkça saklanır; materials.db'den bağımsızdır.
+#
+# Not: golden_corpus.json doğruladığı motorla üretilmiştir; yalnızca kaymayı yakalar, formül
+# hatalarını değil. Bu yüzden birkaç durum ayrıca temel sürümün skaler formülleriyle elle
+# hesaplanmış değerlerle (reference_values) karşılaştırılır; bunlar motordan bağımsızdır.
+
+corpus_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_corpus.json")
+default_rtol = 1e-9
+default_atol = 1e-9
+
+steel = {'E': 200000, 'yield_strength': 800, 'ultimate_strength': 1000, 'endurance_limit': None,
+         'thermal_expansion': 11.5, 'modulus_temp_coeff': 4.0}
+aluminum = {'E': 70000, 'yield_strength': 275, 'ultimate_strength': 310, 'endurance_limit': None,
+            'thermal_expansion': 23.4, 'modulus_temp_coeff': 6.0}
+
+def part(type, thickness, material, props, area):
+    return {'type': type, 'thickness': thickness, 'material': material, 'E': props['E'], 'area': area,
+            'thermal_expansion': props['thermal_expansion'], 'modulus_temp_coeff': props['modulus_temp_coeff']}
+
+# Arayüzdeki test_values ve test_parametric_values senaryolarının parçaları
+test_parts = [part('Plate', 10.0, 'Steel', steel, 100.0), part('Washer', 5.0, 'Aluminum', aluminum, 80.0)]
+
+test_design = {
+    'bolt_size': 'M10', 'L_shank': 30.0, 'L_thread': 10.0, 'material': steel, 'preload_percent': 70.0,
+    'F_ext_tensile': 10000.0, 'F_ext_shear': 5000.0, 'parts': test_parts,
+    'safety_basis': 'Yield', 'shear_area': 'Thread', 'clamped_model': 'Prismatic',
+    'fatigue_criterion': 'Goodman', 'load_ratio': 0.0, 'temperatures': [],
+}
+
+def variant(**changes):
+    return dict(test_design, **changes)
+
+single_cases = {
+    "test_values": test_design,
+    "cone_model": variant(clamped_model='Cone'),
+    "ultimate_basis": variant(safety_basis='Ultimate'),
+    "shank_shear_area": variant(shear_area='Shank'),
+    "gerber_r05": variant(fatigue_criterion='Gerber', load_ratio=0.5),
+    "asme_reversed": variant(fatigue_criterion='ASME', load_ratio=-1.0),
+    "thermal_span": variant(temperatures=[-40.0, 20.0, 150.0]),
+    "thermal_cone": variant(clamped_model='Cone', temperatures=[-40.0, 80.0, 200.0]),
+    "m24_heavy": variant(bolt_size='M24', L_shank=80.0, L_thread=30.0, F_ext_tensile=120000.0, F_ext_shear=40000.0,
+                         parts=[part('Plate', 40.0, 'Steel', steel, 900.0), part('Plate', 30.0, 'Aluminum', aluminum, 900.0)]),
+    "no_preload": variant(preload_percent=0.0),
+    "full_preload": variant(preload_percent=100.0),
+    "no_external_load": variant(F_ext_tensile=0.0, F_ext_shear=0.0),
+    "no_thread": variant(L_thread=0.0),
+    "aluminum_bolt": variant(material=aluminum),
+}
+
+# Temel sürümün compute_stiffness formülleriyle elle (motor kullanmadan) hesaplanan değerler:
+#   k = E·A/L, seri bağlantıda 1/k = Σ 1/k_i, F_V = %·R_p·A_s, Φ = k_S / (k_S + k_P),
+#   F_S = F_V + Φ·F_A, δ_P = (1 - Φ)·F_A / k_P, GF = R_p·A_s / F_S, τ = F_Q / A.
+# M10: A_gövde = 78.54 mm², A_diş = 58.00 mm²; çelik E = 200 GPa, R_p = 800, R_m = 1000 MPa;
+# parçalar 10 mm çelik (100 mm²) + 5 mm alüminyum pul (70 GPa, 80 mm²).
+k_bolt_ref = 1 / (30 / (200000 * 78.54) + 10 / (200000 * 58.0))    # 360760.2756 N/mm
+k_clamped_ref = 1 / (10 / (200000 * 100.0) + 5 / (70000 * 80.0))  # 717948.7179 N/mm
+load_factor_ref = k_bolt_ref / (k_bolt_ref + k_clamped_ref)
+preload_ref = 0.70 * 800 * 58.0                                    # 32480 N
+bolt_force_ref = preload_ref + load_factor_ref * 10000             # 35824.37 N
+reference_values = {
+    "test_values": {
+        "stiffness": k_bolt_ref,
+        "clamped_stiffness": k_clamped_ref,
+        "bolt_force": bolt_force_ref,
+        "bolt_deflection": bolt_force_ref / k_bolt_ref,
+        "clamped_deflection": (1 - load_factor_ref) * 10000 / k_clamped_ref,
+        "shear_stress": 5000 / 58.0,
+        "safety_factor": 800 * 58.0 / bolt_force_ref,
+    },
+    "ultimate_basis": {"safety_factor": 1000 * 58.0 / bolt_force_ref},
+    "shank_shear_area": {"shear_stress": 5000 / 78.54},
+    "no_thread": {"stiffness": 200000 * 78.54 / 30},
+    "no_preload": {"bolt_force": load_factor_ref * 10000},
+    "full_preload": {"bolt_force": 800 * 58.0 + load_factor_ref * 10000},
+    "no_external_load": {"bolt_force": preload_ref, "clamped_deflection": 0.0, "safety_factor": 1 / 0.70},
+}
+
+sweep_cases = {
+    "test_parametric_values": {
+        'axes': {
+            "bolt_size": ["M6", "M8", "M10"],
+            "shank_length": [float(v) for v in range(10, 51, 5)],
+            "thread_length": [5.0, 10.0, 15.0, 20.0],
+            "preload_percent": [60.0, 70.0, 80.0],
+            "tensile_force": [5000.0, 10000.0, 15000.0],
+        },
+        'material': steel, 'parts': test_parts, 'F_ext_shear': 5000.0,
+        'safety_basis': 'Yield', 'shear_area': 'Thread', 'clamped_model': 'Prismatic',
+        'fatigue_criterion': 'Goodman', 'load_ratio': 0.0, 'temperatures': [],
+    },
+}
+sweep_cases["test_parametric_cone_thermal"] = dict(sweep_cases["test_parametric_values"], clamped_model='Cone',
+                                                  fatigue_criterion='Gerber', load_ratio=0.2, temperatures=[-40.0, 20.0, 150.0])
+
+catalog = load_bolt_catalog()
+
+def single_design(case):
+    return design_inputs(catalog, case['bolt_size'], case['L_shank'], case['L_thread'], case['material'],
+                         case['preload_percent'], case['F_ext_tensile'], case['F_ext_shear'], case['parts'],
+                         case['safety_basis'], case['shear_area'], case['clamped_model'], case['fatigue_criterion'],
+                         case['load_ratio'], case['temperatures'])
+
+def sweep_rows(case):
+    # Taramanın geçerli satırları, run_sweep ile aynı sırada: satır başına tekil tasarım girdileri
+    axes = {name: np.asarray(case['axes'][name]) for name in input_columns}
+    shape = tuple(len(axes[name]) for name in input_columns)
+    codes = np.unravel_index(np.arange(int(np.prod(shape))), shape)
+    values = {name: axes[name][c] for name, c in zip(input_columns, codes)}
+    valid = valid_combinations(values["shank_length"], values["thread_length"], values["preload_percent"])
+    return [dict(case, bolt_size=str(values["bolt_size"][i]), L_shank=float(values["shank_length"][i]),
+                 L_thread=float(values["thread_length"][i]), preload_percent=float(values["preload_percent"][i]),
+                 F_ext_tensile=float(values["tensile_force"][i]))
+            for i in np.flatnonzero(valid)]
+
+def evaluate_designs(cases):
+    # Tasarım başına tek tek (skaler) hesap; ProcessPoolExecutor'a da bu fonksiyon gönderilir
+    rows = []
+    for case in cases:
+        design = single_design(case)
+        out = compute_stiffness_batch(**design['inputs'], **design['options'], thermal=design['thermal'])
+        rows.append([float(out[name]) for name in output_columns])
+    return rows
+
+def columns_from_rows(rows):
+    rows = np.array(rows, dtype=float).reshape(-1, len(output_columns))
+    return {name: rows[:, i] for i, name in enumerate(output_columns)}
+
+# Motorlar: (tür, durum) -> {çıktı: dizi}
+def scalar_engine(kind, case):
+    return columns_from_rows(evaluate_designs([case] if kind == "single" else sweep_rows(case)))
+
+def batch_engine(kind, case):
+    if kind == "single":
+        design = single_design(case)
+        out = compute_stiffness_batch(**{name: np.atleast_1d(value) for name, value in design['inputs'].items()},
+                                      **design['options'], thermal=design['thermal'])
+        return {name: np.asarray(out[name], dtype=float).reshape(-1) for name in output_columns}
+    # Arayüzün kullandığı gerçek hat: run_sweep (bellek içi SQLite)
+    conn = sqlite3.connect(":memory:")
+    try:
+        store, _ = run_sweep(conn, catalog, {name: np.asarray(v) for name, v in case['axes'].items()},
+                             case['parts'], "corpus", case['material'], case['F_ext_shear'],
+                             case['safety_basis'], case['shear_area'], None, case['clamped_model'],
+                             case['fatigue_criterion'], case['load_ratio'], case['temperatures'])
+    finally:
+        conn.close()
+    return {name: np.array(store.column(name)) for name in output_columns}
+
+def multiprocess_engine(kind, case, workers=None):
+    if kind == "single":
+        return scalar_engine(kind, case)
+    rows = sweep_rows(case)
+    workers = workers or min(4, os.cpu_count() or 1)
+    chunks = [rows[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(evaluate_designs, chunks))
+    # Aralıklı bölünen satırlar özgün sıraya geri dizilir
+    ordered = [None] * len(rows)
+    for i, chunk in enumerate(results):
+        ordered[i::workers] = chunk
+    return columns_from_rows(ordered)
+
+engines = {"scalar": scalar_engine, "batch": batch_engine, "multiprocess": multiprocess_engine}
+
+def all_cases():
+    return [("single", name, case) for name, case in single_cases.items()] + \
+           [("sweep", name, case) for name, case in sweep_cases.items()]
+
+def generate(path=corpus_path, engine="scalar"):
+    corpus = {"engine": engine, "output_columns": output_columns, "cases": {}}
+    for kind, name, case in all_cases():
+        outputs = engines[engine](kind, case)
+        corpus["cases"][name] = {"kind": kind, "input": case,
+                                 "expected": {column: outputs[column].tolist() for column in output_columns}}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=1)
+    return corpus
+
+def load_corpus(path=corpus_path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(expected, actual, rtol=default_rtol, atol=default_atol):
+    # En büyük göreli sapma ve hatalı sütunlar; NaN ve sonsuzlar birbirine eşit sayılır
+    worst, failures = 0.0, []
+    for column, values in expected.items():
+        expected_values = np.asarray(values, dtype=float)
+        actual_values = np.asarray(actual.get(column, np.full_like(expected_values, np.nan)), dtype=float)
+        if expected_values.shape != actual_values.shape:
+            failures.append(f"{column}: {actual_values.shape} satır, beklenen {expected_values.shape}")
+            continue
+        if not np.allclose(actual_values, expected_values, rtol=rtol, atol=atol, equal_nan=True):
+            failures.append(column)
+        finite = np.isfinite(expected_values) & np.isfinite(actual_values)
+        if finite.any():
+            scale = np.maximum(np.abs(expected_values[finite]), atol)
+            worst = max(worst, float(np.max(np.abs(actual_values[finite] - expected_values[finite]) / scale)))
+    return worst, failures
+
+def verify(engine_names, corpus, rtol=default_rtol, atol=default_atol):
+    # Her motor ve durum için: (motor, durum, satır, süre, en büyük sapma, hatalar)
+    report = []
+    for engine in engine_names:
+        for name, entry in corpus["cases"].items():
+            start = time.perf_counter()
+            actual = engines[engine](entry["kind"], entry["input"])
+            elapsed = time.perf_counter() - start
+            worst, failures = compare(entry["expected"], actual, rtol, atol)
+            if name in reference_values:
+                reference_worst, reference_failures = compare({column: [value] for column, value in reference_values[name].items()},
+                                                              actual, rtol, atol)
+                worst = max(worst, reference_worst)
+                failures += [f"{column} (el hesabı)" for column in reference_failures]
+            report.append((engine, name, len(entry["expected"][output_columns[0]]), elapsed, worst, failures))
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Altın sonuç derlemi ile hesap motoru doğrulaması")
+    parser.add_argument("command", choices=["verify", "generate"])
+    parser.add_argument("--engine", choices=list(engines) + ["all"], default="all")
+    parser.add_argument("--rtol", type=float, default=default_rtol)
+    parser.add_argument("--atol", type=float, default=default_atol)
+    parser.add_argument("--corpus", default=corpus_path)
+    parser.add_argument("--force", action="store_true", help="mevcut derlemin üzerine yaz")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        if os.path.exists(args.corpus) and not args.force:
+            print("Derlem zaten var; üzerine yazmak için --force kullanın.")
+            return 1
+        corpus = generate(args.corpus, "scalar" if args.engine == "all" else args.engine)
+        print(f"{len(corpus['cases'])} durum yazıldı: {args.corpus}")
+        return 0
+
+    names = list(engines) if args.engine == "all" else [args.engine]
+    report = verify(names, load_corpus(args.corpus), args.rtol, args.atol)
+    failed = 0
+    print(f"{'motor':<14}{'durum':<32}{'satır':>7}{'satır/s':>12}{'maks sapma':>13}  sonuç")
+    for engine, name, rows, elapsed, worst, failures in report:
+        failed += bool(failures)
+        print(f"{engine:<14}{name:<32}{rows:>7}{rows / elapsed if elapsed else float('inf'):>12.3g}{worst:>13.2e}  "
+              f"{'HATA: ' + ', '.join(failures) if failures else 'tamam'}")
+    for engine in names:
+        rows = sum(r[2] for r in report if r[0] == engine)
+        elapsed = sum(r[3] for r in report if r[0] == engine)
+        print(f"{engine}: toplam {rows} satır, {rows / elapsed:.3g} satır/s")
+    if failed:
+        print(f"{failed} durum toleransın dışında (rtol={args.rtol}, atol={args.atol}).")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
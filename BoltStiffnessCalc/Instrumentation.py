@@ -0,0 +1,140 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows'ta yok; bellek göstergesi boş kalır
+    resource = None
+
+# Geliştirici modu için aşama zamanlayıcıları.
+# İş parçacığı (parametrik tarama) ve arayüz aynı nesneye yazar; okuma snapshot() ile
+# kilit altında yapılır. Aşama başına toplam süre ve çağrı sayısı, ayrıca sayaçlar
+# (ör. hesaplanan kombinasyon) ve anlık göstergeler (ör. kuyruk derinliği) tutulur.
+
+profile_rows = 25  # Profil özetinde gösterilen fonksiyon sayısı
+
+stage_order = ["generate", "compute", "store", "db_write", "queue", "ui_update", "plot", "single"]
+
+def peak_memory_mb():
+    if resource is None:
+        return None
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+class StageTimings:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.perf_counter()
+            self.stopped = None
+            self.stages = {}
+            self.counters = {}
+            self.gauges = {}
+
+    def finish(self):
+        # Çalıştırma bitince geçen süre dondurulur; hız değerleri sonradan düşmez
+        with self._lock:
+            self.stopped = time.perf_counter()
+
+    def add(self, name, seconds, calls=1):
+        with self._lock:
+            total, count = self.stages.get(name, (0.0, 0))
+            self.stages[name] = (total + seconds, count + calls)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        # Fonksiyon çağrılarını bir aşamaya işleyen dekoratör
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = (self.stopped or time.perf_counter()) - self.started
+            stages = dict(self.stages)
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+        total = sum(seconds for seconds, _ in stages.values())
+        ordered = sorted(stages, key=lambda name: (stage_order.index(name) if name in stage_order else len(stage_order), name))
+        compute = stages.get("compute", (0.0, 0))[0]
+        return {
+            "elapsed": elapsed,
+            "stages": {name: {"seconds": stages[name][0], "calls": stages[name][1],
+                              "share": stages[name][0] / total if total else 0.0} for name in ordered},
+            "counters": counters,
+            "gauges": dict(gauges, peak_memory_mb=peak_memory_mb()),
+            # Toplam: duvar saatine göre; hesap: yalnızca compute aşamasına göre kombinasyon/s
+            "throughput": counters.get("combinations", 0) / elapsed if elapsed else 0.0,
+            "compute_throughput": counters.get("combinations", 0) / compute if compute else 0.0,
+        }
+
+    def to_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+def profile_summary(profiler, limit=profile_rows):
+    # Kümülatif süreye göre en pahalı fonksiyonlar: (fonksiyon, çağrı, öz süre, kümülatif süre)
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({"function": f"{function} ({os.path.basename(filename)}:{line})", "calls": calls,
+                     "tottime": tottime, "cumtime": cumtime})
+    rows.sort(key=lambda row: row["cumtime"], reverse=True)
+    return rows[:limit]
+
+def save_profile(profiler, path, limit=profile_rows):
+    # .prof dosyası pstats, snakeviz veya speedscope (pstats içe aktarma) ile açılabilir
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    profiler.dump_stats(path)
+    return profile_summary(profiler, limit)
+
+# cProfile aynı anda tek profilleyiciye izin verir (Python 3.12+ ikincisinde ValueError verir);
+# profillenen çağrılar bu kilitle sırayla çalışır
+profile_lock = threading.Lock()
+
+@contextmanager
+def profiling():
+    # Blok, çağıran iş parçacığında cProfile altında çalışır; blok hata verse de profiler dolu döner
+    with profile_lock:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+
+def profile_call(function, *args, **kwargs):
+    # Fonksiyonu cProfile altında çalıştırır; (sonuç, profiler) döner
+    with profiling() as profiler:
+        result = function(*args, **kwargs)
+    return result, profiler
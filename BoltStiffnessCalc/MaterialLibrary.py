@@ -0,0 +1,333 @@
+import bisect
+import re
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+# SQLite üzerinde kalıcı malzeme kütüphanesi.
+# Tablo başlangıçta bir kez belleğe okunur; okuma işlemleri (materials[name]['E'] gibi)
+# bellekteki sözlükten yapılır, kayıt/silme ise tek satırlık işlemlerle diske yazılır.
+# Her değişiklik malzemenin sürüm numarasını artırır ve material_versions tablosuna işlenir.
+
+property_columns = ["E", "yield_strength", "ultimate_strength", "poisson_ratio", "percent_elongation", "density", "endurance_limit",
+                    "thermal_expansion", "modulus_temp_coeff"]
+
+# Toplu içe aktarmada kabul edilen sütun başlıkları (malzeme tablosundaki başlıklar dahil)
+import_aliases = {
+    "name": "name", "malzeme adı": "name", "malzeme": "name", "material": "name",
+    "e": "E", "e (gpa)": "E", "elastiklik modülü (gpa)": "E", "elastic modulus (gpa)": "E",
+    "yield_strength": "yield_strength", "verim dayanımı (mpa)": "yield_strength", "yield strength (mpa)": "yield_strength",
+    "ultimate_strength": "ultimate_strength", "nihai dayanım (mpa)": "ultimate_strength", "ultimate strength (mpa)": "ultimate_strength",
+    "poisson_ratio": "poisson_ratio", "poisson oranı": "poisson_ratio", "poisson's ratio": "poisson_ratio",
+    "percent_elongation": "percent_elongation", "uzama yüzdesi (%)": "percent_elongation", "percent elongation (%)": "percent_elongation",
+    "density": "density", "yoğunluk (g/cm³)": "density", "density (g/cm³)": "density",
+    "endurance_limit": "endurance_limit", "yorulma dayanımı (mpa)": "endurance_limit", "endurance limit (mpa)": "endurance_limit",
+    "thermal_expansion": "thermal_expansion", "ısıl genleşme (10⁻⁶/k)": "thermal_expansion", "thermal expansion (1e-6/k)": "thermal_expansion",
+    "modulus_temp_coeff": "modulus_temp_coeff", "e sıcaklık katsayısı (%/100 k)": "modulus_temp_coeff",
+    "e temperature coefficient (%/100 k)": "modulus_temp_coeff",
+}
+import_chunk_rows = 50000
+
+# Boş bir veritabanına ilk açılışta yazılan malzemeler (arayüz ve BoltService ortak kullanır)
+default_materials = {
+    'Steel': {'E': 200000, 'yield_strength': 800, 'ultimate_strength': 1000, 'poisson_ratio': 0.30, 'percent_elongation': 40, 'density': 7.85, 'thermal_expansion': 11.5, 'modulus_temp_coeff': 4.0},
+    'Aluminum': {'E': 70000, 'yield_strength': 275, 'ultimate_strength': 310, 'poisson_ratio': 0.33, 'percent_elongation': 12, 'density': 2.70, 'thermal_expansion': 23.4, 'modulus_temp_coeff': 6.0},
+    'Titanium': {'E': 110000, 'yield_strength': 800, 'ultimate_strength': 900, 'poisson_ratio': 0.34, 'percent_elongation': 10, 'density': 4.51, 'thermal_expansion': 8.6, 'modulus_temp_coeff': 5.0},
+}
+
+# Arama sorgusundaki özellik filtreleri, örn. "çelik E>150 yield>=500".
+# E, formdaki gibi GPa olarak yazılır; diğer alanlar depodaki birimlerle karşılaştırılır.
+filter_aliases = {
+    "e": ("E", 1000), "yield": ("yield_strength", 1), "verim": ("yield_strength", 1),
+    "ultimate": ("ultimate_strength", 1), "nihai": ("ultimate_strength", 1),
+    "poisson": ("poisson_ratio", 1), "nu": ("poisson_ratio", 1),
+    "elongation": ("percent_elongation", 1), "uzama": ("percent_elongation", 1),
+    "density": ("density", 1), "yogunluk": ("density", 1), "yoğunluk": ("density", 1),
+    "se": ("endurance_limit", 1), "endurance": ("endurance_limit", 1), "yorulma": ("endurance_limit", 1),
+    "alpha": ("thermal_expansion", 1), "cte": ("thermal_expansion", 1),
+}
+# Virgül yalnızca ondalık ayırıcı olarak kabul edilir. Binlik gruplamaya benzeyen değerler (1,200)
+# ve hem nokta hem virgül içerenler (1.200,5) belirsizdir; 1.2 gibi yanlış bir sayıya çevrilmez.
+ambiguous_number = r"[+-]?[1-9]\d{0,2},\d{3}|.*,.*[.,].*|.*\..*,.*"
+
+filter_pattern = re.compile(r"(\w+)\s*(<=|>=|<|>|=)\s*(-?\d+(?:[.,]\d+)?)")
+filter_operators = {
+    "<": lambda a, b: a < b, "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b, ">=": lambda a, b: a >= b, "=": lambda a, b: a == b,
+}
+
+def parse_material_query(query):
+    # Dönüş: (ad metni, [(özellik, operatör, değer), ...]); tanınmayan filtreler ad metninde kalır
+    filters = []
+    def take(match):
+        alias = filter_aliases.get(match.group(1).lower())
+        if alias is None:
+            return match.group(0)
+        column, scale = alias
+        if re.fullmatch(ambiguous_number, match.group(3)):
+            return match.group(0)
+        filters.append((column, match.group(2), float(match.group(3).replace(",", ".")) * scale))
+        return " "
+    text = filter_pattern.sub(take, query or "")
+    return " ".join(text.split()), filters
+
+def read_material_file(path):
+    # CSV parça parça, Excel tek seferde okunur; başlıklar iç sütun adlarına çevrilir
+    if path.lower().endswith((".xlsx", ".xls")):
+        chunks = [pd.read_excel(path, dtype=str)]
+    else:
+        chunks = pd.read_csv(path, dtype=str, chunksize=import_chunk_rows, skipinitialspace=True)
+    frames = [chunk.rename(columns=lambda c: import_aliases.get(str(c).strip().lower(), str(c).strip())) for chunk in chunks]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def validate_material_frame(df):
+    # save_material ile aynı kurallar, tüm satırlar için tek geçişte uygulanır.
+    # E dosyada GPa olarak beklenir (form ile aynı). Dönüş: ({ad: özellikler}, [(satır no, ad, neden)])
+    if "name" not in df or any(c not in df for c in ("E", "yield_strength", "ultimate_strength")):
+        raise ValueError("Dosyada ad, E, verim ve nihai dayanım sütunları bulunmalıdır.")
+    n = len(df)
+    names = df["name"].fillna("").astype(str).str.strip()
+
+    ambiguous = np.zeros(n, dtype=bool)
+
+    def numeric(column, default=np.nan):
+        if column not in df:
+            return np.full(n, default), np.zeros(n, dtype=bool)
+        raw = df[column].fillna("").astype(str).str.strip()
+        unclear = raw.str.fullmatch(ambiguous_number).to_numpy()
+        ambiguous[unclear] = True
+        values = pd.to_numeric(raw.str.replace(",", ".", regex=False).mask(unclear), errors="coerce").to_numpy(dtype=float)
+        blank = (raw == "").to_numpy()
+        return np.where(blank, default, values), ~blank & np.isnan(values)
+
+    E, bad_E = numeric("E")
+    yield_strength, bad_yield = numeric("yield_strength")
+    ultimate_strength, bad_ultimate = numeric("ultimate_strength")
+    poisson_ratio, bad_poisson = numeric("poisson_ratio", 0.3)
+    percent_elongation, bad_elongation = numeric("percent_elongation")
+    density, bad_density = numeric("density", 8.0)
+    endurance_limit, bad_endurance = numeric("endurance_limit")
+    thermal_expansion, bad_expansion = numeric("thermal_expansion")
+    modulus_temp_coeff, bad_modulus_coeff = numeric("modulus_temp_coeff")
+    E = E * 1000
+
+    checks = [
+        ((names == "").to_numpy(), "Malzeme adı boş olamaz."),
+        (ambiguous, "Belirsiz ondalık ayırıcı (ör. 1,200); binlik ayırıcı kullanmayın."),
+        (bad_E | bad_yield | bad_ultimate | bad_poisson | bad_elongation | bad_density | bad_endurance | bad_expansion | bad_modulus_coeff, "Sayısal olmayan değer."),
+        (~(E > 0), "Elastiklik modülü 0'dan büyük olmalıdır."),
+        (~(yield_strength > 0), "Verim dayanımı 0'dan büyük olmalıdır."),
+        (~((ultimate_strength > 0) & (ultimate_strength >= yield_strength)), "Nihai dayanım, verim dayanımından büyük ve pozitif olmalıdır."),
+        (~((poisson_ratio >= 0) & (poisson_ratio <= 0.5)), "Poisson oranı 0-0.5 arasında olmalıdır."),
+        (percent_elongation < 0, "Uzama yüzdesi negatif olamaz."),
+        (~(density > 0), "Yoğunluk 0'dan büyük olmalıdır."),
+        (~np.isnan(endurance_limit) & ~((endurance_limit > 0) & (endurance_limit <= ultimate_strength)),
+         "Yorulma dayanımı 0'dan büyük ve nihai dayanımdan küçük olmalıdır."),
+        (thermal_expansion < 0, "Isıl genleşme katsayısı negatif olamaz."),
+        (np.abs(modulus_temp_coeff) >= 100, "E sıcaklık katsayısı -100 ile 100 arasında olmalıdır."),
+    ]
+    # Her satır için ilk başarısız kuralın mesajı raporlanır
+    reason = np.full(n, "", dtype=object)
+    for failed, message in reversed(checks):
+        reason[failed] = message
+    # Aynı ad birden çok kez geçerse yalnızca son geçerli satır alınır; geçersiz tekrar önceki satırı düşürmez
+    valid_names = names[reason == ""]
+    reason[np.flatnonzero(reason == "")[valid_names.duplicated(keep="last").to_numpy()]] = \
+        "Aynı ad dosyada daha sonra geçerli bir satırla tekrar ediyor."
+    rejected_mask = reason != ""
+    rejected = [(int(i) + 2, names.iat[i], reason[i]) for i in np.flatnonzero(rejected_mask)]  # +2: başlık satırı ve 1 tabanlı numara
+
+    accepted = {}
+    for i in np.flatnonzero(~rejected_mask):
+        accepted[names.iat[i]] = {
+            'E': float(E[i]), 'yield_strength': float(yield_strength[i]), 'ultimate_strength': float(ultimate_strength[i]),
+            'poisson_ratio': float(poisson_ratio[i]),
+            'percent_elongation': None if np.isnan(percent_elongation[i]) else float(percent_elongation[i]),
+            'density': float(density[i]),
+            'endurance_limit': None if np.isnan(endurance_limit[i]) else float(endurance_limit[i]),
+            'thermal_expansion': None if np.isnan(thermal_expansion[i]) else float(thermal_expansion[i]),
+            'modulus_temp_coeff': None if np.isnan(modulus_temp_coeff[i]) else float(modulus_temp_coeff[i]),
+        }
+    return accepted, rejected
+
+class MaterialLibrary:
+    def __init__(self, path, defaults=None):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self._create_schema(defaults)
+        self._cache = {}
+        self._listeners = []
+        for row in self.conn.execute(f"SELECT name, version, {', '.join(property_columns)} FROM materials ORDER BY rowid"):
+            self._cache[row[0]] = {**dict(zip(property_columns, row[2:])), 'version': row[1]}
+        # Artan arama için küçük harfli, sıralı ad dizini: önek aramaları bisect ile yapılır
+        self._index = sorted((name.casefold(), name) for name in self._cache)
+        if not self._cache and defaults:
+            for name, props in defaults.items():
+                self.save(name, props)
+
+    def _create_schema(self, defaults=None):
+        columns = ", ".join(f"{name} REAL" for name in property_columns)
+        self.conn.execute(f'''CREATE TABLE IF NOT EXISTS materials (
+                          name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 1,
+                          updated TEXT DEFAULT CURRENT_TIMESTAMP, {columns})''')
+        self.conn.execute(f'''CREATE TABLE IF NOT EXISTS material_versions (
+                          name TEXT, version INTEGER, deleted INTEGER DEFAULT 0,
+                          changed TEXT DEFAULT CURRENT_TIMESTAMP, {columns})''')
+        # Sonradan eklenen özellik sütunları (ör. endurance_limit) mevcut veritabanlarına eklenir
+        for table in ("materials", "material_versions"):
+            existing = [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+            for name in property_columns:
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} REAL")
+        # Varsayılan malzemeler yalnızca boş veritabanına eklenir; eski veritabanlarındaki kayıtlarında
+        # sonradan eklenen sütunlar (ör. ısıl genleşme) boş kalmasın diye yalnızca NULL alanlar doldurulur
+        for name, props in (defaults or {}).items():
+            for column in property_columns:
+                if props.get(column) is not None:
+                    self.conn.execute(f"UPDATE materials SET {column} = ? WHERE name = ? AND {column} IS NULL",
+                                      (props[column], name))
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_materials_E ON materials (E)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_materials_yield ON materials (yield_strength)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_material_versions_name ON material_versions (name, version)")
+        self.conn.commit()
+
+    def __getitem__(self, name):
+        return self._cache[name]
+
+    def __contains__(self, name):
+        return name in self._cache
+
+    def __iter__(self):
+        return iter(self._cache)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def keys(self):
+        return self._cache.keys()
+
+    def items(self):
+        return self._cache.items()
+
+    def get(self, name, default=None):
+        return self._cache.get(name, default)
+
+    def version(self, name):
+        return self._cache[name]['version']
+
+    def subscribe(self, callback):
+        # callback(olay, adlar): olay 'insert', 'update' veya 'delete'; adlar değişen malzemelerin listesi
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, events):
+        grouped = {}
+        for name, event in events.items():
+            grouped.setdefault(event, []).append(name)
+        for event, names in grouped.items():
+            for callback in list(self._listeners):
+                callback(event, names)
+
+    def _index_add(self, name):
+        key = (name.casefold(), name)
+        i = bisect.bisect_left(self._index, key)
+        if i == len(self._index) or self._index[i] != key:
+            self._index.insert(i, key)
+
+    def _index_remove(self, name):
+        key = (name.casefold(), name)
+        i = bisect.bisect_left(self._index, key)
+        if i < len(self._index) and self._index[i] == key:
+            del self._index[i]
+
+    def search(self, query="", limit=None):
+        # Önce önek eşleşmeleri (alfabetik), ardından ad içinde geçenler; özellik filtreleri sonra uygulanır
+        text, filters = parse_material_query(query)
+        text = text.casefold()
+        if text:
+            start = bisect.bisect_left(self._index, (text,))
+            end = bisect.bisect_left(self._index, (text + "\U0010ffff",))
+            prefix = [name for _, name in self._index[start:end]]
+            others = [name for key, name in self._index[:start] + self._index[end:] if text in key]
+            candidates = prefix + others
+        else:
+            candidates = [name for _, name in self._index]
+        matches = []
+        for name in candidates:
+            props = self._cache[name]
+            if all(props.get(column) is not None and filter_operators[op](props[column], value) for column, op, value in filters):
+                matches.append(name)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def _next_version(self, name):
+        # Silinip yeniden eklenen malzemenin sürümü geçmişteki en yüksek sürümden devam eder
+        row = self.conn.execute("SELECT MAX(version) FROM material_versions WHERE name = ?", (name,)).fetchone()
+        return (row[0] or 0) + 1
+
+    def save(self, name, props):
+        # Yeni malzeme için 'insert', mevcut malzeme için 'update' döner
+        values = [props.get(column) for column in property_columns]
+        version = self._next_version(name)
+        with self.conn:
+            self.conn.execute(f'''INSERT INTO materials (name, version, {', '.join(property_columns)})
+                              VALUES (?, ?, {', '.join('?' * len(property_columns))})
+                              ON CONFLICT(name) DO UPDATE SET version = excluded.version, updated = CURRENT_TIMESTAMP,
+                              {', '.join(f"{c} = excluded.{c}" for c in property_columns)}''', [name, version, *values])
+            self.conn.execute(f'''INSERT INTO material_versions (name, version, {', '.join(property_columns)})
+                              VALUES (?, ?, {', '.join('?' * len(property_columns))})''', [name, version, *values])
+        event = 'update' if name in self._cache else 'insert'
+        self._cache[name] = {**dict(zip(property_columns, values)), 'version': version}
+        self._index_add(name)
+        self._notify({name: event})
+        return event
+
+    def save_many(self, records):
+        # Tek işlemde toplu kayıt; {ad: olay ('insert'/'update')} döner
+        rows, events = [], {}
+        latest = dict(self.conn.execute("SELECT name, MAX(version) FROM material_versions GROUP BY name"))
+        for name, props in records.items():
+            version = latest.get(name, 0) + 1
+            rows.append([name, version, *(props.get(column) for column in property_columns)])
+            events[name] = 'update' if name in self._cache else 'insert'
+        placeholders = ', '.join('?' * len(property_columns))
+        with self.conn:
+            self.conn.executemany(f'''INSERT INTO materials (name, version, {', '.join(property_columns)})
+                                  VALUES (?, ?, {placeholders})
+                                  ON CONFLICT(name) DO UPDATE SET version = excluded.version, updated = CURRENT_TIMESTAMP,
+                                  {', '.join(f"{c} = excluded.{c}" for c in property_columns)}''', rows)
+            self.conn.executemany(f'''INSERT INTO material_versions (name, version, {', '.join(property_columns)})
+                                  VALUES (?, ?, {placeholders})''', rows)
+        for name, version, *values in rows:
+            self._cache[name] = {**dict(zip(property_columns, values)), 'version': version}
+            self._index_add(name)
+        self._notify(events)
+        return events
+
+    def import_file(self, path):
+        accepted, rejected = validate_material_frame(read_material_file(path))
+        return self.save_many(accepted), rejected
+
+    def delete(self, name):
+        if name not in self._cache:
+            return False
+        with self.conn:
+            self.conn.execute("DELETE FROM materials WHERE name = ?", (name,))
+            self.conn.execute("INSERT INTO material_versions (name, version, deleted) VALUES (?, ?, 1)",
+                              (name, self._next_version(name)))
+        del self._cache[name]
+        self._index_remove(name)
+        self._notify({name: 'delete'})
+        return True
+
+    def history(self, name):
+        return self.conn.execute(f"SELECT version, deleted, changed, {', '.join(property_columns)} FROM material_versions "
+                                 "WHERE name = ? ORDER BY version", (name,)).fetchall()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,207 @@
+import json
+import os
+
+import numpy as np
+
+from BoltEngine import compute_stiffness_batch, clamped_stiffness, thermal_inputs, output_columns
+from Instrumentation import StageTimings
+from ResultStore import ParametricResults, input_columns, column_labels
+
+# Parametrik tarama hattı (Tkinter'a bağımlı değildir).
+# Eksenlerin kartezyen çarpımı parça parça hesaplanır, sonuçlar ParametricResults deposuna
+# eklenir ve SQLite'a (veya diskte sütun başına .npy dosyalarına) yazılır. Arayüzdeki iş
+# parçacığı ve BoltBenchmark aynı fonksiyonu kullanır.
+
+chunk_size = 65536  # Tek seferde hesaplanan kombinasyon sayısı
+
+# valid_combinations kuralları eksen başına: her kural yalnızca kendi eksenine bağlı olduğundan
+# geçersiz değerler tarama başlamadan eksenden çıkarılabilir
+axis_rules = {
+    "shank_length": (lambda values: values > 0, "0'dan büyük olmalıdır"),
+    "thread_length": (lambda values: values >= 0, "negatif olamaz"),
+    "preload_percent": (lambda values: (values >= 0) & (values <= 100), "0-100 arasında olmalıdır"),
+}
+
+def validate_axes(catalog, raw):
+    # Tarama başlamadan her eksen bir kez doğrulanır; hatalar tek bir listede toplanır.
+    # raw: eksen adı -> değer listesi (metin veya sayı). Dönüş: (eksenler, hatalar, dışlanan değerler)
+    # Sayısal olmayan değerler ve bilinmeyen cıvata boyutları hatadır; aralık dışı değerler eksenden
+    # çıkarılır, onları içeren kombinasyonlar hesaplanmaz, yalnızca sayılır (excluded_combinations).
+    errors, excluded = [], {}
+    sizes = list(dict.fromkeys(str(v).strip() for v in raw.get("bolt_size") or [] if str(v).strip()))
+    unknown = [v for v in sizes if v not in catalog]
+    if unknown:
+        errors.append(f"Geçersiz cıvata boyutu: {', '.join(unknown)}")
+    axes = {"bolt_size": np.array(sorted((v for v in sizes if v in catalog), key=catalog.sort_key))}
+    for name in input_columns[1:]:
+        values, invalid = [], []
+        for v in raw.get(name) or []:
+            try:
+                value = float(v)
+            except (TypeError, ValueError):
+                value = np.nan
+            (values if np.isfinite(value) else invalid).append(value if np.isfinite(value) else str(v).strip())
+        if invalid:
+            errors.append(f"{column_labels[name]} değerleri sayısal olmalıdır: {', '.join(invalid)}")
+        values = np.unique(values)
+        if name in axis_rules:
+            rule, message = axis_rules[name]
+            valid = rule(values)
+            if not valid.all():
+                excluded[name] = values[~valid]
+                values = values[valid]
+        axes[name] = values
+    for name in input_columns:
+        if not len(axes[name]) and not (name == "bolt_size" and unknown):
+            reason = f" (değerler {axis_rules[name][1]})" if name in excluded else ""
+            errors.append(f"{column_labels[name]} için geçerli değer yok{reason}.")
+    return axes, errors, excluded
+
+def excluded_combinations(axes, excluded):
+    # Dışlanan değerler yüzünden hesaplanmayacak kombinasyon sayısı
+    full = int(np.prod([len(axes[name]) + len(excluded.get(name, ())) for name in input_columns]))
+    return full - int(np.prod([len(axes[name]) for name in input_columns]))
+
+def init_results_db(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS runs (
+                 id INTEGER PRIMARY KEY AUTOINCREMENT, created TEXT DEFAULT CURRENT_TIMESTAMP,
+                 material TEXT, safety_basis TEXT, combinations INTEGER, path TEXT, fatigue_criterion TEXT,
+                 status TEXT, material_props TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS run_results (
+                 run_id INTEGER,
+                 bolt_size TEXT, shank_length REAL, thread_length REAL,
+                 preload_percent REAL, tensile_force REAL,
+                 stiffness REAL, clamped_stiffness REAL,
+                 bolt_force REAL, bolt_deflection REAL,
+                 clamped_deflection REAL, shear_stress REAL,
+                 safety_factor REAL, alternating_stress REAL,
+                 mean_stress REAL, fatigue_safety_factor REAL,
+                 min_preload REAL, max_preload REAL)''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_results_run ON run_results (run_id)")
+    run_columns = [row[1] for row in conn.execute("PRAGMA table_info(runs)")]
+    for name in ("path", "fatigue_criterion", "status", "material_props"):
+        if name not in run_columns:
+            conn.execute(f"ALTER TABLE runs ADD COLUMN {name} TEXT")
+    if "status" not in run_columns:
+        # Durum sütunundan önceki çalıştırmalar yalnızca tamamlandığında okunabiliyordu
+        conn.execute("UPDATE runs SET status = 'done'")
+    # Eski veritabanlarına sonradan eklenen çıktı sütunları (min_preload, max_preload vb.)
+    existing = [row[1] for row in conn.execute("PRAGMA table_info(run_results)")]
+    for name in output_columns:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE run_results ADD COLUMN {name} REAL")
+    conn.commit()
+
+def set_run_status(conn, run_id, status):
+    conn.execute("UPDATE runs SET status = ? WHERE id = ?", (status, run_id))
+    conn.commit()
+
+def run_sweep(conn, catalog, axes, parts, material, props, F_ext_shear, safety_basis, shear_area,
+              results_root=None, clamped_model="Prismatic", fatigue_criterion="Goodman", load_ratio=0.0,
+              temperatures=(), progress=None, cancelled=None, chunk=chunk_size, timings=None):
+    # results_root verilirse satırlar SQLite yerine results_root/run_<id> klasörüne yazılır.
+    # timings (StageTimings) verilirse aşama süreleri ona işlenir. Dönüş: (depo, iptal edildi mi)
+    # Eksenler validate_axes'ten geçmiş olmalıdır: her kombinasyon geçerlidir, dışlananlar orada sayılır
+    for name, (rule, message) in axis_rules.items():
+        values = np.asarray(axes[name], dtype=float)
+        invalid = values[~rule(values)]
+        if len(invalid):
+            raise ValueError(f"{column_labels[name]} değerleri {message}: {', '.join(f'{v:g}' for v in invalid)}")
+    timings = timings or StageTimings()
+    shape = tuple(len(axes[name]) for name in input_columns)
+    total_combinations = int(np.prod(shape))
+    A_shank_axis, A_thread_axis = catalog.areas(list(axes["bolt_size"]))
+    # Kavrama sertliği yalnızca cıvata çapına bağlıdır; eksen başına bir kez hesaplanıp satırlara indekslenir
+    d_axis = np.array([catalog.nominal_diameter(size) for size in axes["bolt_size"]])
+    k_clamped_axis = np.broadcast_to(clamped_stiffness(parts, d_axis, clamped_model), d_axis.shape)
+    thermal_axis = thermal_inputs(parts, {**props, 'name': material}, temperatures, d_axis, clamped_model)
+
+    init_results_db(conn)
+    # Durum: 'running' -> 'done' / 'canceled' / 'error'. "Son çalıştırma" yalnızca tamamlananlar arasından seçilir
+    # Malzeme özellikleri de saklanır: malzeme sonradan silinse/değişse de diyagramlar çalıştırma anındaki değerlerle çizilir
+    run_id = conn.execute("INSERT INTO runs (material, safety_basis, combinations, fatigue_criterion, status, material_props) "
+                          "VALUES (?, ?, ?, ?, 'running', ?)",
+                          (material, safety_basis, total_combinations, fatigue_criterion, json.dumps(props))).lastrowid
+    conn.commit()
+    # Diske yazılan taramalarda satırlar SQLite yerine sütun başına .npy dosyalarına gider
+    directory = os.path.join(results_root, f"run_{run_id}") if results_root else None
+    if directory:
+        conn.execute("UPDATE runs SET path = ? WHERE id = ?", (directory, run_id))
+    store = ParametricResults(axes, safety_basis=safety_basis, capacity=total_combinations, directory=directory,
+                              meta={'run_id': run_id, 'material': material, 'material_props': props,
+                                    'clamped_parts': parts, 'clamped_model': clamped_model,
+                                    'fatigue_criterion': fatigue_criterion, 'load_ratio': load_ratio,
+                                    'temperatures': [float(t) for t in temperatures],
+                                    'shear_force': F_ext_shear, 'shear_area': shear_area})
+    insert = (f"INSERT INTO run_results (run_id, {', '.join(input_columns + output_columns)}) "
+              f"VALUES ({', '.join('?' * (1 + len(input_columns) + len(output_columns)))})")
+    try:
+        for start in range(0, total_combinations, chunk):
+            if cancelled and cancelled():
+                set_run_status(conn, run_id, "canceled")
+                store.flush()
+                return store, True
+            stop = min(start + chunk, total_combinations)
+            with timings.stage("generate"):
+                codes = dict(zip(input_columns, np.unravel_index(np.arange(start, stop), shape)))
+                values = {name: axes[name][codes[name]] for name in input_columns[1:]}
+                bolt = codes["bolt_size"]
+            with timings.stage("compute"):
+                outputs = compute_stiffness_batch(
+                    props['E'], props['yield_strength'], props['ultimate_strength'],
+                    A_shank_axis[bolt], A_thread_axis[bolt],
+                    values["shank_length"], values["thread_length"], values["preload_percent"],
+                    values["tensile_force"], F_ext_shear, k_clamped_axis[bolt], safety_basis, shear_area,
+                    load_ratio=load_ratio, endurance=props.get('endurance_limit'), fatigue_criterion=fatigue_criterion,
+                    thermal=thermal_axis and {**thermal_axis, 'compliances': thermal_axis['compliances'][:, bolt]})
+            with timings.stage("store"):
+                store.append(codes, outputs)
+            if not directory:
+                with timings.stage("db_write"):
+                    conn.executemany(insert, zip([run_id] * len(bolt), axes["bolt_size"][bolt].tolist(),
+                                                 *(values[name].tolist() for name in input_columns[1:]),
+                                                 *(outputs[name].tolist() for name in output_columns)))
+                    # Parça başına işlenir; eşzamanlı taramalar yazma kilidini tüm çalıştırma boyunca beklemez
+                    conn.commit()
+            timings.count("combinations", stop - start)
+            timings.gauge("store_mb", store.nbytes / (1 << 20))
+            if progress:
+                progress(stop, total_combinations)
+        with timings.stage("db_write" if not directory else "store"):
+            store.flush()
+            set_run_status(conn, run_id, "done")
+        return store, False
+    except Exception:
+        # Yarıda kalan çalıştırma "son çalıştırma" olarak yüklenmez
+        set_run_status(conn, run_id, "error")
+        raise
+
+def load_run(conn, run_id=None, categorical_order=None):
+    # Son tamamlanan (veya verilen) çalıştırmayı okur; diskteki çalıştırmalar yalnızca eşlenir.
+    # Depo meta['status'] ile döner; sonuç klasörü silinmişse FileNotFoundError verir
+    init_results_db(conn)
+    columns = "id, material, safety_basis, path, fatigue_criterion, status, material_props"
+    if run_id is None:
+        row = conn.execute(f"SELECT {columns} FROM runs WHERE status = 'done' ORDER BY id DESC LIMIT 1").fetchone()
+    else:
+        row = conn.execute(f"SELECT {columns} FROM runs WHERE id = ?", (run_id,)).fetchone()
+    if row is None:
+        return None
+    run_id, material, safety_basis, path, fatigue_criterion, status, material_props = row
+    if path:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Çalıştırma {run_id} için sonuç klasörü bulunamadı: {path}")
+        store = ParametricResults.open(path)
+        store.meta['status'] = status
+        return store
+    names = input_columns + output_columns
+    rows = conn.execute(f"SELECT {', '.join(names)} FROM run_results WHERE run_id = ?", (run_id,)).fetchall()
+    if not rows:
+        return None
+    columns = dict(zip(names, zip(*rows)))
+    return ParametricResults.from_columns(
+        {name: columns[name] for name in input_columns},
+        {name: np.array(columns[name], dtype=float) for name in output_columns},
+        safety_basis=safety_basis, categorical_order=categorical_order,
+        meta={'run_id': run_id, 'material': material, 'fatigue_criterion': fatigue_criterion or 'Goodman',
+              'status': status, 'material_props': json.loads(material_props) if material_props else None})
@@ -0,0 +1,103 @@
+import collections
+import json
+import os
+import sqlite3
+import time
+
+# Tekil hesap geçmişi için sabit kapasiteli halka tampon.
+# Tabloda görünen son hesaplar RAM'de tutulur; tampon dolunca en eski kayıt SQLite'taki
+# history tablosuna taşınır. Taşınan kayıtlar istendiğinde (eski hesaplar penceresi,
+# Excel'e aktarma, görünen hesap sayısının artırılması) veritabanından geri okunur.
+# Her kayıt oturum içinde artan bir sıra numarasıyla tutulur.
+
+history_page = 100  # Eski hesaplar penceresinde bir seferde okunan kayıt sayısı
+kept_sessions = 3  # Açılışta tutulan en yeni oturum sayısı (aynı anda açık başka pencereler için); eskiler silinir
+
+class ResultHistory:
+    def __init__(self, db_path, capacity=5, session=None):
+        self.db_path = db_path
+        self.capacity = capacity
+        self.session = session or f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self.recent = collections.deque()  # (sıra, sonuç) çiftleri, eskiden yeniye
+        self.spilled = 0
+        self.next_seq = 1
+        self._conn = None
+        self._prune()
+
+    def _db(self):
+        # Bağlantı ilk taşımada açılır; yalnızca arayüz iş parçacığından kullanılır
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS history (
+                               session TEXT, seq INTEGER, created TEXT DEFAULT CURRENT_TIMESTAMP, result TEXT,
+                               PRIMARY KEY (session, seq))''')
+        return self._conn
+
+    def _prune(self):
+        # Önceki oturumların kayıtları hiç okunmaz; yalnızca en yeni kept_sessions oturum kalır.
+        # Oturum kimliği zaman damgasıyla başladığından metin sıralaması kronolojiktir
+        if not os.path.exists(self.db_path):
+            return
+        conn = self._db()
+        conn.execute("DELETE FROM history WHERE session != ? AND session NOT IN "
+                     "(SELECT DISTINCT session FROM history ORDER BY session DESC LIMIT ?)",
+                     (self.session, kept_sessions))
+        conn.commit()
+
+    def __len__(self):
+        return self.spilled + len(self.recent)
+
+    def __iter__(self):
+        # Önce taşınan kayıtlar, sonra tampondakiler (eskiden yeniye)
+        for offset in range(0, self.spilled, history_page):
+            for _, result in self.older(history_page, offset):
+                yield result
+        for _, result in list(self.recent):
+            yield result
+
+    def append(self, result):
+        seq = self.next_seq
+        self.next_seq += 1
+        self.recent.append((seq, result))
+        self._spill(len(self.recent) - self.capacity)
+        return seq
+
+    def _spill(self, count):
+        evicted = [self.recent.popleft() for _ in range(max(count, 0))]
+        if evicted:
+            conn = self._db()
+            conn.executemany("INSERT INTO history (session, seq, result) VALUES (?, ?, ?)",
+                             [(self.session, seq, json.dumps(result, ensure_ascii=False)) for seq, result in evicted])
+            conn.commit()
+            self.spilled += len(evicted)
+
+    def resize(self, capacity):
+        # Küçültmede fazlalık taşınır; büyütmede en yeni taşınan kayıtlar tampona geri alınır
+        self.capacity = capacity
+        self._spill(len(self.recent) - capacity)
+        missing = min(capacity - len(self.recent), self.spilled)
+        if missing > 0:
+            conn = self._db()
+            rows = conn.execute("SELECT seq, result FROM history WHERE session = ? ORDER BY seq DESC LIMIT ?",
+                                (self.session, missing)).fetchall()
+            conn.execute("DELETE FROM history WHERE session = ? AND seq >= ?", (self.session, rows[-1][0]))
+            conn.commit()
+            self.recent.extendleft((seq, json.loads(result)) for seq, result in rows)
+            self.spilled -= len(rows)
+
+    def older(self, limit=history_page, offset=0):
+        # Taşınan kayıtlar eskiden yeniye: [(sıra, sonuç), ...]
+        if not self.spilled:
+            return []
+        rows = self._db().execute("SELECT seq, result FROM history WHERE session = ? ORDER BY seq LIMIT ? OFFSET ?",
+                                  (self.session, limit, offset)).fetchall()
+        return [(seq, json.loads(result)) for seq, result in rows]
+
+    def clear(self):
+        if self.spilled:
+            conn = self._db()
+            conn.execute("DELETE FROM history WHERE session = ?", (self.session,))
+            conn.commit()
+        self.recent.clear()
+        self.spilled = 0
+        self.next_seq = 1
@@ -0,0 +1,227 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from BoltEngine import output_columns
+
+# Parametrik sonuçlar için sütun tabanlı bellek içi depo.
+# Girdi sütunları her satır için yalnızca eksen indeksi (küçük tamsayı) olarak tutulur,
+# eksen değerleri bir kez saklanır; cıvata boyutu gibi kategorik eksenler de böylece
+# kodlanmış olur. Çıktılar sütun başına tek bir NumPy dizisidir.
+# İstenirse sütunlar bir klasörde sütun başına .npy dosyası olarak bellek eşlemeli (memmap)
+# tutulur; header.json eksenleri ve malzeme bilgisini saklar, böylece RAM'den büyük
+# taramalar diskte kalıp anında yeniden açılabilir.
+
+input_columns = ["bolt_size", "shank_length", "thread_length", "preload_percent", "tensile_force"]
+
+column_labels = {
+    "bolt_size": 'Cıvata Boyutu',
+    "shank_length": 'Gövde Uzunluğu',
+    "thread_length": 'Dişli Kısım Uzunluğu',
+    "preload_percent": 'Ön Yükleme Yüzdesi',
+    "tensile_force": 'Çekme Kuvveti',
+    "stiffness": "Toplam Cıvata Sertliği (N/mm)",
+    "clamped_stiffness": "Toplam Kavrama Sertliği (N/mm)",
+    "bolt_force": "Toplam Cıvata Kuvveti (N)",
+    "bolt_deflection": "Cıvata Çarpılma (mm)",
+    "clamped_deflection": "Kavrama Çarpılma (mm)",
+    "shear_stress": "Kesme Gerilimi (MPa)",
+    "safety_factor": "Güvenlik Faktörü ({basis})",
+    "alternating_stress": "Alternatif Gerilme (MPa)",
+    "mean_stress": "Ortalama Gerilme (MPa)",
+    "fatigue_safety_factor": "Yorulma Güvenlik Faktörü ({criterion})",
+    "min_preload": "Min Ön Yük (N)",
+    "max_preload": "Maks Ön Yük (N)",
+}
+column_formats = {"bolt_deflection": "{:.4f}", "clamped_deflection": "{:.4f}"}
+header_name = "header.json"
+block_rows = 1 << 22  # Sıralama, toplama ve dışa aktarmada blok başına satır sayısı
+
+class ParametricResults:
+    def __init__(self, axes, safety_basis="Yield", capacity=1024, dtype=np.float64, meta=None, directory=None):
+        self.axes = {name: np.asarray(axes[name]) for name in input_columns}
+        self.safety_basis = safety_basis
+        self.meta = dict(meta or {})
+        self.directory = directory
+        self.size = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.codes = {name: self._allocate(name, capacity, np.min_scalar_type(max(len(values) - 1, 0)))
+                      for name, values in self.axes.items()}
+        self.columns = {name: self._allocate(name, capacity, dtype) for name in output_columns}
+
+    def _allocate(self, name, capacity, dtype):
+        if not self.directory:
+            return np.empty(capacity, dtype=dtype)
+        return np.lib.format.open_memmap(os.path.join(self.directory, f"{name}.npy"), mode="w+", dtype=dtype, shape=(capacity,))
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        return sum(a[:self.size].nbytes for a in (*self.codes.values(), *self.columns.values()))
+
+    def label(self, name):
+        return column_labels[name].format(basis=self.safety_basis, criterion=self.meta.get('fatigue_criterion', 'Goodman'))
+
+    def _reserve(self, extra):
+        needed = self.size + extra
+        capacity = len(self.columns[output_columns[0]])
+        if needed <= capacity:
+            return
+        if self.directory:
+            raise ValueError("Disk üzerindeki sonuç dosyalarının kapasitesi aşıldı.")
+        capacity = max(needed, capacity * 2)
+        for table in (self.codes, self.columns):
+            for name, array in table.items():
+                grown = np.empty(capacity, dtype=array.dtype)
+                grown[:self.size] = array[:self.size]
+                table[name] = grown
+
+    def append(self, codes, outputs):
+        n = len(codes[input_columns[0]])
+        self._reserve(n)
+        end = self.size + n
+        for name in input_columns:
+            self.codes[name][self.size:end] = codes[name]
+        for name in output_columns:
+            self.columns[name][self.size:end] = outputs[name]
+        self.size = end
+
+    def axis_codes(self, name):
+        return self.codes[name][:self.size]
+
+    def column(self, name, rows=None):
+        # Girdi sütunları eksen değerlerine çözülür, çıktılar doğrudan döner (kopyasız görünüm)
+        if name in self.axes:
+            codes = self.axis_codes(name)
+            return self.axes[name][codes if rows is None else codes[rows]]
+        data = self.columns[name][:self.size]
+        return data if rows is None else data[rows]
+
+    def value(self, name, index):
+        if name in self.axes:
+            return self.axes[name][self.codes[name][index]].item()
+        return self.columns[name][index].item()
+
+    def _blocks(self):
+        for start in range(0, self.size, block_rows):
+            yield slice(start, min(start + block_rows, self.size))
+
+    def argbest(self, name="safety_factor"):
+        best, best_value = 0, -np.inf
+        for block in self._blocks():
+            values = self.column(name, block)
+            i = int(np.argmax(values))
+            if values[i] > best_value:
+                best, best_value = block.start + i, values[i]
+        return best
+
+    def top_k(self, k, name="safety_factor"):
+        # Bloklar arasında yalnızca k aday tutulur; disk üzerindeki depolar RAM'e yüklenmez
+        index, values = np.empty(0, dtype=np.int64), np.empty(0)
+        if k <= 0:
+            return index
+        for block in self._blocks():
+            index = np.concatenate([index, np.arange(block.start, block.stop)])
+            values = np.concatenate([values, self.column(name, block)])
+            if len(values) > k:
+                part = np.argpartition(values, len(values) - k)[-k:]
+                index, values = index[part], values[part]
+        return index[np.argsort(values, kind="stable")[::-1]]
+
+    def aggregate(self, keys, value, how="mean"):
+        # Seçilen eksenler üzerinde blok blok ortalama/maksimum/minimum; boş hücreler NaN
+        shape = tuple(len(self.axes[key]) for key in keys)
+        cells = int(np.prod(shape))
+        counts = np.zeros(cells, dtype=np.int64)
+        acc = np.zeros(cells) if how == "mean" else np.full(cells, -np.inf if how == "max" else np.inf)
+        for block in self._blocks():
+            cell = np.ravel_multi_index(tuple(self.axis_codes(key)[block].astype(np.intp) for key in keys), shape)
+            z = self.column(value, block).astype(float)
+            counts += np.bincount(cell, minlength=cells)
+            if how == "mean":
+                acc += np.bincount(cell, weights=z, minlength=cells)
+            elif how == "max":
+                np.maximum.at(acc, cell, z)
+            else:
+                np.minimum.at(acc, cell, z)
+        grid = np.full(cells, np.nan)
+        present = counts > 0
+        grid[present] = acc[present] / counts[present] if how == "mean" else acc[present]
+        return grid.reshape(shape), counts.reshape(shape)
+
+    def format_value(self, name, value):
+        return value if isinstance(value, str) else column_formats.get(name, "{:.2f}" if name in output_columns else "{:.10g}").format(value)
+
+    def display_row(self, index):
+        # Arayüz tablosu ve etiketler için biçimlendirilmiş tek satır
+        return {self.label(name): self.format_value(name, self.value(name, index)) for name in input_columns + output_columns}
+
+    def to_dataframe(self, rows=None):
+        return pd.DataFrame({self.label(name): self.column(name, rows) for name in input_columns + output_columns})
+
+    def to_csv(self, path):
+        for i, block in enumerate(self._blocks()):
+            self.to_dataframe(block).to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+
+    def header(self):
+        return {
+            "size": self.size,
+            "safety_basis": self.safety_basis,
+            "axes": {name: values.tolist() for name, values in self.axes.items()},
+            "dtypes": {name: str(array.dtype) for name, array in (*self.codes.items(), *self.columns.items())},
+            "meta": self.meta,
+        }
+
+    def flush(self):
+        # Bellek eşlemeli sütunları diske yazar ve başlığı günceller
+        if not self.directory:
+            return
+        for array in (*self.codes.values(), *self.columns.values()):
+            array.flush()
+        with open(os.path.join(self.directory, header_name), "w", encoding="utf-8") as f:
+            json.dump(self.header(), f, ensure_ascii=False, indent=2)
+
+    def save(self, directory):
+        if directory == self.directory:
+            self.flush()
+            return
+        os.makedirs(directory, exist_ok=True)
+        for name, array in (*self.codes.items(), *self.columns.items()):
+            np.save(os.path.join(directory, f"{name}.npy"), array[:self.size])
+        with open(os.path.join(directory, header_name), "w", encoding="utf-8") as f:
+            json.dump(self.header(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def open(cls, directory, mmap_mode="r"):
+        # Sütunlar yalnızca eşlenir; veriye erişildikçe diskten okunur
+        with open(os.path.join(directory, header_name), encoding="utf-8") as f:
+            header = json.load(f)
+        store = cls(header["axes"], safety_basis=header["safety_basis"], capacity=0, meta=header["meta"])
+        store.directory = directory
+        for table, names in ((store.codes, input_columns), (store.columns, output_columns)):
+            for name in names:
+                path = os.path.join(directory, f"{name}.npy")
+                # Sonradan eklenen çıktı sütunları eski çalıştırmalarda yoktur; NaN olarak gösterilir
+                table[name] = np.load(path, mmap_mode=mmap_mode) if os.path.exists(path) else np.full(header["size"], np.nan)
+        store.size = header["size"]
+        return store
+
+    @classmethod
+    def from_columns(cls, inputs, outputs, safety_basis="Yield", categorical_order=None, meta=None):
+        # Veritabanından okunan düz sütunlardan eksenleri yeniden kurar
+        axes, codes = {}, {}
+        for name in input_columns:
+            values, inverse = np.unique(np.asarray(inputs[name]), return_inverse=True)
+            if name == "bolt_size" and categorical_order:
+                ranks = np.array([categorical_order.index(v) if v in categorical_order else len(categorical_order) for v in values])
+                sort = np.argsort(ranks, kind="stable")
+                values, inverse = values[sort], np.argsort(sort)[inverse]
+            axes[name], codes[name] = values, inverse
+        store = cls(axes, safety_basis=safety_basis, capacity=len(codes["bolt_size"]), meta=meta)
+        store.append(codes, outputs)
+        return store
@@ -0,0 +1,179 @@
+import itertools
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from Instrumentation import StageTimings, profiling, save_profile
+from ParametricSweep import run_sweep
+
+# Birden çok parametrik tarama için iş kuyruğu ve zamanlayıcı (Tkinter'a bağımlı değildir).
+# Gönderilen işler sırayla bekler; aynı anda en fazla `concurrency` iş kendi adlandırılmış
+# iş parçacığında çalışır. Her işin ilerlemesi, iptal bayrağı, aşama süreleri ve sonuç deposu
+# kendine aittir. Arayüz ve BoltService aynı yöneticiyi kullanır.
+# notify(olay, iş) verilirse olaylar ('started', 'progress', 'profile', 'done', 'canceled',
+# 'error') iş parçacığından çağrılır; arayüz bunları kendi kuyruğuna aktarır. 'done' olayı
+# sonuç deposunu da taşır, böylece keep_results=False iken izlenen iş yeniden okunmadan gösterilir.
+
+default_concurrency = 2
+active_states = ("queued", "running")
+
+class SweepJob:
+    def __init__(self, job_id, sweep, label="", to_disk=False, profile=False, excluded=0):
+        self.id = job_id
+        self.sweep = sweep  # run_sweep anahtar argümanları (conn hariç)
+        self.label = label
+        self.to_disk = to_disk
+        self.profile = profile
+        self.state = "queued"
+        self.done = 0
+        self.total = 0
+        self.skipped = excluded  # validate_axes'in dışladığı kombinasyonlar
+        self.run_id = None
+        self.error = None
+        self.store = None
+        self.profile_path = None
+        self.cancel = threading.Event()
+        self.timings = StageTimings()
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+    @property
+    def active(self):
+        return self.state in active_states
+
+    def status(self):
+        return {"id": self.id, "label": self.label, "state": self.state, "done": self.done, "total": self.total,
+                "skipped": self.skipped, "run_id": self.run_id, "error": self.error,
+                "submitted": self.submitted, "started": self.started, "finished": self.finished}
+
+class JobManager:
+    def __init__(self, db_path, results_root, concurrency=default_concurrency, notify=None, chunk=None, keep_results=True):
+        # keep_results=False: biten işin deposu bellekte tutulmaz, sonuçlar run_id ile veritabanından okunur
+        self.db_path = db_path
+        self.results_root = results_root
+        self.concurrency = concurrency
+        self.notify = notify
+        self.chunk = chunk
+        self.keep_results = keep_results
+        self.jobs = {}  # Gönderim sırasıyla
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._running = 0
+
+    def submit(self, sweep, label="", to_disk=False, profile=False, excluded=0):
+        # sweep: run_sweep'in catalog, axes, parts, material, props, F_ext_shear, ... anahtar argümanları.
+        # excluded: validate_axes'in eksenden çıkardığı değerler yüzünden hiç hesaplanmayan kombinasyonlar
+        with self._lock:
+            job = SweepJob(next(self._ids), sweep, label, to_disk, profile, excluded)
+            job.total = int(np.prod([len(values) for values in sweep['axes'].values()]))
+            self.jobs[job.id] = job
+        self._schedule()
+        return job
+
+    def set_concurrency(self, concurrency):
+        self.concurrency = max(1, int(concurrency))
+        self._schedule()
+
+    def _schedule(self):
+        with self._lock:
+            while self._running < self.concurrency:
+                job = next((job for job in self.jobs.values() if job.state == "queued"), None)
+                if job is None:
+                    break
+                job.state = "running"
+                job.started = time.time()
+                self._running += 1
+                # Adlandırılmış iş parçacığı "py-spy dump" gibi dış örnekleyicilerde kolayca bulunur
+                threading.Thread(target=self._run, args=(job,), name=f"parametric-worker-{job.id}", daemon=True).start()
+
+    def _emit(self, event, job, *args):
+        if self.notify:
+            self.notify(event, job, *args)
+
+    def _run(self, job):
+        self._emit("started", job)
+        store = profiler = None
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            options = dict(progress=lambda done, total: self._progress(job, done),
+                           cancelled=job.cancel.is_set, timings=job.timings)
+            if self.chunk:
+                options['chunk'] = self.chunk
+            root = self.results_root if job.to_disk else None
+            if job.profile:
+                # Profillenen işler profile_lock ile sırayla çalışır; diğerleri eşzamanlı devam eder
+                with profiling() as profiler:
+                    store, canceled = run_sweep(conn, results_root=root, **job.sweep, **options)
+            else:
+                store, canceled = run_sweep(conn, results_root=root, **job.sweep, **options)
+            job.store = store if self.keep_results else None
+            job.run_id = store.meta['run_id']
+            job.state = "canceled" if canceled else "done"
+        except Exception as e:
+            job.state, job.error = "error", str(e)
+        finally:
+            conn.close()
+            if profiler is not None:
+                # İptal edilen veya hata veren yavaş çalıştırmaların profili de yazılır
+                self._save_profile(job, profiler)
+            job.finished = time.time()
+            job.timings.finish()
+            with self._lock:
+                self._running -= 1
+        if job.state == "done":
+            self._emit("done", job, store)
+        else:
+            self._emit(job.state, job)
+        self._schedule()
+
+    def _save_profile(self, job, profiler):
+        # Profil dosyası çalıştırmanın yanına, sonuç klasörüne yazılır: parametric_runs/run_<id>.prof
+        # (çalıştırma kaydı oluşmadan hata verdiyse job_<no>.prof)
+        name = f"run_{job.run_id}" if job.run_id is not None else f"job_{job.id}"
+        job.profile_path = os.path.join(self.results_root, f"{name}.prof")
+        try:
+            self._emit("profile", job, save_profile(profiler, job.profile_path))
+        except OSError as e:
+            job.profile_path = None
+            if job.state != "error":
+                job.state, job.error = "error", f"Profil kaydedilemedi: {e}"
+
+    def _progress(self, job, done):
+        job.done = done
+        self._emit("progress", job, time.perf_counter())
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        # Kuyruktaki iş hemen iptal edilir; çalışan iş bir sonraki parçada durur
+        job = self.jobs[job_id]
+        job.cancel.set()
+        with self._lock:
+            queued = job.state == "queued"
+            if queued:
+                job.state, job.finished = "canceled", time.time()
+        if queued:
+            self._emit("canceled", job)
+
+    def cancel_all(self):
+        for job in list(self.jobs.values()):
+            if job.active:
+                self.cancel(job.id)
+
+    def remove(self, job_id):
+        # Biten işi listeden çıkarır ve sonuç deposunu bırakır (veritabanındaki satırlar kalır)
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.active:
+                return False
+            del self.jobs[job_id]
+            job.store = None
+            return True
+
+    def active_count(self):
+        return sum(job.active for job in self.jobs.values())